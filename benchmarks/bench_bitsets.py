@@ -0,0 +1,154 @@
+"""Memory and throughput of packed outcome bits against a pandas row layout.
+
+Generates ``--models`` models × ``--runs`` runs of ``--tasks`` tasks with
+``--samples`` pass/fail samples each (ARCHIT-like by default). Each run is
+held two ways:
+
+- as ``OutcomeBits`` (one bit per task × sample);
+- as a pandas frame with one row per task × sample (task id, sample index,
+  passed), the layout a row-per-task store would load.
+
+For each layout the script times three operations:
+
+- pass@k for every k;
+- the solved-task overlap of the first two models (a Venn diagram);
+- the diffs between adjacent runs of one model.
+
+The results are checked for equality, then resident size and median
+timings are printed. Usage::
+
+    python benchmarks/bench_bitsets.py [--tasks 300] [--samples 8] [--models 8] [--runs 50] [--repeat 5]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from evaldash.bitset import OutcomeBits, overlap, popcount  # noqa: E402
+from evaldash.passk import pass_at_k  # noqa: E402
+
+
+def make_runs(models, runs, tasks, samples, seed=0):
+    """``{(model, run): bool (tasks, samples)}`` with a per-task difficulty, so runs correlate."""
+    rng = np.random.default_rng(seed)
+    difficulty = rng.beta(0.5, 0.8, tasks)
+    return {
+        (model, run): rng.random((tasks, samples)) < difficulty[:, None]
+        for model in range(models) for run in range(runs)
+    }
+
+
+def as_bits(ids, passed):
+    return OutcomeBits.from_flags(ids, {"Passed": passed})
+
+
+def as_rows(ids, passed):
+    tasks, samples = passed.shape
+    return pd.DataFrame({
+        "task": np.repeat(ids, samples),
+        "sample": np.tile(np.arange(samples, dtype=np.int64), tasks),
+        "passed": passed.ravel(),
+    })
+
+
+# Operations, each returning comparable results
+
+def bits_pass_at_k(runs, ks):
+    return [[float(np.mean(bits.pass_at_k(k))) for k in ks] for bits in runs]
+
+
+def rows_pass_at_k(runs, ks):
+    out = []
+    for frame in runs:
+        per_task = frame.groupby("task", sort=False)["passed"].agg(["size", "sum"])
+        out.append([float(np.mean(pass_at_k(per_task["size"], per_task["sum"], k))) for k in ks])
+    return out
+
+
+def bits_overlap(a, b):
+    return overlap(a.any(), b.any(), len(a))
+
+
+def rows_overlap(a, b):
+    solved = pd.concat({"A": a.groupby("task")["passed"].any(), "B": b.groupby("task")["passed"].any()}, axis=1)
+    both = int((solved["A"] & solved["B"]).sum())
+    only_a, only_b = int(solved["A"].sum()) - both, int(solved["B"].sum()) - both
+    return {"Both": both, "Only A": only_a, "Only B": only_b, "Neither": len(solved) - both - only_a - only_b}
+
+
+def bits_diffs(runs):
+    solved = [bits.any() for bits in runs]
+    return [(int(popcount(~x & y)), int(popcount(x & ~y))) for x, y in zip(solved, solved[1:])]
+
+
+def rows_diffs(runs):
+    solved = [frame.groupby("task")["passed"].any() for frame in runs]
+    out = []
+    for x, y in zip(solved, solved[1:]):
+        pair = pd.concat({"x": x, "y": y}, axis=1, join="inner")
+        out.append((int((~pair["x"] & pair["y"]).sum()), int((pair["x"] & ~pair["y"]).sum())))
+    return out
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t)
+    return result, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tasks", type=int, default=300)
+    parser.add_argument("--samples", type=int, default=8)
+    parser.add_argument("--models", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=50, help="runs per model")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    ids = np.array([f"task-{i:06d}" for i in range(args.tasks)])
+    data = make_runs(args.models, args.runs, args.tasks, args.samples)
+    bits = {key: as_bits(ids, passed) for key, passed in data.items()}
+    rows = {key: as_rows(ids, passed) for key, passed in data.items()}
+    ks = list(range(1, args.samples + 1))
+    latest = [(model, args.runs - 1) for model in range(args.models)]
+    history = [(0, run) for run in range(args.runs)]
+
+    print(f"{args.models} models x {args.runs} runs x {args.tasks} tasks x {args.samples} samples")
+    bits_mb = sum(b.nbytes for b in bits.values()) / 2**20
+    packed_mb = sum(sum(m.nbytes for m in b.bits.values()) for b in bits.values()) / 2**20
+    rows_mb = sum(frame.memory_usage(deep=True).sum() for frame in rows.values()) / 2**20
+    print(f"{'memory':<28} {'bits':>10} {'rows':>10}")
+    print(f"{'  all runs (MiB)':<28} {bits_mb:>10.2f} {rows_mb:>10.2f}   (packed bits alone {packed_mb:.3f})")
+
+    operations = [
+        (f"pass@1..{args.samples}, {len(latest)} models",
+         lambda: bits_pass_at_k([bits[key] for key in latest], ks),
+         lambda: rows_pass_at_k([rows[key] for key in latest], ks)),
+        ("overlap, 2 models",
+         lambda: bits_overlap(bits[latest[0]], bits[latest[min(1, len(latest) - 1)]]),
+         lambda: rows_overlap(rows[latest[0]], rows[latest[min(1, len(latest) - 1)]])),
+        (f"diffs, {len(history) - 1} adjacent runs",
+         lambda: bits_diffs([bits[key] for key in history]),
+         lambda: rows_diffs([rows[key] for key in history])),
+    ]
+    print(f"{'operation (ms)':<28} {'bits':>10} {'rows':>10} {'speedup':>8}")
+    for name, with_bits, with_rows in operations:
+        expected, t_bits = timed(with_bits, args.repeat)
+        result, t_rows = timed(with_rows, args.repeat)
+        same = expected == result if isinstance(expected, dict) else np.allclose(expected, result)
+        assert same, f"{name}: layouts disagree"
+        print(f"{'  ' + name:<28} {t_bits * 1000:>10.2f} {t_rows * 1000:>10.2f} {t_rows / t_bits:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
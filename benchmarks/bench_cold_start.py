@@ -0,0 +1,82 @@
+"""Time to first paint of a data page on a cold start, with and without the snapshot.
+
+Every sample is a fresh interpreter (nothing imported, nothing cached) that
+renders the landing page and then ``--page`` with Streamlit's ``AppTest``,
+the way the first viewer after a redeploy or wake-up sees the app. The
+"parquet" scenario reads the latest runs from the Parquet partitions, the
+"snapshot" scenario memory-maps the file written by
+``python -m evaldash.snapshot``. ``--problems N`` adds per-problem ARCHIT
+samples (see ``bench_sessions.py``) for a realistically large store. Usage::
+
+    python benchmarks/bench_cold_start.py [--repeat 5] [--problems 100000] [--page "RustEvo Benchmark"]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import sys, time
+t = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.run()
+at.sidebar.radio[0].set_value({page!r}).run()
+assert not at.exception, at.exception
+print(time.perf_counter() - t)
+"""
+
+
+def measure(page, env, repeat):
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(app=str(ROOT / "dashboard.py"), page=page)],
+            check=True, capture_output=True, text=True, env=env, cwd=ROOT,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--page", default="Model Comparison Graphs")
+    parser.add_argument("--problems", type=int, default=0, help="synthetic ARCHIT problems per model")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    # A scratch store so the benchmark never touches real results
+    os.environ.setdefault("DASHBOARD_RESULTS_DIR", tempfile.mkdtemp(prefix="evaldash-bench-"))
+    os.environ.setdefault("DASHBOARD_BOOTSTRAP_WORKERS", "1")
+    from bench_sessions import add_samples
+
+    from evaldash.seed import ensure_seeded
+    from evaldash.snapshot import write_snapshot
+    from evaldash.store import ResultsStore
+
+    store = ResultsStore()
+    ensure_seeded(store)
+    if args.problems:
+        add_samples(args.problems)
+    snapshot = write_snapshot(store, Path(store.root) / "bench-snapshot.arrow")
+
+    scenarios = {
+        "parquet": dict(os.environ, DASHBOARD_SNAPSHOT=str(snapshot.with_suffix(".missing"))),
+        "snapshot": dict(os.environ, DASHBOARD_SNAPSHOT=str(snapshot)),
+    }
+    print(f"first paint of {args.page!r}, median of {args.repeat} cold starts")
+    baseline = None
+    for name, env in scenarios.items():
+        seconds = measure(args.page, env, args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:10s} {seconds * 1000:8.1f} ms  ({seconds / baseline:.0%} of parquet)")
+
+
+if __name__ == "__main__":
+    main()
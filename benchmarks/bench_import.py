@@ -0,0 +1,58 @@
+"""Measure cold import cost of the dashboard before and after lazy page loading.
+
+Each scenario runs in a fresh interpreter so nothing is already in
+``sys.modules``. Usage: ``python benchmarks/bench_import.py [--repeat N]``.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    # What the single-module dashboard.py imported on every start
+    "eager (all pages)": [
+        "streamlit", "pandas", "plotly.express", "plotly.graph_objects",
+        "plotly.subplots", "evaldash.loaders", "evaldash.store",
+    ],
+    "lazy: Overview": ["streamlit", "evaldash.views", "evaldash.views.overview"],
+    "lazy: Model Comparison Graphs": ["streamlit", "evaldash.views", "evaldash.views.comparison"],
+}
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+t = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print(time.perf_counter() - t)
+"""
+
+
+def measure(modules, repeat):
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(root=str(ROOT), modules=modules)],
+            check=True, capture_output=True, text=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = None
+    for name, modules in SCENARIOS.items():
+        seconds = measure(modules, args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:32s} {seconds * 1000:8.1f} ms  ({seconds / baseline:.0%} of eager)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Plotly payload bytes and client parse time per page, with numbers as text versus typed arrays.
+
+Renders every page with ``AppTest``, with every tab open as in the static
+build. It collects the figure specs Streamlit sends to the browser. Each
+spec is measured in two forms:
+
+- "text": every typed array written back out as a JSON list of numbers,
+  the way figures were sent before;
+- "typed": as sent, with numeric arrays as base64 typed arrays.
+
+``--points N`` adds two synthetic rows: a per-task heatmap of N cells and a
+per-checkpoint trend of N points per model. Parse time is the time the
+browser needs to get arrays from a spec. It is measured in Node as
+``JSON.parse`` plus decoding of the typed arrays, the way plotly.js reads
+them, and is skipped when ``node`` is not installed. Usage::
+
+    python benchmarks/bench_payload.py [--repeat 20] [--points 50000]
+"""
+import argparse
+import base64
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PARSE = r"""
+const fs = require("fs");
+const TYPES = {i1: Int8Array, u1: Uint8Array, i2: Int16Array, u2: Uint16Array,
+               i4: Int32Array, u4: Uint32Array, f4: Float32Array, f8: Float64Array};
+function decode(obj) {
+  if (Array.isArray(obj)) { obj.forEach(decode); return; }
+  if (obj === null || typeof obj !== "object") return;
+  for (const key in obj) {
+    const value = obj[key];
+    if (value !== null && typeof value === "object" && typeof value.bdata === "string") {
+      const bytes = Buffer.from(value.bdata, "base64");
+      obj[key] = new TYPES[value.dtype](bytes.buffer.slice(bytes.byteOffset, bytes.byteOffset + bytes.length));
+    } else {
+      decode(value);
+    }
+  }
+}
+const [file, repeat] = [process.argv.at(-2), Number(process.argv.at(-1))];
+const result = {};
+for (const [label, specs] of Object.entries(JSON.parse(fs.readFileSync(file, "utf8")))) {
+  const samples = [];
+  for (let i = 0; i < repeat; i++) {
+    const t = process.hrtime.bigint();
+    for (const spec of specs) decode(JSON.parse(spec));
+    samples.push(Number(process.hrtime.bigint() - t) / 1e6);
+  }
+  samples.sort((a, b) => a - b);
+  result[label] = samples[Math.floor(samples.length / 2)];
+}
+console.log(JSON.stringify(result));
+"""
+
+
+def as_text(spec):
+    """``spec`` with every typed array replaced by a JSON list (NaN as null, as Plotly writes it)."""
+    def plain(obj):
+        if isinstance(obj, dict):
+            if "bdata" in obj and "dtype" in obj:
+                values = np.frombuffer(base64.b64decode(obj["bdata"]), dtype=obj["dtype"])
+                if "shape" in obj:
+                    values = values.reshape([int(n) for n in obj["shape"].split(",")])
+                values = values.astype(object)
+                if values.size:
+                    values[pd.isna(values)] = None
+                return values.tolist()
+            return {key: plain(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [plain(value) for value in obj]
+        return obj
+
+    return json.dumps(plain(json.loads(spec)), separators=(",", ":"))
+
+
+def page_specs(pages):
+    """``{page: [spec, ...]}`` of the Plotly charts each page draws."""
+    from streamlit.testing.v1 import AppTest
+
+    specs = {}
+    for page in pages:
+        at = AppTest.from_file(str(ROOT / "dashboard.py"), default_timeout=300)
+        at.run()
+        at.sidebar.radio[0].set_value(page).run()
+        assert not at.exception, at.exception
+        specs[page] = [chart.proto.spec for chart in at.get("plotly_chart")]
+    return specs
+
+
+def synthetic_specs(points):
+    """Specs of a per-task heatmap with ``points`` cells and a per-checkpoint trend of ``points`` per model."""
+    from evaldash.figures import heatmap_figure, line_figure
+
+    rng = np.random.default_rng(0)
+    models = ["kat-dev-hs-32b", "kat-dev-base-32b", "kat-dev-hs-72b", "kat-dev-base-72b"]
+    scores = pd.DataFrame(rng.random((len(models), points // len(models))) * 100)
+    scores.columns = [f"task {i}" for i in scores.columns]
+    scores.insert(0, "Model", models)
+    trend = pd.DataFrame(
+        {model: 50 + rng.normal(size=points).cumsum() / 100 for model in models},
+    ).rename_axis("Checkpoint").reset_index()
+    return {
+        f"synthetic heatmap ({points} cells)": [
+            pio.to_json(heatmap_figure(scores, "Model", title="Per-task scores"), validate=False)
+        ],
+        f"synthetic trend ({points} points/model)": [
+            pio.to_json(line_figure(trend, "Checkpoint", [(m, m) for m in models], title="Trend"), validate=False)
+        ],
+    }
+
+
+def parse_ms(specs, repeat):
+    """Median Node parse time per label, or None without ``node``."""
+    node = shutil.which("node")
+    if node is None:
+        return None
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(specs, f)
+    try:
+        out = subprocess.run(
+            [node, "-e", PARSE, f.name, str(repeat)], check=True, capture_output=True, text=True
+        )
+    finally:
+        os.unlink(f.name)
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=20, help="parse runs per page (median is reported)")
+    parser.add_argument("--points", type=int, default=50000, help="size of the synthetic charts (0 for none)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    # A scratch store so the benchmark never touches real results
+    os.environ.setdefault("DASHBOARD_RESULTS_DIR", tempfile.mkdtemp(prefix="evaldash-bench-"))
+    from evaldash.tabs import STATIC_ENV
+    from evaldash.views import PAGES
+
+    os.environ[STATIC_ENV] = "1"
+    specs = page_specs(PAGES)
+    if args.points:
+        specs.update(synthetic_specs(args.points))
+    specs = {label: charts for label, charts in specs.items() if charts}
+    forms = {
+        "text": {label: [as_text(spec) for spec in charts] for label, charts in specs.items()},
+        "typed": specs,
+    }
+    parsed = {form: parse_ms(labelled, args.repeat) for form, labelled in forms.items()}
+
+    print(f"{'page':42s} {'charts':>6s} {'text KiB':>9s} {'typed KiB':>9s} {'size':>5s}"
+          f" {'text ms':>8s} {'typed ms':>8s}")
+    for label, charts in specs.items():
+        text = sum(map(len, forms["text"][label])) / 1024
+        typed = sum(map(len, charts)) / 1024
+        line = f"{label:42s} {len(charts):6d} {text:9.1f} {typed:9.1f} {typed / text:5.0%}"
+        if parsed["text"] is not None:
+            line += f" {parsed['text'][label]:8.2f} {parsed['typed'][label]:8.2f}"
+        print(line)
+    if parsed["text"] is None:
+        print("(node not found: parse times skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Load test: resident memory as simulated viewer sessions pile up.
+
+Opens ``--sessions`` independent app sessions in one process with
+Streamlit's ``AppTest`` (each has its own session state and rendered
+elements, like a browser tab), walks every session through ``--pages`` and
+keeps it alive. Prints the process RSS after each checkpoint; with the
+shared data layer the growth per session is the rendered output only, not
+another copy of the results. A second phase holds the frames of
+``--sessions`` script runs in flight at once (as concurrent viewers do) and
+reports RSS again. ``--problems N`` adds an ARCHIT run with N
+problems of 8 samples for every model, stored as outcome bits like
+ingested runs, to make the dataset realistically large. Usage::
+
+    python benchmarks/bench_sessions.py [--sessions 50] [--problems 100000] [--pages Overview "HS EVALS"]
+"""
+import argparse
+import gc
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PAGES = ["Overview", "Model Comparison Graphs", "RustEvo Benchmark", "HS EVALS"]
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Peak rather than current RSS, but still shows the trend (KiB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def add_samples(problems):
+    """Give every ARCHIT model a run with ``problems`` synthetic problems of 8 samples, stored as outcome bits."""
+    import numpy as np
+
+    from evaldash.bitset import OutcomeBits
+    from evaldash.seed import ensure_seeded
+    from evaldash.store import SCHEMA, ResultsStore
+
+    store = ResultsStore()
+    ensure_seeded(store)
+    rng = np.random.default_rng(0)
+    ids = np.arange(problems).astype(str)
+    for model in store.models("archit"):
+        samples = OutcomeBits.from_counts(ids, np.full(problems, 8), rng.integers(0, 9, problems))
+        leaderboard = store.read("archit", models=model, columns=SCHEMA.names)
+        store.write_run(leaderboard, "archit", model, "bench", bits={"samples": samples})
+
+
+def open_session(pages):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "dashboard.py"), default_timeout=120)
+    at.run()
+    for page in pages:
+        at.sidebar.radio[0].set_value(page).run()
+    return at
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES)
+    parser.add_argument("--problems", type=int, default=0, help="synthetic ARCHIT problems per model")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    # A scratch store so the load test never touches real results
+    os.environ.setdefault("DASHBOARD_RESULTS_DIR", tempfile.mkdtemp(prefix="evaldash-bench-"))
+    if args.problems:
+        add_samples(args.problems)
+
+    checkpoints = sorted({1, 5, 10, 25, args.sessions} & set(range(1, args.sessions + 1)))
+    sessions = []
+    gc.collect()
+    start = rss_mb()
+    print(f"{'sessions':>8} {'RSS MB':>8} {'+MB/session':>12} {'s/session':>10}")
+    print(f"{0:>8} {start:>8.1f}")
+    first = None
+    t = time.perf_counter()
+    for n in range(1, args.sessions + 1):
+        sessions.append(open_session(args.pages))
+        if n in checkpoints:
+            gc.collect()
+            rss = rss_mb()
+            if first is None:
+                first = rss
+                per_session = ""
+            else:
+                per_session = f"{(rss - first) / (n - 1):>12.2f}"
+            print(f"{n:>8} {rss:>8.1f} {per_session:>12} {(time.perf_counter() - t) / n:>10.2f}")
+
+    # Concurrent script runs each hold their page's frames until they finish
+    from evaldash.loaders import load_cells, load_pass_at_k
+    gc.collect()
+    before = rss_mb()
+    in_flight = [
+        [
+            load_pass_at_k("archit", [1, 3, 8]),
+            load_cells("rustevo", columns=["model", "table", "row", "column", "value", "unit", "denominator", "display"]),
+        ]
+        for _ in range(args.sessions)
+    ]
+    gc.collect()
+    print(f"{len(in_flight)} runs in flight: {rss_mb() - before:+.1f} MB")
+
+    from evaldash.loaders import get_shared_results
+    print(f"shared results: {get_shared_results().nbytes() / 2**20:.1f} MiB held once for all sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Time to load every benchmark from result servers, one after another versus concurrently.
+
+Seeds a temporary store and serves each benchmark's latest runs from a
+local stand-in result server (``http.server`` on localhost) as an Arrow IPC
+stream. Each answer is delayed by ``--latency`` seconds, scaled by a random
+factor of 0.5-1.5 per source. One source (``--slow``) answers only after
+three times its ``--timeout``. The script loads all sources in two ways:
+
+- sequentially, one ``HttpSource.fetch`` after another;
+- concurrently, with ``SharedResults.from_sources`` as the dashboard does.
+
+For each it prints the elapsed time and which sources arrived. It also
+checks that every loaded benchmark matches the local store. Usage::
+
+    python benchmarks/bench_sources.py [--latency 0.3] [--timeout 1] [--slow swe]
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from evaldash.seed import ensure_seeded  # noqa: E402
+from evaldash.shared import SharedResults, group_cells  # noqa: E402
+from evaldash.sources import ARROW_STREAM, HttpSource  # noqa: E402
+from evaldash.store import ResultsStore  # noqa: E402
+
+
+def arrow_stream(table):
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def serve(payloads, delays):
+    """Start a stand-in result server on a free port answering ``GET /<benchmark>``; returns it."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            benchmark = self.path.strip("/")
+            if benchmark not in payloads:
+                self.send_error(404)
+                return
+            time.sleep(delays[benchmark])
+            body = payloads[benchmark]
+            self.send_response(200)
+            self.send_header("Content-Type", ARROW_STREAM)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def sequential(sources):
+    tables, errors = {}, {}
+    for name, source in sources.items():
+        try:
+            tables[name] = source.fetch()
+        except Exception as exc:
+            errors[name] = f"{type(exc).__name__}: {exc}"
+    return tables, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds each source takes to answer")
+    parser.add_argument("--timeout", type=float, default=1.0, help="per-source timeout in seconds")
+    parser.add_argument("--slow", default="swe", help="benchmark whose source exceeds its timeout ('' for none)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ResultsStore(root)
+        ensure_seeded(store)
+        local = {benchmark: store.read_table(benchmark) for benchmark in store.benchmarks()}
+
+    rng = np.random.default_rng(0)
+    delays = {benchmark: args.latency * rng.uniform(0.5, 1.5) for benchmark in local}
+    if args.slow:
+        delays[args.slow] = 3 * args.timeout
+    server = serve({benchmark: arrow_stream(table) for benchmark, table in local.items()}, delays)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    sources = {benchmark: HttpSource(f"{url}/{benchmark}", args.timeout) for benchmark in local}
+
+    answered = [delay for delay in delays.values() if delay < args.timeout]
+    print(f"{len(sources)} sources, latency {args.latency:g}s (0.5-1.5x), timeout {args.timeout:g}s, "
+          f"slow: {args.slow or 'none'}")
+    print(f"  sum of answering latencies {sum(answered):.2f}s, slowest answering {max(answered, default=0):.2f}s")
+
+    t = time.perf_counter()
+    _, errors = sequential(sources)
+    print(f"{'sequential':<12} {time.perf_counter() - t:>6.2f}s  missing: {sorted(errors) or 'none'}")
+
+    t = time.perf_counter()
+    shared = SharedResults.from_sources(sources)
+    print(f"{'concurrent':<12} {time.perf_counter() - t:>6.2f}s  missing: {sorted(shared.errors) or 'none'}")
+    for benchmark, error in shared.errors.items():
+        print(f"  {benchmark}: {error}")
+
+    for benchmark in shared.benchmarks():
+        expected, _ = group_cells(local[benchmark])
+        assert shared.table(benchmark).equals(expected), f"{benchmark}: served cells differ from the store"
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
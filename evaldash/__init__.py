@@ -0,0 +1 @@
+"""Data layer for the coding model evaluation dashboard."""
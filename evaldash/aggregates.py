@@ -0,0 +1,88 @@
+"""Incrementally maintained cross-benchmark aggregates.
+
+The cross-benchmark views (the comparison heatmap and radar chart, the
+HS EVALS overall chart) need one headline number per benchmark, model and
+metric. Instead of re-reading every partition to rebuild them, the store
+keeps those numbers materialized in ``aggregates.json`` as partial sums and
+task counts per ``(benchmark, model, metric)``. Writing a run folds in only
+the metrics present in that run's cells, so a new RQ3 result for one model
+touches exactly the cells it carries and the refresh cost depends on the
+new data alone.
+"""
+import json
+import os
+
+AGGREGATES = "aggregates.json"
+
+# metric name -> (benchmark, (table, row, column) of the value, (table, row, column) of its task count)
+METRICS = {
+    "ARCHIT Pass@1": ("archit", ("leaderboard", "", "Pass@1"), ("leaderboard", "", "Successful Predictions")),
+    "ARCHIT Pass@8": ("archit", ("leaderboard", "", "Pass@8"), ("leaderboard", "", "Successful Predictions")),
+    "RustEvo RQ1": ("rustevo", ("summary", "Pass@1", "RQ1 (Full Docs)"), ("summary", "Total Tasks", "RQ1 (Full Docs)")),
+    "RustEvo RQ3": ("rustevo", ("summary", "Pass@1", "RQ3 (Minimal Docs)"), ("summary", "Total Tasks", "RQ3 (Minimal Docs)")),
+    "API Accuracy": (
+        "rustevo", ("summary", "API Usage Accuracy", "RQ1 (Full Docs)"), ("summary", "Total Tasks", "RQ1 (Full Docs)")
+    ),
+    "Code Understanding": (
+        "hs_evals", ("understanding", "Overall Average", "Score"), ("understanding", "Total Items Evaluated", "Score")
+    ),
+    "Code Generation (Efficiency)": (
+        "hs_evals", ("generation", "Implementation Efficiency", "Score"), ("generation", "Total Items Evaluated", "Score")
+    ),
+    "Code Debugging (Correctness)": (
+        "hs_evals", ("debugging", "Functional Correctness", "Score"), ("debugging", "Total Items", "Score")
+    ),
+}
+
+
+def partials(benchmark, cells):
+    """``{metric: (sum, count)}`` for the registered metrics found in one run's cells.
+
+    ``sum / count`` is the stored value; the count is the run's number of
+    tasks behind it (1 when the run does not say).
+    """
+    values = {
+        (t, r, c): v for t, r, c, v in zip(cells["table"], cells["row"], cells["column"], cells["value"])
+    }
+    out = {}
+    for metric, (metric_benchmark, value_cell, count_cell) in METRICS.items():
+        if metric_benchmark != benchmark or value_cell not in values:
+            continue
+        count = values.get(count_cell) or 1.0
+        out[metric] = (values[value_cell] * count, count)
+    return out
+
+
+class AggregateTable:
+    """``(benchmark, model, metric) -> (sum, count, run)`` persisted next to the manifest."""
+
+    def __init__(self, root):
+        self.path = os.path.join(root, AGGREGATES)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def entries(self):
+        if not self.exists():
+            return []
+        with open(self.path) as f:
+            return json.load(f)["entries"]
+
+    def update(self, benchmark, model, run, cells):
+        """Replace the entries the new run carries; every other entry is left alone."""
+        fresh = partials(benchmark, cells)
+        entries = [
+            e for e in self.entries()
+            if not (e["benchmark"] == benchmark and e["model"] == model and e["metric"] in fresh)
+        ]
+        entries += [
+            {"benchmark": benchmark, "model": model, "metric": metric, "sum": s, "count": n, "run": run}
+            for metric, (s, n) in fresh.items()
+        ]
+        self._write(entries)
+
+    def _write(self, entries):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"entries": entries}, f, indent=1)
+        os.replace(tmp, self.path)
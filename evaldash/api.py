@@ -0,0 +1,242 @@
+"""Read-only HTTP API for the metrics shown on the dashboard pages.
+
+Other tools can poll numbers here instead of scraping the pages. The API
+reads the local results store (not remote ``DASHBOARD_SOURCES``) and
+answers ``GET`` and ``HEAD``:
+
+- ``/v1/benchmarks``: every benchmark with its models and their runs;
+- ``/v1/metrics/<benchmark>`` (or ``/v1/metrics`` for all): the cells of
+  the tables the pages show (ARCHIT pass@k, RustEvo RQ1/RQ3, SWE counts,
+  HS EVALS scores and so on, but not per-task tables) as typed metrics
+  (``value``, ``unit``, ``denominator``, see ``evaldash.metrics``). By
+  default it returns the latest run per model. Filter with repeatable
+  ``model=``, ``run=`` and ``table=`` parameters.
+
+Metrics come back as JSON, or as an Arrow IPC stream with ``format=arrow``
+or ``Accept: application/vnd.apache.arrow.stream``. The Arrow stream has the
+store's cell columns, so a benchmark's URL also works as a result source for
+another dashboard (see ``evaldash.sources``).
+
+Every response carries an ETag derived from the manifest digest, the same
+version a snapshot is matched by, and ``Cache-Control: no-cache``. A poll
+with ``If-None-Match`` costs a ``stat`` of the manifest and a 304 until a
+new run is published. Bodies are cached per version, so a changed request
+is built once.
+
+Run it next to the app, either in the app process (``DASHBOARD_API_PORT=8502``,
+started by ``ensure_api``) or on its own::
+
+    python -m evaldash.api [--port 8502] [--host 127.0.0.1]
+"""
+import argparse
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import streamlit as st
+
+from evaldash.sources import ARROW_STREAM
+from evaldash.store import COLUMNS, MANIFEST, PARTITION_SCHEMA, SCHEMA, task_table_filter
+
+PORT = int(os.environ.get("DASHBOARD_API_PORT") or 8502)
+HOST = os.environ.get("DASHBOARD_API_HOST", "127.0.0.1")
+JSON = "application/json"
+BODY_CACHE_SIZE = 256
+
+log = logging.getLogger(__name__)
+
+
+class MetricsAPI:
+    """Routes requests to responses; independent of the HTTP server so it can be called directly."""
+
+    def __init__(self, store):
+        self.store = store
+        self._version = (None, "")  # (manifest stat, digest)
+        self._lock = threading.Lock()
+
+    def version(self):
+        """Manifest digest, rehashed only when the manifest file changes."""
+        try:
+            stat = (self.store.root / MANIFEST).stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            key = None
+        with self._lock:
+            if key != self._version[0]:
+                self._version = (key, self.store.manifest_digest())
+            return self._version[1]
+
+    def respond(self, target, accept="", if_none_match=""):
+        """``(status, headers, body)`` for a GET of ``target`` (path and query string)."""
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+        if parts[:2] == ["v1", "benchmarks"] and len(parts) == 2:
+            fmt = "json"
+        elif parts[:2] == ["v1", "metrics"] and len(parts) <= 3:
+            fmt = query.get("format", ["arrow" if ARROW_STREAM in accept else "json"])[-1]
+            if fmt not in ("json", "arrow"):
+                return _error(400, f"unknown format {fmt!r}; expected json or arrow")
+        else:
+            return _error(404, f"no such endpoint {url.path!r}; try /v1/benchmarks or /v1/metrics/<benchmark>")
+
+        version = self.version()
+        params = tuple(sorted((key, tuple(sorted(values))) for key, values in query.items() if key != "format"))
+        etag = '"' + hashlib.sha1(repr((version, parts, params, fmt)).encode()).hexdigest()[:20] + '"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _matches(if_none_match, etag):
+            return 304, headers, b""
+
+        if parts[1] == "benchmarks":
+            body = _benchmarks_body(self.store, version)
+        else:
+            benchmark = parts[2] if len(parts) == 3 else None
+            if benchmark is not None and benchmark not in self.store.benchmarks():
+                return _error(404, f"unknown benchmark {benchmark!r}")
+            selection = {key: tuple(sorted(query[key])) if key in query else None for key in ("model", "run", "table")}
+            body = _metrics_body(self.store, version, benchmark, selection["model"], selection["run"],
+                                 selection["table"], fmt)
+        headers["Content-Type"] = ARROW_STREAM if fmt == "arrow" else JSON
+        return 200, headers, body
+
+
+def _matches(if_none_match, etag):
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _error(status, message):
+    return status, {"Content-Type": JSON}, json.dumps({"error": message}).encode()
+
+
+@functools.lru_cache(maxsize=BODY_CACHE_SIZE)
+def _benchmarks_body(store, version):
+    runs = {}
+    for r in store.manifest():
+        runs.setdefault(r["benchmark"], {}).setdefault(r["model"], []).append(
+            {key: r[key] for key in ("run", "created", "date", "checkpoint") if key in r}
+        )
+    return json.dumps({"version": version, "benchmarks": runs}).encode()
+
+
+@functools.lru_cache(maxsize=BODY_CACHE_SIZE)
+def _metrics_body(store, version, benchmark, models, runs, tables, fmt):
+    """One response body; ``version`` is only part of the cache key."""
+    table = metric_cells(store, benchmark, models, runs, tables)
+    if fmt == "arrow":
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    cells = table.drop_columns(["benchmark"] if benchmark else []).to_pylist()
+    for cell in cells:
+        for key in ("value", "denominator"):
+            # JSON has no NaN
+            if cell[key] != cell[key]:
+                cell[key] = None
+    return json.dumps({"version": version, "benchmark": benchmark, "cells": cells}).encode()
+
+
+def metric_cells(store, benchmark=None, models=None, runs=None, tables=None):
+    """Arrow table of the page (not per-task) cells of ``benchmark``, or of all; latest runs by default."""
+    where = ~task_table_filter()
+    if tables is not None:
+        where &= ds.field("table").isin(list(tables))
+    parts = []
+    for name in [benchmark] if benchmark is not None else store.benchmarks():
+        cells = store.read_table(name, models, runs, filter=where)
+        if cells is not None:
+            parts.append(cells)
+    if not parts:
+        return pa.unify_schemas([SCHEMA, PARTITION_SCHEMA]).empty_table().select(COLUMNS)
+    return pa.concat_tables(parts)
+
+
+def serve(store, host=HOST, port=PORT):
+    """A threaded HTTP server for ``store`` bound to ``host:port`` (call ``serve_forever`` on it)."""
+    # Imported here so the app pays for http.server only when the API is on
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    api = MetricsAPI(store)
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "evaldash-api"
+
+        def do_GET(self):
+            self._reply(head=False)
+
+        def do_HEAD(self):
+            self._reply(head=True)
+
+        def _reply(self, head):
+            try:
+                status, headers, body = api.respond(
+                    self.path, self.headers.get("Accept", ""), self.headers.get("If-None-Match", "")
+                )
+            except Exception:
+                # A corrupt partition or a failed read still gets an HTTP status, not a dropped connection
+                log.exception("failed to answer %s", self.path)
+                status, headers, body = _error(500, "internal error reading the results store")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if status != 304:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not head and status != 304:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            log.debug("%s " + format, self.address_string(), *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+@st.cache_resource
+def ensure_api():
+    """Start the in-process API once per server when ``DASHBOARD_API_PORT`` is set."""
+    if not os.environ.get("DASHBOARD_API_PORT"):
+        return None
+    from evaldash.loaders import get_store
+
+    try:
+        server = serve(get_store())
+    except OSError:
+        # Another app process already serves the port
+        log.exception("metrics API not started on %s:%s", HOST, PORT)
+        return None
+    threading.Thread(target=server.serve_forever, name="evaldash-api", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    from evaldash.seed import ensure_seeded
+    from evaldash.store import ResultsStore
+
+    parser = argparse.ArgumentParser(description="Serve the dashboard metrics as JSON and Arrow over HTTP.")
+    parser.add_argument("--root", help="results store directory")
+    parser.add_argument("--host", default=HOST, help=f"address to bind (default: {HOST})")
+    parser.add_argument("--port", type=int, default=PORT, help=f"port (default: {PORT})")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    store = ResultsStore(args.root) if args.root else ResultsStore()
+    ensure_seeded(store)
+    server = serve(store, args.host, args.port)
+    log.info("serving %s on http://%s:%s/v1/benchmarks", store.root, args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Packed per-task pass/fail bits.
+
+An ``OutcomeBits`` holds the outcomes of one per-task table of a run: the
+task ids in sorted order, the number of samples ``n`` of every task and, per
+outcome, a ``(tasks, ceil(samples / 8))`` ``uint8`` matrix with one bit per
+task × sample (``np.packbits`` along the sample axis). RustEvo and SWE flags
+have one sample per task. ARCHIT and HumanEval keep every sample, so 300
+problems × 8 samples take 300 bytes per outcome.
+
+Everything derived from per-task outcomes works on whole packed rows:
+
+- per-task pass counts (and from them pass@k) are popcounts;
+- "solved by any sample" is one reduction along the sample axis;
+- overlaps between models and run-over-run diffs are bitwise operations and
+  popcounts on those task bits.
+
+Runs store them next to their Parquet file as ``<table>.bits.npz`` (see
+``ResultsStore.write_run``).
+"""
+import os
+
+import numpy as np
+
+from evaldash.passk import pass_at_k
+
+SUFFIX = ".bits.npz"
+# Outcome of a sample in ARCHIT and HumanEval ``samples``
+PASSED = "Passed"
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits, axis=None):
+    """Number of set bits in a packed ``uint8`` array, in total or along ``axis``."""
+    return _POPCOUNT[bits].sum(axis=axis, dtype=np.int64)
+
+
+class OutcomeBits:
+    def __init__(self, ids, n, bits):
+        self.ids = ids
+        self.n = n
+        self.bits = bits
+
+    @classmethod
+    def from_flags(cls, ids, flags, n=None):
+        """Pack ``{outcome: bool array}`` of shape ``(tasks,)`` or ``(tasks, samples)``.
+
+        ``n`` gives the samples of each task (default: every column); tasks
+        are sorted by id.
+        """
+        ids = np.asarray(ids, dtype=str)
+        order = np.argsort(ids, kind="stable")
+        flags = {name: np.asarray(f, dtype=bool).reshape(len(ids), -1)[order] for name, f in flags.items()}
+        width = max((f.shape[1] for f in flags.values()), default=1)
+        n = np.full(len(ids), width) if n is None else np.asarray(n)[order]
+        return cls(ids[order], n.astype(np.uint16), {name: np.packbits(f, axis=1) for name, f in flags.items()})
+
+    @classmethod
+    def from_counts(cls, ids, n, c, outcome=PASSED):
+        """Bits for tasks that only recorded ``(n, c)`` counts: the first ``c`` samples pass.
+
+        Pass@k and per-task results only depend on the counts, so this is
+        exact for everything computed here.
+        """
+        n = np.asarray(n, dtype=np.int64)
+        c = np.asarray(c, dtype=np.int64)
+        samples = np.arange(int(n.max()) if len(n) else 1)
+        return cls.from_flags(ids, {outcome: samples < c[:, None]}, n)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            bits = {key[len("outcome:"):]: data[key] for key in data.files if key.startswith("outcome:")}
+            return cls(data["ids"], data["n"], bits)
+
+    def save(self, path):
+        """Write atomically to ``path``."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, ids=self.ids, n=self.n, **{f"outcome:{name}": bits for name, bits in self.bits.items()})
+        os.replace(tmp, path)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def outcomes(self):
+        return list(self.bits)
+
+    @property
+    def samples(self):
+        return int(self.n.max()) if len(self) else 0
+
+    @property
+    def nbytes(self):
+        return self.ids.nbytes + self.n.nbytes + sum(bits.nbytes for bits in self.bits.values())
+
+    def counts(self, outcome=PASSED):
+        """Samples with ``outcome`` set, per task."""
+        return popcount(self.bits[outcome], axis=1)
+
+    def any(self, outcome=PASSED):
+        """Packed task bits: tasks where at least one sample has ``outcome`` set."""
+        return np.packbits(self.bits[outcome].any(axis=1))
+
+    def pass_at_k(self, k, outcome=PASSED):
+        """Unbiased pass@k per task (NaN for tasks with fewer than ``k`` samples)."""
+        return pass_at_k(self.n, self.counts(outcome), k)
+
+
+def overlap(a, b, tasks):
+    """Set sizes of two packed task bit arrays over ``tasks`` shared tasks."""
+    both = int(popcount(a & b))
+    only_a, only_b = int(popcount(a)) - both, int(popcount(b)) - both
+    return {"Both": both, "Only A": only_a, "Only B": only_b, "Neither": tasks - both - only_a - only_b}
@@ -0,0 +1,100 @@
+"""Bootstrap confidence intervals for per-task outcomes.
+
+Every interval resamples the tasks of a run with replacement, drawing all
+resamples for a job as one index matrix (in bounded chunks) so the mean of
+each resample is a single NumPy reduction. Differences between two models
+reuse the resampled means of both sides, or resample the per-task deltas
+when the outcomes are paired (same tasks, same order). The resampling can
+be fanned out over a process pool; small batches run in-process, where
+starting workers would cost more than the arithmetic.
+
+Each sample is seeded from its key, so an interval does not depend on which
+other models were resampled alongside it and cached results stay stable
+across reruns.
+"""
+import os
+import zlib
+
+import numpy as np
+
+RESAMPLES = 2000
+CONFIDENCE = 0.95
+# Resampled values per chunk; bounds the index matrix to ~8 MB
+CHUNK = 1_000_000
+# Below this many resampled values in total a pool is not worth its overhead
+PARALLEL_MIN_WORK = 20_000_000
+
+
+def binary_outcomes(successes, total):
+    """Per-task 0/1 outcomes for a run where ``successes`` of ``total`` tasks passed."""
+    successes, total = int(successes), int(total)
+    return np.repeat([1.0, 0.0], [successes, total - successes])
+
+
+def bootstrap_means(values, resamples=RESAMPLES, seed=0):
+    """Means of ``resamples`` bootstrap resamples of ``values``."""
+    values = np.asarray(values, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    return _resample(rng, len(values), resamples, lambda idx: values[idx].mean(axis=1))
+
+
+def percentile_interval(point, resampled, confidence=CONFIDENCE):
+    """``(estimate, low, high)`` from a point estimate and its bootstrap distribution."""
+    if len(resampled) == 0:
+        return point, np.nan, np.nan
+    tail = 100 * (1 - confidence) / 2
+    low, high = np.percentile(resampled, [tail, 100 - tail])
+    return point, low, high
+
+
+def confidence_intervals(samples, differences=None, executor=None, resamples=RESAMPLES, confidence=CONFIDENCE):
+    """Intervals for many models and model pairs at once.
+
+    ``samples`` maps a key to one model's outcome array; ``differences``
+    maps a key to ``(key_a, key_b, paired)`` naming two of those samples.
+    Unpaired differences reuse the resampled means of both sides, paired
+    ones resample the per-task deltas. Returns a dict mapping every key to
+    ``(estimate, low, high)``. With an ``executor`` the resampling is spread
+    over its workers once the total work is large enough.
+    """
+    differences = differences or {}
+    tasks = [(key, np.asarray(values, dtype=np.float64), resamples) for key, values in samples.items()]
+    for key, (a, b, paired) in differences.items():
+        if paired:
+            a, b = np.asarray(samples[a], dtype=np.float64), np.asarray(samples[b], dtype=np.float64)
+            if len(a) != len(b):
+                raise ValueError("paired outcomes need the same number of tasks")
+            tasks.append((key, a - b, resamples))
+
+    if executor is not None and sum(len(values) for _, values, _ in tasks) * resamples >= PARALLEL_MIN_WORK:
+        chunksize = max(1, len(tasks) // (4 * (os.cpu_count() or 1)))
+        resampled = dict(executor.map(_resample_job, tasks, chunksize=chunksize))
+    else:
+        resampled = dict(map(_resample_job, tasks))
+
+    results = {}
+    for key, values, _ in tasks:
+        results[key] = percentile_interval(np.mean(values) if len(values) else np.nan, resampled[key], confidence)
+    for key, (a, b, paired) in differences.items():
+        if not paired:
+            point = results[a][0] - results[b][0]
+            both = len(resampled[a]) and len(resampled[b])
+            results[key] = percentile_interval(point, resampled[a] - resampled[b] if both else (), confidence)
+    return {key: tuple(float(v) for v in results[key]) for key in [*samples, *differences]}
+
+
+def _resample_job(task):
+    key, values, resamples = task
+    seed = zlib.crc32(repr(key).encode())
+    return key, bootstrap_means(values, resamples=resamples, seed=seed)
+
+
+def _resample(rng, n, resamples, reduce):
+    if n == 0:
+        return np.empty(0)
+    out = np.empty(resamples)
+    step = max(1, CHUNK // n)
+    for start in range(0, resamples, step):
+        stop = min(start + step, resamples)
+        out[start:stop] = reduce(rng.integers(0, n, size=(stop - start, n)))
+    return out
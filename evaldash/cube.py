@@ -0,0 +1,84 @@
+"""Model × benchmark × metric results cube.
+
+Every stored value of the latest runs sits in one dense float array indexed
+``[benchmark, model, metric]``, with NaN where a model has no value. The
+three dimensions are categorical: labels are coded once when the cube is
+built and kept in dicts, so resolving a label is a dict lookup and a slice
+is plain NumPy indexing rather than a filter-and-pivot over a DataFrame.
+
+A metric label is the ``(table, row, column)`` of the cell it came from,
+e.g. ``("summary", "Pass@1", "RQ1 (Full Docs)")`` for RustEvo or
+``("leaderboard", "", "Pass@1")`` for ARCHIT.
+"""
+import numpy as np
+import pandas as pd
+
+
+class ResultsCube:
+    def __init__(self, benchmarks, models, metrics, values, benchmark_models=None):
+        self.benchmarks = tuple(benchmarks)
+        self.models = tuple(models)
+        self.metrics = tuple(metrics)
+        self.values = values
+        self.values.flags.writeable = False
+        self._codes = (
+            {label: i for i, label in enumerate(self.benchmarks)},
+            {label: i for i, label in enumerate(self.models)},
+            {label: i for i, label in enumerate(self.metrics)},
+        )
+        # Models in the order each benchmark lists them, which is the order pages show
+        self._benchmark_models = benchmark_models or {}
+
+    @classmethod
+    def from_cells(cls, cells):
+        """Build from long-format cells with benchmark, model, table, row, column and value."""
+        b_codes, benchmarks = pd.factorize(cells["benchmark"], sort=False)
+        m_codes, models = pd.factorize(cells["model"], sort=False)
+        k_codes, metrics = pd.MultiIndex.from_arrays(
+            [cells["table"], cells["row"], cells["column"]]
+        ).factorize()
+        values = np.full((len(benchmarks), len(models), len(metrics)), np.nan)
+        values[b_codes, m_codes, k_codes] = cells["value"].to_numpy(dtype=np.float64)
+        benchmark_models = {
+            benchmark: list(pd.unique(cells.loc[cells["benchmark"] == benchmark, "model"]))
+            for benchmark in benchmarks
+        }
+        return cls(benchmarks, models, list(metrics), values, benchmark_models)
+
+    def models_of(self, benchmark):
+        """Models with results for ``benchmark``."""
+        return list(self._benchmark_models.get(benchmark, ()))
+
+    def get(self, benchmark, model, metric):
+        """One value, NaN when the model has none (KeyError for unknown labels)."""
+        b, m, k = self._codes
+        return self.values[b[benchmark], m[model], k[metric]]
+
+    def slice(self, benchmark=None, models=None, metrics=None):
+        """NumPy slice of the cube.
+
+        Each argument is a single label (the axis is dropped), a list of
+        labels (the axis keeps that order) or None (the whole axis). Metric
+        labels are tuples, so several metrics must be passed as a list.
+        """
+        out = self.values
+        # Last axis first so the remaining axis numbers stay valid
+        for axis in (2, 1, 0):
+            selection = (benchmark, models, metrics)[axis]
+            if selection is None:
+                continue
+            codes = self._codes[axis]
+            if isinstance(selection, list):
+                out = out.take([codes[label] for label in selection], axis=axis)
+            else:
+                out = out[(slice(None),) * axis + (codes[selection],)]
+        return out
+
+    def frame(self, benchmark, metrics, names=None, models=None, index_name="Model"):
+        """One chart input: a ``models × metrics`` DataFrame for ``benchmark``."""
+        models = self.models_of(benchmark) if models is None else list(models)
+        return pd.DataFrame(
+            self.slice(benchmark, models, list(metrics)),
+            index=pd.Index(models, name=index_name),
+            columns=list(names) if names is not None else list(metrics),
+        )
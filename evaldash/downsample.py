@@ -0,0 +1,69 @@
+"""Downsampling of long line series for charts.
+
+A chart is a few thousand pixels wide, so a line of 100k points draws no
+better than one of a few thousand, yet the browser pays for every point in
+the payload and in every frame. ``downsample`` picks the points worth
+drawing:
+
+- ``minmax`` keeps the lowest and the highest point of equal buckets, so
+  spikes survive; it is a single vectorized pass;
+- ``lttb`` (Largest-Triangle-Three-Buckets) keeps the point of each bucket
+  that forms the largest triangle with its neighbours, which follows the
+  shape of the line best but loops over the buckets.
+
+Long series go through ``minmax`` down to ``MINMAX_RATIO`` times the target
+first and ``lttb`` on the rest, so a million points cost about as much as
+ten thousand.
+"""
+import numpy as np
+
+MINMAX_RATIO = 4
+
+
+def downsample(x, y, n):
+    """Sorted indices of at most ``n`` points of the line ``(x, y)`` worth drawing.
+
+    ``x`` and ``y`` are float arrays without NaNs; the first and last points
+    are always kept.
+    """
+    size = len(y)
+    if size <= n:
+        return np.arange(size)
+    index = minmax(y, n * MINMAX_RATIO) if size > n * MINMAX_RATIO else np.arange(size)
+    return index[lttb(x[index], y[index], n)]
+
+
+def minmax(y, n):
+    """Sorted indices of the first, the last and each bucket's lowest and highest point; at most ``n``."""
+    size = len(y)
+    if size <= n:
+        return np.arange(size)
+    inner = y[1:-1]
+    width = -(-len(inner) // max((n - 2) // 2, 1))
+    buckets = -(-len(inner) // width)
+    # Pad the last bucket with its own last value so the buckets reshape into rows
+    rows = np.pad(inner, (0, buckets * width - len(inner)), mode="edge").reshape(buckets, width)
+    offsets = np.arange(buckets) * width
+    picked = np.concatenate([offsets + rows.argmin(axis=1), offsets + rows.argmax(axis=1)])
+    picked = np.minimum(picked, len(inner) - 1) + 1
+    return np.unique(np.concatenate([[0, size - 1], picked]))
+
+
+def lttb(x, y, n):
+    """Sorted indices of ``n`` points chosen by Largest-Triangle-Three-Buckets."""
+    size = len(y)
+    if size <= n:
+        return np.arange(size)
+    n = max(n, 3)
+    # n - 2 buckets between the first and the last point, then the last point alone
+    edges = np.append(np.linspace(1, size - 1, n - 1).astype(int), size)
+    picked = np.empty(n, dtype=int)
+    picked[0], picked[-1] = 0, size - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        xc, yc = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        area = np.abs((x[a] - xc) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (yc - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
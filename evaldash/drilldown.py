@@ -0,0 +1,136 @@
+"""Inverted indexes over per-task results for the drill-down explorer.
+
+The explorer lists the tasks behind a count on the RustEvo and SWE pages
+(e.g. the borrow checker failures of one model in RQ3). All latest-run task
+rows of a benchmark go into one wide table. A ``TaskIndex`` over that table
+keeps sorted row-id postings for every facet value (model, RQ, change
+type) and every failure category. A query walks the smallest matching
+posting list and keeps the ids found, by binary search, in the other
+filters' postings. The cost grows with the postings involved, not with the
+table, so it stays in milliseconds however many runs are indexed.
+
+Categories are named after the summary rows they count, so a selected
+category matches the number shown in the summary table.
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# benchmark -> {per-task table: constant columns added to its rows}
+TASK_TABLES = {
+    "rustevo": {"tasks_rq1": {"RQ": "RQ1"}, "tasks_rq3": {"RQ": "RQ3"}},
+    "swe": {"tasks": {}},
+}
+FACETS = {
+    "rustevo": ["Model", "RQ", "Change Type"],
+    "swe": ["Model"],
+}
+# benchmark -> {summary row: {flag column: required value}}
+CATEGORIES = {
+    "rustevo": {
+        "Success Count": {"Success": True},
+        "Failed Count": {"Success": False},
+        "Incorrect Signatures": {"Incorrect Signature": True},
+        "Incorrect API": {"Incorrect API": True},
+        "Borrow Checker Failures": {"Borrow Checker Failure": True},
+        "API Usage True Count": {"API Usage": True},
+        "Compilation Errors": {"Compilation Error": True},
+        "Test Failures": {"Test Failure": True},
+    },
+    "swe": {
+        "Submitted Instances": {"Submitted": True},
+        "Completed Instances": {"Completed": True},
+        "Resolved Instances": {"Resolved": True},
+        "Unresolved Instances": {"Completed": True, "Resolved": False},
+        "Empty Patch Instances": {"Empty Patch": True},
+        "Error Instances": {"Error": True},
+    },
+}
+
+_NONE = np.empty(0, dtype=np.int64)
+
+
+def explorer_table(tables):
+    """One table from ``{table name: (wide task table, constant columns)}``."""
+    parts = []
+    for table, constants in tables.values():
+        # Constant columns go right after Model and Task
+        for position, (name, value) in enumerate(constants.items(), start=2):
+            table = table.add_column(position, name, pa.array([value] * table.num_rows, pa.string()))
+        parts.append(table)
+    return pa.concat_tables(parts, promote_options="default")
+
+
+class TaskIndex:
+    def __init__(self, table, facets, categories):
+        self.table = table
+        self.facets = [facet for facet in facets if facet in table.column_names]
+        self._postings = {facet: _postings(table[facet]) for facet in self.facets}
+        self._categories = {}
+        for name, required in categories.items():
+            if not all(column in table.column_names for column in required):
+                continue
+            mask = np.ones(table.num_rows, dtype=bool)
+            for column, value in required.items():
+                flags = pc.fill_null(table[column], not value).to_numpy(zero_copy_only=False)
+                mask &= flags if value else ~flags
+            self._categories[name] = np.flatnonzero(mask)
+
+    def __len__(self):
+        return self.table.num_rows
+
+    @property
+    def categories(self):
+        return list(self._categories)
+
+    def values(self, facet):
+        return list(self._postings.get(facet, ()))
+
+    def rows(self, filters=None, category=None):
+        """Sorted row ids matching every facet filter and ``category``; None means all rows.
+
+        ``filters`` maps a facet to the values to keep (any of them).
+        """
+        groups = [[self._postings[facet].get(v, _NONE) for v in values] for facet, values in (filters or {}).items()]
+        if category is not None:
+            groups.append([self._categories.get(category, _NONE)])
+        if not groups:
+            return None
+        # Walk the ids of the smallest group and keep those every other group contains
+        groups = sorted(map(_union, groups), key=len)
+        out = groups[0]
+        for ids in groups[1:]:
+            out = _intersect(out, ids)
+        return out
+
+    def counts(self, filters=None):
+        """Number of matching rows per category (and ``None`` for all of them)."""
+        base = self.rows(filters)
+        if base is None:
+            return {None: len(self), **{name: len(ids) for name, ids in self._categories.items()}}
+        return {None: len(base), **{name: len(_intersect(base, ids)) for name, ids in self._categories.items()}}
+
+
+def _union(postings):
+    """Sorted ids of any of ``postings``; the postings of one facet never share ids."""
+    return postings[0] if len(postings) == 1 else np.sort(np.concatenate(postings))
+
+
+def _intersect(ids, postings):
+    """The ids of sorted ``ids`` that sorted ``postings`` also holds, by binary search of each id."""
+    if not len(ids) or not len(postings):
+        return _NONE
+    found = np.minimum(np.searchsorted(postings, ids), len(postings) - 1)
+    return ids[postings[found] == ids]
+
+
+def _postings(column):
+    encoded = column.combine_chunks().dictionary_encode()
+    codes = encoded.indices.to_numpy(zero_copy_only=False)
+    # A stable sort keeps the row ids of each value ascending
+    order = np.argsort(codes, kind="stable")
+    bounds = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(encoded.dictionary)))]
+    return {
+        value: order[start:stop]
+        for value, start, stop in zip(encoded.dictionary.to_pylist(), bounds[:-1], bounds[1:])
+    }
@@ -0,0 +1,37 @@
+"""Task explorer: the individual tasks behind a summary count.
+
+Facet filters (model, RQ, change type) and a category chosen from the
+summary rows are resolved against the benchmark's ``TaskIndex`` (see
+``evaldash.drilldown``); each category button shows its count under the
+current filters, and choosing one pages through its tasks.
+"""
+from functools import partial
+
+import streamlit as st
+
+from evaldash.loaders import load_drilldown, load_task_index
+from evaldash.pager import paged_view
+
+ALL_TASKS = "All tasks"
+
+
+def task_explorer(benchmark, key):
+    """Render the explorer for ``benchmark``, which must have per-task results."""
+    index = load_task_index(benchmark)
+
+    filters = {}
+    for col, facet in zip(st.columns(len(index.facets)), index.facets):
+        chosen = col.multiselect(facet, index.values(facet), key=f"{key}_{facet}", placeholder="All")
+        if chosen:
+            filters[facet] = chosen
+
+    counts = index.counts(filters)
+    category = st.pills(
+        "Category",
+        [ALL_TASKS] + index.categories,
+        format_func=lambda c: f"{c} ({counts[None if c == ALL_TASKS else c]:,})",
+        key=f"{key}_category",
+    )
+    if category == ALL_TASKS:
+        category = None
+    paged_view(partial(load_drilldown, benchmark, filters, category), key)
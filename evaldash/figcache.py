@@ -0,0 +1,158 @@
+"""Figure cache.
+
+Figures are keyed by a hash of the builder, its input data and layout
+parameters. Each entry keeps the built figure together with its serialized
+Plotly JSON in an in-memory LRU, optionally backed by a directory of JSON
+files, so an unchanged chart is never rebuilt. The cache is process-wide
+(``st.cache_resource``) and counts hits and misses.
+
+It saves building the figure, not encoding it: ``st.plotly_chart`` only
+takes a figure, and it encodes it to JSON again on every rerun. The spec
+kept next to the figure is the one that encoding produces, and ``perf``
+uses it for the chart's payload size.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import plotly.io as pio
+import streamlit as st
+
+from evaldash.perf import span
+
+FIGURE_CACHE_SIZE = int(os.environ.get("DASHBOARD_FIGURE_CACHE_SIZE", 256))
+FIGURE_CACHE_DIR = os.environ.get("DASHBOARD_FIGURE_CACHE_DIR")
+
+
+class FigureCache:
+    def __init__(self, maxsize=FIGURE_CACHE_SIZE, disk_dir=None):
+        self.maxsize = maxsize
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Return ``(figure, spec_json)`` for ``key``, building it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(key)
+        if entry is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            figure = build()
+            entry = (figure, pio.to_json(figure, validate=False))
+            self._save(key, entry[1])
+            with self._lock:
+                self.misses += 1
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def _load(self, key):
+        if self.disk_dir is None:
+            return None
+        path = self.disk_dir / f"{key}.json"
+        try:
+            spec = path.read_text()
+        except FileNotFoundError:
+            return None
+        figure = pio.from_json(spec, skip_invalid=True)
+        # Re-encoded, so the spec is exactly what ``st.plotly_chart`` sends for this figure
+        return figure, pio.to_json(figure, validate=False)
+
+    def _save(self, key, spec):
+        if self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.disk_dir / f"{key}.json.tmp"
+        tmp.write_text(spec)
+        os.replace(tmp, self.disk_dir / f"{key}.json")
+
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(disk_dir=FIGURE_CACHE_DIR)
+
+
+def figure_key(build, *args, **kwargs):
+    h = hashlib.sha1(f"{build.__module__}.{build.__qualname__}".encode())
+    _update(h, args)
+    _update(h, sorted(kwargs.items()))
+    return h.hexdigest()
+
+
+def cached_figure(build, *args, **kwargs):
+    """Build ``build(*args, **kwargs)`` once per distinct input and return ``(figure, spec)``."""
+    with span("figure", build.__name__) as event:
+        key = figure_key(build, *args, **kwargs)
+        built = []
+
+        def build_figure():
+            built.append(True)
+            return build(*args, **kwargs)
+
+        entry = get_figure_cache().get(key, build_figure)
+        if event is not None:
+            event["hit"] = not built
+    return entry
+
+
+def show_figure(build, *args, **kwargs):
+    """Draw the cached figure; Streamlit still encodes it to JSON on every call."""
+    figure, spec = cached_figure(build, *args, **kwargs)
+    with span("chart", build.__name__) as event:
+        st.plotly_chart(figure, use_container_width=True)
+        if event is not None:
+            # ``st.plotly_chart`` encodes the figure with the same ``pio.to_json`` call as ``spec``
+            event["bytes"] = len(spec)
+
+
+def _update(h, obj):
+    if isinstance(obj, pd.DataFrame):
+        h.update(repr((list(obj.columns), [str(t) for t in obj.dtypes])).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(repr((obj.name, str(obj.dtype))).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for item in obj:
+            _update(h, item)
+            h.update(b",")
+        h.update(b"]")
+    elif isinstance(obj, dict):
+        _update(h, list(obj.items()))
+    else:
+        h.update(repr(obj).encode())
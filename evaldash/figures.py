@@ -0,0 +1,168 @@
+"""Figure builders.
+
+Builders are pure functions of their arguments so the figure cache can key
+them on a hash of the inputs. Pages call them through
+``evaldash.figcache.show_figure``.
+
+Scatter and line figures with more than ``WEBGL_POINTS`` points are drawn
+with WebGL (``Scattergl``) and without per-point labels and markers, and
+line series longer than ``LINE_POINTS`` are downsampled before they are
+sent (see ``evaldash.downsample``), so per-task and per-checkpoint charts
+stay smooth in the browser.
+
+Plotly serializes NumPy and pandas arrays as base64 typed arrays, so
+builders hand it arrays rather than lists, and draw value labels with a
+``texttemplate`` over the values already sent instead of a second ``text``
+copy of them.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from evaldash.downsample import downsample
+
+WEBGL_POINTS = int(os.environ.get("DASHBOARD_WEBGL_POINTS", 1000))
+LINE_POINTS = int(os.environ.get("DASHBOARD_LINE_POINTS", 2000))
+
+
+def grouped_bar_figure(data, x, series, text_decimals=None, errors=None, **layout):
+    """Grouped bars, one trace per ``(column, name, color)`` in ``series``.
+
+    ``errors`` maps a column to the ``(low, high)`` columns holding its
+    interval bounds; bars whose bounds are missing get no error bar.
+    """
+    fig = go.Figure()
+    for column, name, color in series:
+        values = data[column]
+        bar = dict(
+            name=name,
+            x=data[x],
+            y=values,
+            texttemplate=f'%{{y:.{text_decimals}~f}}' if text_decimals is not None else '%{y}',
+            textposition='auto',
+            marker_color=color
+        )
+        if errors and column in errors:
+            low, high = (data[c] for c in errors[column])
+            if (low.notna() & high.notna()).any():
+                bar['error_y'] = dict(type='data', symmetric=False, array=high - values, arrayminus=values - low)
+        fig.add_trace(go.Bar(**bar))
+    fig.update_layout(barmode='group', **layout)
+    return fig
+
+
+def colored_bar_figure(data, x, y, title, color_scale, showlegend=None, height=400):
+    fig = px.bar(
+        data,
+        x=x,
+        y=y,
+        title=title,
+        color=y,
+        color_continuous_scale=color_scale,
+        height=height
+    )
+    fig.update_traces(texttemplate='%{y:.2f}%', textposition='outside')
+    if showlegend is not None:
+        fig.update_layout(showlegend=showlegend)
+    return fig
+
+
+def line_figure(data, x, series, **layout):
+    """Lines with markers, one trace per ``(column, name)`` in ``series``."""
+    lines = [(name, *_line_points(data[x], data[column])) for column, name in series]
+    large = sum(len(xs) for _, xs, _ in lines) > WEBGL_POINTS
+    fig = go.Figure()
+    for name, xs, ys in lines:
+        fig.add_trace((go.Scattergl if large else go.Scatter)(
+            name=name,
+            x=xs,
+            y=ys,
+            mode='lines' if large else 'lines+markers',
+            marker=dict(size=12),
+            line=dict(width=3)
+        ))
+    fig.update_layout(**layout)
+    return fig
+
+
+def _line_points(x, y):
+    """``(x, y)`` of one line, downsampled to ``LINE_POINTS`` when longer.
+
+    A downsampled line drops its missing values, so it is drawn across
+    gaps instead of breaking at them.
+    """
+    if len(y) <= LINE_POINTS:
+        return x, y
+    keep = y.notna().to_numpy()
+    x, y = x[keep], y[keep]
+    if pd.api.types.is_datetime64_any_dtype(x):
+        position = (x - x.iloc[0]).dt.total_seconds().to_numpy()
+    elif pd.api.types.is_numeric_dtype(x):
+        position = x.to_numpy(dtype=float)
+    else:
+        position = np.arange(len(x), dtype=float)
+    index = downsample(position, y.to_numpy(dtype=float), LINE_POINTS)
+    return x.iloc[index], y.iloc[index]
+
+
+def labeled_scatter_figure(data, x, y, label, title, height=500):
+    if len(data) > WEBGL_POINTS:
+        # Labels move to the hover text; thousands of text labels would cover the points anyway
+        return px.scatter(data, x=x, y=y, hover_name=label, title=title, height=height, render_mode='webgl')
+    fig = px.scatter(
+        data,
+        x=x,
+        y=y,
+        text=label,
+        size=[20] * len(data),
+        color=label,
+        title=title,
+        height=height,
+        render_mode='svg'
+    )
+    fig.update_traces(textposition='top center')
+    return fig
+
+
+def radar_figure(data, index, models, axes, title, height=600):
+    """Radar chart; ``axes`` is a list of ``(label, column)`` pairs."""
+    rows = data.set_index(index)
+    fig = go.Figure()
+    for model in models:
+        row = rows.loc[model]
+        fig.add_trace(go.Scatterpolar(
+            r=row[[column for _, column in axes]].to_numpy(dtype=float),
+            theta=[label for label, _ in axes],
+            fill='toself',
+            name=model
+        ))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )
+        ),
+        showlegend=True,
+        title=title,
+        height=height
+    )
+    return fig
+
+
+def heatmap_figure(data, index, title, height=500):
+    values = data.set_index(index).to_numpy(dtype=float)
+    fig = go.Figure(data=go.Heatmap(
+        z=values,
+        x=[column for column in data.columns if column != index],
+        y=data[index],
+        colorscale='YlOrRd',
+        texttemplate='%{z:.1f}',
+        textfont={"size": 10},
+        hoverongaps=False
+    ))
+    fig.update_layout(title=title, height=height)
+    return fig
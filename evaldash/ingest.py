@@ -0,0 +1,423 @@
+"""Streaming ingest of raw per-task eval logs.
+
+Reads per-task JSONL result files (optionally gzipped) one line at a time,
+folds every record into running counters and writes the aggregate tables the
+pages show to the results store. RustEvo and SWE fold records into
+counters (plus the distinct API names RustEvo needs for coverage) and
+write their per-task rows to the staged run in batches of ``BATCH`` tasks,
+keeping only the task ids and one packed bit per task and flag. ARCHIT and
+HumanEval keep one bit mask of passing samples per problem, and HS EVALS
+the scores of each of its few dozen items. A RustEvo or SWE task costs its
+id and a few bits of memory, not a row.
+
+RustEvo records::
+
+    {"task_id": "...", "rq": "RQ1", "change_type": "Stabilized", "api": "std::...",
+     "success": true, "api_usage": true, "incorrect_signature": false,
+     "incorrect_api": false, "borrow_checker_failure": false,
+     "compilation_error": false, "test_failure": false}
+
+SWE records::
+
+    {"instance_id": "...", "submitted": true, "completed": true,
+     "resolved": false, "empty_patch": false, "error": false}
+
+Besides the summary tables, RustEvo writes ``tasks_rq1``/``tasks_rq3`` and
+SWE a ``tasks`` table, with one row per task id and one 0/1 column per flag
+(RustEvo adds the change type and API as text), for the per-task tables on
+their pages. The same flags are also stored packed as outcome bits
+(``evaldash.bitset``) for run diffs.
+
+ARCHIT and HumanEval records, either one per sample or pre-counted per
+problem (``error`` marks a failed prediction, excluded from pass@k)::
+
+    {"task_id": "...", "passed": true}
+    {"task_id": "...", "n": 8, "c": 3, "error": false}
+
+These are stored as packed ``samples`` outcome bits, one bit per problem ×
+sample (a pre-counted problem passes its first ``c`` samples), so pass@k can
+be computed for any k.
+
+HS EVALS records, one per evaluated item; the per-item scores (a few dozen
+per task) are kept as ``<task>_scores`` tables for bootstrap intervals::
+
+    {"task_id": "...", "task": "debugging",
+     "scores": {"Fix Relevance": 0.71, "Functional Correctness": 0.5}}
+
+An item may leave out a metric; it then only counts toward the others (and
+toward an average of them only when it has every part).
+
+Usage::
+
+    python -m evaldash.ingest rustevo runs/hs72-*.jsonl --model kat-dev-hs-72b --run 2025-11-02
+    python -m evaldash.ingest archit runs/hs72-step12k.jsonl --model kat-dev-hs-72b --run step-12000 \
+        --checkpoint step-12000 --date 2025-11-04
+"""
+import argparse
+import gzip
+import json
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from evaldash.bitset import PASSED, OutcomeBits
+from evaldash.passk import pass_at_k
+from evaldash.seed import CHANGE_TYPES, HS_EVALS_METRICS, RUSTEVO_METRICS, SWE_METRICS
+from evaldash.store import SCHEMA, ResultsStore
+
+RQ_COLUMNS = {"RQ1": "RQ1 (Full Docs)", "RQ3": "RQ3 (Minimal Docs)"}
+# Tasks per row group of per-task rows; a multiple of 8 (see ``TaskTable``)
+BATCH = 8192
+
+
+def iter_records(path):
+    """Yield one parsed record per non-empty line without loading the file."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+# Typed cell fields: value, unit, denominator, display (see evaldash.metrics)
+def _count(n):
+    return float(n), "", float("nan"), ""
+
+
+def _percent(num, den):
+    value = 100.0 * num / den if den else 0.0
+    return value, "%", float("nan"), ""
+
+
+def _ratio(num, den):
+    return float(num), "", float(den), ""
+
+
+class TaskTable:
+    """Per-task rows of one table, written to the staged run ``BATCH`` tasks at a time.
+
+    Each task's flags are also packed into one growing bit buffer per flag
+    for the table's outcome bits, so only a batch of rows, the task ids and
+    one bit per task and flag stay in memory.
+    """
+
+    def __init__(self, name, text, flags, write):
+        self.name = name
+        self.text = text        # text column names
+        self.flags = flags      # flag column names
+        self.write = write
+        self.tasks = 0
+        self._batch = []
+        self._ids = []          # one array of task ids per written batch
+        self._packed = {flag: bytearray() for flag in flags}
+
+    def add(self, task_id, text, values):
+        self._batch.append((task_id, text, values))
+        self.tasks += 1
+        # Batches stay a multiple of 8 tasks so their packed flags concatenate
+        if len(self._batch) == BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self._batch:
+            return
+        ids, texts, values = zip(*self._batch)
+        flags = np.array(values, dtype=bool).reshape(len(ids), len(self.flags))
+        frames = [
+            pd.DataFrame({"table": self.name, "row": ids, "column": column, "value": np.nan, "unit": "",
+                          "denominator": np.nan, "display": [t[column] for t in texts]})
+            for column in self.text
+        ] + [
+            pd.DataFrame({"table": self.name, "row": ids, "column": column, "value": flags[:, i].astype(float),
+                          "unit": "", "denominator": np.nan, "display": ""})
+            for i, column in enumerate(self.flags)
+        ]
+        self.write(pd.concat(frames, ignore_index=True))
+        self._ids.append(np.array(ids, dtype=str))
+        for i, column in enumerate(self.flags):
+            self._packed[column] += np.packbits(flags[:, i]).tobytes()
+        self._batch = []
+
+    def bits(self):
+        """The flags of every task as outcome bits; writes the last batch first."""
+        self.flush()
+        ids = np.concatenate(self._ids) if self._ids else np.empty(0, dtype=str)
+        return OutcomeBits.from_flags(ids, {
+            column: np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=len(ids)).astype(bool)
+            for column, packed in self._packed.items()
+        })
+
+
+class RustEvoAggregator:
+    FLAGS = [
+        "success", "api_usage", "incorrect_signature", "incorrect_api",
+        "borrow_checker_failure", "compilation_error", "test_failure",
+    ]
+    # Column names of the per-task table
+    TASK_COLUMNS = {
+        "success": "Success", "api_usage": "API Usage", "incorrect_signature": "Incorrect Signature",
+        "incorrect_api": "Incorrect API", "borrow_checker_failure": "Borrow Checker Failure",
+        "compilation_error": "Compilation Error", "test_failure": "Test Failure",
+    }
+
+    def __init__(self, write):
+        self.write = write
+        self.counts = {}        # rq -> Counter of flags
+        self.by_change = {}     # rq -> change type -> Counter
+        self.apis = {}          # rq -> set of every API exercised
+        self.covered = {}       # rq -> set of APIs used correctly
+        self.tasks = {}         # rq -> TaskTable
+
+    def add(self, record):
+        rq = record.get("rq", "RQ1")
+        if rq not in self.tasks:
+            self.tasks[rq] = TaskTable(
+                f"tasks_{rq.lower()}", ["Change Type", "API"], [self.TASK_COLUMNS[f] for f in self.FLAGS], self.write
+            )
+        tasks = self.tasks[rq]
+        tasks.add(
+            str(record.get("task_id", tasks.tasks)),
+            {"Change Type": record.get("change_type", "Unknown"), "API": record.get("api") or ""},
+            tuple(bool(record.get(flag)) for flag in self.FLAGS),
+        )
+        counts = self.counts.setdefault(rq, Counter())
+        change = self.by_change.setdefault(rq, {}).setdefault(record.get("change_type", "Unknown"), Counter())
+        counts["total"] += 1
+        change["total"] += 1
+        for flag in self.FLAGS:
+            if record.get(flag):
+                counts[flag] += 1
+                change[flag] += 1
+        api = record.get("api")
+        if api is not None:
+            self.apis.setdefault(rq, set()).add(api)
+            if record.get("api_usage"):
+                self.covered.setdefault(rq, set()).add(api)
+
+    def cells(self):
+        rows = []
+        for rq, c in self.counts.items():
+            column = RQ_COLUMNS.get(rq, rq)
+            total, success = c["total"], c["success"]
+            failed = total - success
+            apis, covered = len(self.apis.get(rq, ())), len(self.covered.get(rq, ()))
+            values = {
+                "Total Tasks": _count(total),
+                "Success Count": _count(success),
+                "Failed Count": _count(failed),
+                "Pass@1": _percent(success, total),
+                "Incorrect Signatures": _count(c["incorrect_signature"]),
+                "Incorrect API": _count(c["incorrect_api"]),
+                "Borrow Checker Failures": _count(c["borrow_checker_failure"]),
+                "Borrow Checker Failure Rate": _percent(c["borrow_checker_failure"], failed),
+                "API Usage True Count": _count(c["api_usage"]),
+                "API Usage Accuracy": _percent(c["api_usage"], total),
+                "API Coverage Distinct": _percent(covered, apis),
+                "API Coverage Count": _ratio(covered, apis),
+                "Compilation Errors": _count(c["compilation_error"]),
+                "Test Failures": _count(c["test_failure"]),
+            }
+            rows += [("summary", metric, column) + values[metric] for metric in RUSTEVO_METRICS]
+
+            changes = self.by_change[rq]
+            order = [t for t in CHANGE_TYPES if t in changes] + [t for t in changes if t not in CHANGE_TYPES]
+            table = f"change_type_{rq.lower()}"
+            for column_name, value_of in [
+                ("Total", lambda t: _count(t["total"])),
+                ("Success", lambda t: _count(t["success"])),
+                ("Success Rate", lambda t: _percent(t["success"], t["total"])),
+                ("API Usage Accuracy", lambda t: _percent(t["api_usage"], t["total"])),
+            ]:
+                rows += [(table, name, column_name) + value_of(changes[name]) for name in order]
+        return rows
+
+    def bits(self):
+        return {tasks.name: tasks.bits() for tasks in self.tasks.values()}
+
+
+class SweAggregator:
+    FLAGS = ["submitted", "completed", "resolved", "empty_patch", "error"]
+    TASK_COLUMNS = {
+        "submitted": "Submitted", "completed": "Completed", "resolved": "Resolved",
+        "empty_patch": "Empty Patch", "error": "Error",
+    }
+
+    def __init__(self, write):
+        self.counts = Counter()
+        self.tasks = TaskTable("tasks", [], [self.TASK_COLUMNS[f] for f in self.FLAGS], write)
+
+    def add(self, record):
+        self.tasks.add(
+            str(record.get("instance_id", self.tasks.tasks)), {}, tuple(bool(record.get(flag)) for flag in self.FLAGS)
+        )
+        self.counts["total"] += 1
+        for flag in self.FLAGS:
+            if record.get(flag):
+                self.counts[flag] += 1
+
+    def cells(self):
+        c = self.counts
+        values = [
+            c["total"], c["submitted"], c["completed"], c["resolved"],
+            c["completed"] - c["resolved"], c["empty_patch"], c["error"],
+        ]
+        return [("summary", metric, "Count") + _count(v) for metric, v in zip(SWE_METRICS, values)]
+
+    def bits(self):
+        return {"tasks": self.tasks.bits()} if self.tasks.tasks else {}
+
+
+class SampleAggregator:
+    def __init__(self, ks, predictions=False):
+        self.ks = ks
+        self.predictions = predictions
+        self.tasks = {}     # task id -> [n, c, error, passing samples as a bit mask]
+
+    def add(self, record):
+        task = self.tasks.setdefault(str(record["task_id"]), [0, 0, False, 0])
+        if "n" in record:
+            task[3] |= ((1 << record["c"]) - 1) << task[0]
+            task[0] += record["n"]
+            task[1] += record["c"]
+        else:
+            task[3] |= bool(record.get("passed")) << task[0]
+            task[0] += 1
+            task[1] += bool(record.get("passed"))
+        task[2] = task[2] or bool(record.get("error"))
+
+    def cells(self):
+        if not self.tasks:
+            return []
+        ids = list(self.tasks)
+        n, c, error = (np.array(col) for col in list(zip(*self.tasks.values()))[:3])
+        ok = ~error.astype(bool)
+        rows = []
+        if self.predictions:
+            rows += [
+                ("leaderboard", "", "Total Examples") + _count(len(ids)),
+                ("leaderboard", "", "Successful Predictions") + _count(int(ok.sum())),
+                ("leaderboard", "", "Error Rate") + _percent(int((~ok).sum()), len(ids)),
+            ]
+        for k in self.ks:
+            value = 100.0 * np.nanmean(pass_at_k(n[ok], c[ok], k)) if ok.any() else float("nan")
+            rows.append(("leaderboard", "", f"Pass@{k}", value, "%", float("nan"), ""))
+        return rows
+
+    def bits(self):
+        """Passing samples of every problem without an error, as ``samples`` outcome bits."""
+        tasks = [(task_id, t) for task_id, t in self.tasks.items() if not t[2]]
+        if not tasks:
+            return {}
+        width = max(t[0] for _, t in tasks)
+        size = -(-width // 8)
+        masks = b"".join(t[3].to_bytes(size, "little") for _, t in tasks)
+        passed = np.unpackbits(
+            np.frombuffer(masks, dtype=np.uint8).reshape(len(tasks), size), axis=1, count=width, bitorder="little"
+        )
+        return {"samples": OutcomeBits.from_flags(
+            [task_id for task_id, _ in tasks], {PASSED: passed}, [t[0] for _, t in tasks]
+        )}
+
+
+class HsEvalsAggregator:
+    # Understanding's headline is the mean of its three metrics per item
+    AVERAGED = {"understanding": "Overall Average"}
+
+    def __init__(self):
+        self.scores = {}    # task -> item id -> {metric: score}
+
+    def add(self, record):
+        items = self.scores.setdefault(record["task"], {})
+        items[str(record["task_id"])] = {k: float(v) for k, v in record["scores"].items()}
+
+    def cells(self):
+        rows = []
+        for task, items in self.scores.items():
+            count_metric, *metrics = HS_EVALS_METRICS[task]
+            averaged = self.AVERAGED.get(task)
+            per_item = {}
+            # An item without a metric's score is left out of that metric only
+            for metric in metrics:
+                if metric == averaged:
+                    parts = [m for m in metrics if m != averaged]
+                    per_item[metric] = {
+                        i: np.mean([s[m] for m in parts]) for i, s in items.items() if all(m in s for m in parts)
+                    }
+                else:
+                    per_item[metric] = {i: s[metric] for i, s in items.items() if metric in s}
+            rows.append((task, count_metric, "Score") + _count(len(items)))
+            rows += [
+                (task, m, "Score", float(np.mean(list(per_item[m].values()))), "", float("nan"), "")
+                for m in metrics if per_item[m]
+            ]
+            rows += [
+                (f"{task}_scores", item, m, float(score), "", float("nan"), "")
+                for m in metrics for item, score in per_item[m].items()
+            ]
+        return rows
+
+    def bits(self):
+        # Scores are not pass/fail
+        return {}
+
+
+# benchmark -> aggregator factory, given the function that writes per-task rows
+AGGREGATORS = {
+    "archit": lambda write: SampleAggregator([1, 3, 8], predictions=True),
+    "hs_evals": lambda write: HsEvalsAggregator(),
+    "humaneval": lambda write: SampleAggregator([1, 10]),
+    "rustevo": RustEvoAggregator,
+    "swe": SweAggregator,
+}
+
+
+def aggregate(benchmark, paths, staged):
+    """Fold every record in ``paths`` into one aggregator, writing its cells and outcome bits to ``staged``.
+
+    ``staged`` is a ``StagedRun``; per-task rows reach it in batches while
+    the logs are read, the summary cells once they are done. Logs without
+    a single record raise ``ValueError`` rather than publish an empty run.
+    """
+    aggregator = AGGREGATORS[benchmark](staged.write_cells)
+    records = 0
+    for path in paths:
+        for record in iter_records(path):
+            aggregator.add(record)
+            records += 1
+    if not records:
+        raise ValueError(f"no {benchmark} records in {', '.join(map(str, paths))}")
+    for name, outcomes in aggregator.bits().items():
+        staged.write_bits(name, outcomes)
+    staged.write_cells(pd.DataFrame(aggregator.cells(), columns=SCHEMA.names))
+
+
+def ingest(benchmark, paths, model, run, store=None, day=None, checkpoint=None):
+    """Aggregate ``paths`` into a new run and publish it; returns the number of cells written."""
+    store = store or ResultsStore()
+    with store.open_run(benchmark, model, run, day, checkpoint) as staged:
+        aggregate(benchmark, paths, staged)
+    store.publish([staged.entry])
+    return staged.rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate per-task JSONL results into the results store.")
+    parser.add_argument("benchmark", choices=sorted(AGGREGATORS))
+    parser.add_argument("paths", nargs="+", help="JSONL files (optionally .gz) for one model run")
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--run", required=True)
+    parser.add_argument("--date", help="evaluation date (YYYY-MM-DD) for the trend charts; "
+                                       "defaults to the run id if it is a date, else today")
+    parser.add_argument("--checkpoint", help="training checkpoint the run evaluated, e.g. step-12000")
+    parser.add_argument("--root", help="results store directory")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.root) if args.root else ResultsStore()
+    cells = ingest(args.benchmark, args.paths, args.model, args.run, store, args.date, args.checkpoint)
+    print(f"{args.benchmark}/{args.model}/{args.run}: wrote {cells} cells to {store.root}")
+
+
+if __name__ == "__main__":
+    main()
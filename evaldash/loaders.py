@@ -0,0 +1,533 @@
+"""Cached access to the results store.
+
+The latest runs are served from one process-wide ``SharedResults``
+(``st.cache_resource``): every session slices the same immutable Arrow
+tables instead of unpickling its own copy. When a snapshot built with
+``python -m evaldash.snapshot`` matches the manifest, those tables are
+memory-mapped from it rather than read from Parquet. Reads of explicit
+runs and the small derived tables are memoized with ``st.cache_data`` and
+keyed by benchmark, model, run id and projection. Every key also carries the store
+version (the mtime of the manifest, which is replaced atomically whenever a
+run is written), so a new result file invalidates the affected entries on
+the next rerun without any explicit clearing. TTL and ``max_entries`` bound
+the memory held. Each cached load is wrapped by ``evaldash.perf.cached``, which
+times it and records hits when instrumentation is on.
+
+Bootstrap intervals are keyed by the run ids they were computed from rather
+than the store version, so they are only recomputed when one of those runs
+changes.
+
+The latest runs of all benchmarks are fetched concurrently from their
+sources, the local store or result servers (see ``evaldash.sources``). When
+some sources fail, pages render the others; ``source_errors`` lists the
+missing ones. Every ``SOURCE_RETRY`` seconds the next rerun that needs the
+results fetches the failed sources again. A retry that loads anything bumps
+the version token, so the derived caches pick up the new benchmarks.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import streamlit as st
+
+from evaldash.bootstrap import binary_outcomes, confidence_intervals
+from evaldash.cube import ResultsCube
+from evaldash.drilldown import CATEGORIES, FACETS, TASK_TABLES, TaskIndex, explorer_table
+from evaldash.passk import grouped_pass_at_k
+from evaldash.perf import cached
+from evaldash.regress import SPLITS, RunBits, outcome_bits
+from evaldash.seed import ensure_seeded
+from evaldash.shared import SharedResults
+from evaldash.snapshot import load_snapshot
+from evaldash.sources import HttpSource, configured_sources, remote_sources
+from evaldash.store import MANIFEST, ResultsStore, is_task_table, wide
+from evaldash.tasktable import TaskView, row_order, wide_table
+
+CACHE_TTL = 60 * 60
+CACHE_MAX_ENTRIES = 256
+BOOTSTRAP_WORKERS = int(os.environ.get("DASHBOARD_BOOTSTRAP_WORKERS", os.cpu_count() or 1))
+SOURCE_WORKERS = int(os.environ.get("DASHBOARD_SOURCE_WORKERS", 16))
+SOURCE_RETRY = float(os.environ.get("DASHBOARD_SOURCE_RETRY", 30))
+
+# RustEvo rates and the per-task success counts they are computed from
+RUSTEVO_COUNTS = {"Pass@1": "Success Count", "API Usage Accuracy": "API Usage True Count"}
+# ... and the per-task flags behind those counts, per task table and setting
+RUSTEVO_FLAGS = {"Pass@1": "Success", "API Usage Accuracy": "API Usage"}
+RUSTEVO_SETTINGS = {"tasks_rq1": "RQ1 (Full Docs)", "tasks_rq3": "RQ3 (Minimal Docs)"}
+INTERVAL_LEVELS = ["Metric", "Setting", "Model", "Baseline"]
+
+
+@st.cache_resource
+def get_store():
+    store = ResultsStore()
+    ensure_seeded(store)
+    return store
+
+
+@st.cache_resource
+def get_bootstrap_pool():
+    """Process pool shared by all sessions for bootstrap jobs; None when disabled."""
+    if BOOTSTRAP_WORKERS <= 1:
+        return None
+    return ProcessPoolExecutor(BOOTSTRAP_WORKERS, mp_context=multiprocessing.get_context("forkserver"))
+
+
+@st.cache_resource
+def get_source_pool():
+    """Thread pool shared by all sessions for fetching result sources."""
+    return ThreadPoolExecutor(SOURCE_WORKERS, thread_name_prefix="evaldash-source")
+
+
+# Store version -> number of retries that loaded a failed source
+_retries = {}
+
+
+def results_version():
+    """Cheap token that changes whenever a run lands in the store or a failed source is loaded."""
+    path = get_store().root / MANIFEST
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = 0
+    return mtime, _retries.get(mtime, 0)
+
+
+def invalidate():
+    """Drop every cached load, e.g. after files were changed behind the manifest."""
+    _shared_slot.clear()
+    _load_cells.clear()
+    _load_models.clear()
+    _load_pass_at_k.clear()
+    _load_aggregates.clear()
+    _load_trend.clear()
+    _load_cube.clear()
+    _load_task_table.clear()
+    _task_order.clear()
+    _load_task_index.clear()
+    _drilldown_order.clear()
+    _load_runs.clear()
+    _load_outcome_bits.clear()
+    _load_run_bits.clear()
+    _load_rustevo_intervals.clear()
+    _load_hs_evals_intervals.clear()
+
+
+def get_shared_results():
+    """The ``SharedResults`` for the current store version."""
+    return _shared_results(results_version())
+
+
+def source_errors(benchmarks=None):
+    """``{benchmark: error}`` of the sources that could not be loaded, limited to ``benchmarks``."""
+    errors = get_shared_results().errors
+    return {b: e for b, e in errors.items() if benchmarks is None or b in benchmarks}
+
+
+def load_cells(benchmark, columns=None, models=None, runs=None, **where):
+    """Load long-format cells; ``where`` maps a column to the values to keep."""
+    where = tuple(sorted((key, _as_tuple(values)) for key, values in where.items()))
+    if runs is None:
+        return get_shared_results().cells(benchmark, columns, _as_tuple(models), where)
+    return _load_cells(
+        benchmark, _as_tuple(columns), _as_tuple(models), _as_tuple(runs), where, results_version()
+    )
+
+
+def load_models(benchmark):
+    if benchmark in remote_sources():
+        return get_shared_results().models(benchmark)
+    return _load_models(benchmark, results_version())
+
+
+def load_table_names(benchmark, models=None):
+    """Names of the tables in the latest runs of ``benchmark``, in stored order."""
+    return get_shared_results().table_names(benchmark, _as_tuple(models))
+
+
+def load_task_view(benchmark, table, models=None, query="", sort=None, descending=False):
+    """A ``TaskView`` of the per-task ``table``, filtered by ``query`` and sorted by ``sort``.
+
+    The wide table and the row order are built once per store version and
+    shared by all sessions; reading a window converts only those rows.
+    """
+    version = results_version()
+    models = _as_tuple(models)
+    return TaskView(
+        _load_task_table(benchmark, table, models, version),
+        _task_order(benchmark, table, models, query, sort, descending, version),
+    )
+
+
+def load_cube():
+    """The ``ResultsCube`` of the latest runs, shared read-only by all sessions."""
+    return _load_cube(results_version())
+
+
+def load_aggregates(metrics, models=None):
+    """Materialized headline ``metrics`` per model (NaN where a model has none)."""
+    return _load_aggregates(tuple(metrics), _as_tuple(models), results_version())
+
+
+def load_trend(metric, grain, models=None):
+    """Rolled-up ``metric`` per ``grain`` bucket (rows, in order) and model (columns).
+
+    Reads the series maintained at ingest time (``evaldash.rollups``), so
+    the cost does not grow with the run history.
+    """
+    return _load_trend(metric, grain, _as_tuple(models), results_version())
+
+
+def load_pass_at_k(benchmark, ks, models=None):
+    """Pass@k (in %) per model, one ``Pass@k`` column per k.
+
+    Models with ingested per-problem samples are scored with the unbiased
+    estimator for any k; the rest fall back to their stored Pass@k values.
+    """
+    return _load_pass_at_k(benchmark, tuple(ks), _as_tuple(models), results_version())
+
+
+def run_ids(benchmark, models=None):
+    """The ``(model, run)`` pairs currently shown for ``benchmark``."""
+    return tuple((model, run) for _, model, run in get_store().partitions(benchmark, models))
+
+
+def load_rustevo_intervals(metrics, pairs=()):
+    """Bootstrap intervals (in %) for RustEvo ``metrics`` per model and setting.
+
+    Each ``(model, baseline)`` in ``pairs`` also gets an interval for the
+    difference between the two, paired on their shared tasks when both runs
+    store per-task outcomes and unpaired from the counts otherwise. Rows are indexed by ``INTERVAL_LEVELS``
+    (``Baseline`` is empty for single models), columns are ``estimate``,
+    ``low`` and ``high``.
+    """
+    return _load_rustevo_intervals(tuple(metrics), tuple(map(tuple, pairs)), run_ids("rustevo"))
+
+
+def load_hs_evals_intervals(headlines):
+    """Bootstrap intervals for HS EVALS ``(task, metric)`` headlines per model.
+
+    Only models with ingested per-item scores get a row.
+    """
+    return _load_hs_evals_intervals(tuple(map(tuple, headlines)), run_ids("hs_evals"))
+
+
+def pass_at_k_options(benchmark, models=None):
+    """Values of k that can be shown for at least one model of ``benchmark``.
+
+    These are the stored ``Pass@k`` columns, plus every k up to the largest
+    number of samples per problem among the runs with per-problem samples.
+    """
+    stored = load_cells(benchmark, columns=["column"], models=models, table="leaderboard")
+    ks = {int(c[len("Pass@"):]) for c in stored["column"] if c.startswith("Pass@")}
+    samples = [bits.samples for bits in _latest_sample_bits(benchmark, models).values()]
+    if samples:
+        ks.update(range(1, max(samples) + 1))
+    return sorted(ks)
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_cells(benchmark, columns, models, runs, where, version):
+    expr = None
+    for key, values in where:
+        clause = ds.field(key).isin(list(values))
+        expr = clause if expr is None else expr & clause
+    return get_store().read(benchmark, models=models, runs=runs, columns=columns, filter=expr)
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_models(benchmark, version):
+    return get_store().models(benchmark)
+
+
+def _shared_results(version):
+    return _shared_slot(version[0]).refresh()
+
+
+class _SharedSlot:
+    """The ``SharedResults`` of one store version, refetching the sources that failed.
+
+    After ``SOURCE_RETRY`` seconds, the first caller fetches the failed
+    sources again while the others keep the results they have. If anything
+    arrives, a new instance replaces the old one; sessions that hold the old
+    instance keep using it.
+    """
+
+    def __init__(self, mtime):
+        self.mtime = mtime
+        self.current = _fetch_shared(get_store())
+        self._fetched = time.monotonic()
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        current = self.current
+        if not current.errors or time.monotonic() - self._fetched < SOURCE_RETRY:
+            return current
+        if not self._lock.acquire(blocking=False):
+            return current
+        try:
+            sources = configured_sources(get_store())
+            retried = SharedResults.from_sources(
+                {b: sources[b] for b in current.errors if b in sources}, get_source_pool()
+            )
+            if retried.benchmarks():
+                self.current = current.updated(retried)
+                _retries[self.mtime] = _retries.get(self.mtime, 0) + 1
+            self._fetched = time.monotonic()
+        finally:
+            self._lock.release()
+        return self.current
+
+
+def _fetch_shared(store):
+    sources = configured_sources(store)
+    snapshot = load_snapshot(store)
+    if snapshot is None:
+        return SharedResults.from_sources(sources, get_source_pool())
+    # The snapshot already holds the local benchmarks, so only result servers are fetched
+    remote = {b: source for b, source in sources.items() if isinstance(source, HttpSource)}
+    return snapshot.updated(SharedResults.from_sources(remote, get_source_pool())) if remote else snapshot
+
+
+# The results and the cube are immutable, so sessions share one instance instead of a copy each
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=2, show_spinner=False))
+def _shared_slot(mtime):
+    return _SharedSlot(mtime)
+
+
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=2, show_spinner=False))
+def _load_cube(version):
+    shared = _shared_results(version)
+    columns = ["benchmark", "model", "table", "row", "column", "value"]
+    # Per-task rows would add one metric per task to every model
+    cells = pd.concat([
+        shared.cells(benchmark, columns, where=[("table", [t for t in shared.table_names(benchmark) if not is_task_table(t)])])
+        for benchmark in shared.benchmarks()
+    ] or [shared.cells(None, columns)], ignore_index=True)
+    return ResultsCube.from_cells(cells)
+
+
+def load_runs(benchmark, model):
+    """Run ids of ``model`` on ``benchmark`` in the order they were written."""
+    return [run for run, _ in _load_runs(benchmark, model, results_version())]
+
+
+def load_outcome_bits(benchmark, model, run):
+    """``{per-task table: OutcomeBits}`` of one run.
+
+    Cached per run, keyed by its write time rather than the store version,
+    so new runs elsewhere never reload it.
+    """
+    created = dict(_load_runs(benchmark, model, results_version())).get(run)
+    return _load_outcome_bits(benchmark, model, run, created)
+
+
+def load_run_bits(benchmark, model, run):
+    """Packed per-task outcomes (``RunBits``) of one run, cached like ``load_outcome_bits``."""
+    created = dict(_load_runs(benchmark, model, results_version())).get(run)
+    return _load_run_bits(benchmark, model, run, created)
+
+
+def load_task_index(benchmark):
+    """The ``TaskIndex`` over every latest-run task of ``benchmark`` (None without per-task results)."""
+    return _load_task_index(benchmark, results_version())
+
+
+def load_drilldown(benchmark, filters=None, category=None, query="", sort=None, descending=False):
+    """A ``TaskView`` of the tasks matching facet ``filters`` and ``category``, then ``query``."""
+    filters = tuple(sorted((facet, _as_tuple(values)) for facet, values in (filters or {}).items()))
+    version = results_version()
+    index = _load_task_index(benchmark, version)
+    return TaskView(index.table, _drilldown_order(benchmark, filters, category, query, sort, descending, version))
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_runs(benchmark, model, version):
+    return [
+        (r["run"], r.get("created")) for r in get_store().manifest()
+        if r["benchmark"] == benchmark and r["model"] == model
+    ]
+
+
+# A few KB per run, so many runs can stay resident for adjacent-pair diffs
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=4096, show_spinner=False))
+def _load_outcome_bits(benchmark, model, run, created):
+    stored = get_store().read_bits(benchmark, model, run)
+    if stored:
+        return stored
+    # Runs ingested before outcome bits were stored only have per-task cells
+    cells = get_store().read_table(
+        benchmark, models=model, runs=run,
+        columns=["model", "table", "row", "column", "value", "display"],
+        filter=ds.field("table").isin(list(SPLITS.get(benchmark, {}))),
+    )
+    return outcome_bits(benchmark, cells) if cells is not None else {}
+
+
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=4096, show_spinner=False))
+def _load_run_bits(benchmark, model, run, created):
+    return RunBits.from_outcomes(benchmark, _load_outcome_bits(benchmark, model, run, created))
+
+
+def _latest_sample_bits(benchmark, models=None):
+    """``samples`` outcome bits of the latest run per model, for models that have them."""
+    latest = {model: load_outcome_bits(benchmark, model, run) for model, run in run_ids(benchmark, models)}
+    return {model: tables["samples"] for model, tables in latest.items() if "samples" in tables}
+
+
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=8, show_spinner=False))
+def _load_task_table(benchmark, table, models, version):
+    cells = _shared_results(version).select(
+        benchmark, ["model", "row", "column", "value", "display"], models, [("table", (table,))]
+    )
+    return wide_table(cells)
+
+
+# One index array per view; a 1M-row order is 8 MB, so only a few are kept
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=16, show_spinner=False))
+def _task_order(benchmark, table, models, query, sort, descending, version):
+    return row_order(_load_task_table(benchmark, table, models, version), query, sort, descending)
+
+
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=8, show_spinner=False))
+def _load_task_index(benchmark, version):
+    names = _shared_results(version).table_names(benchmark)
+    tables = {
+        table: (_load_task_table(benchmark, table, None, version), constants)
+        for table, constants in TASK_TABLES.get(benchmark, {}).items()
+        if table in names
+    }
+    if not tables:
+        return None
+    return TaskIndex(explorer_table(tables), FACETS[benchmark], CATEGORIES[benchmark])
+
+
+@cached(st.cache_resource(ttl=CACHE_TTL, max_entries=16, show_spinner=False))
+def _drilldown_order(benchmark, filters, category, query, sort, descending, version):
+    index = _load_task_index(benchmark, version)
+    rows = index.rows(dict(filters), category)
+    return row_order(index.table, query, sort, descending, None if rows is None else pa.array(rows))
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_aggregates(metrics, models, version):
+    entries = pd.DataFrame(
+        get_store().aggregate_table().entries(), columns=["benchmark", "model", "metric", "sum", "count", "run"]
+    )
+    entries = entries[entries["metric"].isin(metrics)]
+    entries = entries.assign(value=entries["sum"] / entries["count"])
+    table = wide(entries, "model", "metric", values="value")
+    table = table.reindex(index=list(models) if models is not None else table.index, columns=list(metrics))
+    table.index.name = "Model"
+    return table
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_trend(metric, grain, models, version):
+    series = pd.DataFrame(get_store().rollup_table().series(metric, grain), columns=["model", "bucket", "value", "runs"])
+    table = wide(series, "bucket", "model", values="value")
+    if models is not None:
+        table = table.reindex(columns=[m for m in models if m in table.columns])
+    table.index.name = "Bucket"
+    return table
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_pass_at_k(benchmark, ks, models, version):
+    columns = [f"Pass@{k}" for k in ks]
+    stored = load_cells(benchmark, columns=["model", "column", "value"], models=models, table="leaderboard")
+    table = wide(stored, "model", "column", values="value").reindex(columns=columns)
+    table.index.name = "Model"
+
+    samples = _latest_sample_bits(benchmark, models)
+    if samples:
+        computed = grouped_pass_at_k(
+            np.concatenate([bits.n for bits in samples.values()]),
+            np.concatenate([bits.counts() for bits in samples.values()]),
+            np.repeat(list(samples), [len(bits) for bits in samples.values()]),
+            ks,
+        )
+        table.loc[computed.index, columns] = computed[columns]
+    return table
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_rustevo_intervals(metrics, pairs, runs):
+    cells = load_cells(
+        "rustevo",
+        columns=["model", "row", "column", "value"],
+        models=[model for model, _ in runs],
+        table="summary",
+        row=["Total Tasks"] + [RUSTEVO_COUNTS[m] for m in metrics],
+    )
+    counts = cells.set_index(["model", "column", "row"])["value"]
+    # (metric, setting, model) -> (sorted task ids, or None when only counts are stored; 0/1 outcomes)
+    outcomes = {}
+    for (model, setting, row), successes in counts.items():
+        metric = next((m for m in metrics if RUSTEVO_COUNTS[m] == row), None)
+        if metric is not None:
+            outcomes[metric, setting, model] = (None, binary_outcomes(successes, counts[model, setting, "Total Tasks"]))
+    for model, run in runs:
+        stored = load_outcome_bits("rustevo", model, run)
+        for table, setting in RUSTEVO_SETTINGS.items():
+            for metric in metrics:
+                if table in stored and RUSTEVO_FLAGS[metric] in stored[table].outcomes:
+                    bits = stored[table]
+                    outcomes[metric, setting, model] = (bits.ids, bits.counts(RUSTEVO_FLAGS[metric]))
+
+    samples = {(metric, setting, model, ""): values for (metric, setting, model), (_, values) in outcomes.items()}
+    differences, aligned = {}, {}
+    for (metric, setting, a), (ids_a, values_a) in outcomes.items():
+        for model, b in pairs:
+            if model != a or (metric, setting, b) not in outcomes:
+                continue
+            key = (metric, setting, a, b)
+            ids_b, values_b = outcomes[metric, setting, b]
+            if ids_a is None or ids_b is None:
+                # A run with counts only cannot be aligned by task: unpaired
+                differences[key] = ((metric, setting, a, ""), (metric, setting, b, ""), False)
+                continue
+            # Paired on the tasks both runs have
+            _, at_a, at_b = np.intersect1d(ids_a, ids_b, assume_unique=True, return_indices=True)
+            aligned[key, a], aligned[key, b] = values_a[at_a], values_b[at_b]
+            differences[key] = ((key, a), (key, b), True)
+    intervals = confidence_intervals({**samples, **aligned}, differences, executor=get_bootstrap_pool())
+    return _interval_frame({key: value for key, value in intervals.items() if key not in aligned}, scale=100)
+
+
+@cached(st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False))
+def _load_hs_evals_intervals(headlines, runs):
+    scores = load_cells(
+        "hs_evals",
+        columns=["model", "table", "row", "column", "value"],
+        models=[model for model, _ in runs],
+        table=[f"{task}_scores" for task, _ in headlines],
+        column=[metric for _, metric in headlines],
+    )
+    samples = {}
+    for (table, metric, model), items in scores.groupby(["table", "column", "model"], sort=False):
+        task = table[: -len("_scores")]
+        if (task, metric) in headlines:
+            samples[metric, task, model, ""] = items["value"].to_numpy()
+    return _interval_frame(confidence_intervals(samples, executor=get_bootstrap_pool()))
+
+
+def _interval_frame(results, scale=1):
+    if results:
+        index = pd.MultiIndex.from_tuples(list(results), names=INTERVAL_LEVELS)
+    else:
+        index = pd.MultiIndex.from_arrays([[]] * len(INTERVAL_LEVELS), names=INTERVAL_LEVELS)
+    return pd.DataFrame(list(results.values()), index=index, columns=["estimate", "low", "high"]) * scale
+
+
+def _as_tuple(values):
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return (values,)
+    return tuple(values)
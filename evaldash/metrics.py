@@ -0,0 +1,100 @@
+"""Typed metric values: a number, a unit and an optional denominator.
+
+Every numeric cell in the store keeps its value as a float with a unit:
+
+- ``""``: a plain count or score;
+- ``"%"``: percentage points (``31.8`` is 31.8%);
+- ``"min"``: minutes;
+- ``"$"``: US dollars.
+
+A ratio such as ``405/450`` keeps its numerator as the value and ``450`` as
+the denominator. A ratio with unit ``"%"`` (``54.5% (61/112)``) is shown as
+the percentage of its numerator over its denominator. Formatting happens
+only when a table is drawn, via ``number_format`` and ``format_shown``. The
+tables stay numeric, so they go to the browser as Arrow numbers and can feed
+charts and aggregates without parsing.
+
+``parse_metric`` turns the formatted strings the dashboard used to store
+(and that old stores and result servers may still hold) into typed values.
+"""
+import math
+import re
+
+_NUMBER = r"-?\d+(?:\.\d+)?"
+_PATTERNS = [
+    # 54.5% (61/112)
+    (re.compile(rf"^{_NUMBER}%\s*\(({_NUMBER})/({_NUMBER})\)$"), lambda m: (float(m[1]), "%", float(m[2]))),
+    # 405/450
+    (re.compile(rf"^({_NUMBER})/({_NUMBER})$"), lambda m: (float(m[1]), "", float(m[2]))),
+    # 31.80%
+    (re.compile(rf"^({_NUMBER})\s*%$"), lambda m: (float(m[1]), "%", math.nan)),
+    # 1.6 minutes
+    (re.compile(rf"^({_NUMBER})\s*min(?:ute)?s?$"), lambda m: (float(m[1]), "min", math.nan)),
+    # $0.00
+    (re.compile(rf"^\$({_NUMBER})$"), lambda m: (float(m[1]), "$", math.nan)),
+    # 112
+    (re.compile(rf"^({_NUMBER})$"), lambda m: (float(m[1]), "", math.nan)),
+]
+
+
+def parse_metric(value):
+    """``(value, unit, denominator, text)`` of a seed value or a legacy display string.
+
+    Numbers and formatted numbers give an empty ``text``. Anything else (a
+    label such as a change type) is kept as ``text`` with a NaN value.
+    """
+    if not isinstance(value, str):
+        return float(value), "", math.nan, ""
+    stripped = value.strip()
+    for pattern, typed in _PATTERNS:
+        match = pattern.match(stripped)
+        if match:
+            return (*typed(match), "")
+    return math.nan, "", math.nan, value
+
+
+def metric_value(value, unit, denominator):
+    """The number a cell stands for: the percentage of a ``%`` ratio, otherwise ``value``."""
+    if unit == "%" and denominator == denominator and denominator is not None:
+        return 100.0 * value / denominator if denominator else math.nan
+    return value
+
+
+def unit_label(unit, denominator):
+    """Short label of a unit and denominator: ``'%'``, ``'of 450'``, ``'% of 112'``."""
+    if denominator != denominator or denominator is None:
+        return unit
+    base = f"of {denominator:g}"
+    return f"{unit} {base}" if unit else base
+
+
+def number_format(unit, denominator):
+    """printf-style format for a column of one unit (None keeps the default)."""
+    if unit == "%":
+        return "%.2f%%"
+    if unit == "min":
+        return "%.1f min"
+    if unit == "$":
+        return "$%.2f"
+    if denominator == denominator and denominator is not None:
+        return f"%d/{denominator:g}"
+    return None
+
+
+def format_metric(value, unit, denominator):
+    """One cell as text, for places that can't format a number column."""
+    if value != value:
+        return ""
+    shown = metric_value(value, unit, denominator)
+    fmt = number_format(unit, denominator)
+    text = fmt % shown if fmt else (f"{shown:g}" if not float(shown).is_integer() else f"{int(shown)}")
+    if unit == "%" and denominator == denominator and denominator is not None:
+        text += f" ({value:g}/{denominator:g})"
+    return text
+
+
+def format_shown(shown, unit, denominator):
+    """A table cell holding ``metric_value`` (the percentage, for a ``%`` ratio) as text."""
+    if unit == "%" and denominator == denominator and denominator is not None:
+        shown = shown * denominator / 100.0
+    return format_metric(shown, unit, denominator)
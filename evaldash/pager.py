@@ -0,0 +1,53 @@
+"""Paginated per-task tables.
+
+``st.dataframe`` ships its whole frame to the browser, which is fine for a
+metric table but not for thousands of per-task rows. ``paged_table`` keeps
+filtering, sorting and paging on the server (see ``evaldash.tasktable``)
+and sends only the visible page, so moving through a million-row task log
+costs one window conversion per rerun. Static builds (``evaldash.static``)
+can't page, so they get the whole table.
+"""
+from functools import partial
+
+import streamlit as st
+
+from evaldash.loaders import load_task_view
+from evaldash.tables import show_table
+from evaldash.tabs import static_build
+
+PAGE_SIZES = [25, 50, 100, 500]
+AS_STORED = "(as stored)"
+
+
+def paged_table(benchmark, table, key, models=None):
+    """Render the per-task ``table`` of ``benchmark`` with filter, sort and page controls."""
+    paged_view(partial(load_task_view, benchmark, table, models), key)
+
+
+def paged_view(load_view, key):
+    """Render the ``TaskView`` returned by ``load_view(query, sort, descending)`` one page at a time."""
+    if static_build():
+        view = load_view()
+        show_table(view.window(0, len(view)), use_container_width=True, hide_index=True)
+        return
+    columns = load_view().columns
+    query_col, sort_col, order_col, size_col = st.columns([3, 2, 1, 1])
+    query = query_col.text_input("Filter", key=f"{key}_query", placeholder="Task, model or any text column")
+    sort = sort_col.selectbox("Sort by", [AS_STORED] + columns, key=f"{key}_sort")
+    descending = order_col.checkbox("Descending", key=f"{key}_descending")
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_size")
+
+    view = load_view(query.strip(), None if sort == AS_STORED else sort, descending)
+    pages = max(1, -(-len(view) // page_size))
+    page_key = f"{key}_page"
+    # A narrower filter can leave the remembered page past the end
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    offset = (page - 1) * page_size
+    show_table(view.window(offset, page_size), use_container_width=True, hide_index=True)
+    if len(view):
+        st.caption(f"Rows {offset + 1:,}–{min(offset + page_size, len(view)):,} of {len(view):,}")
+    else:
+        st.caption("No matching rows")
@@ -0,0 +1,59 @@
+"""Vectorized unbiased pass@k.
+
+For a problem with ``n`` samples of which ``c`` pass, the unbiased estimator
+is ``1 - C(n - c, k) / C(n, k)``. The ratio is evaluated in log space as
+``sum(log1p(-k / i) for i in n-c+1..n)`` using one prefix-sum table per
+``k``, so millions of problems are scored with a handful of array
+operations and no overflow from the binomials.
+"""
+import numpy as np
+import pandas as pd
+
+
+def pass_at_k(n, c, k):
+    """Per-problem pass@k for arrays ``n`` and ``c`` of any (matching) shape.
+
+    Problems with fewer than ``k`` samples get NaN.
+    """
+    n = np.asarray(n, dtype=np.int64)
+    c = np.asarray(c, dtype=np.int64)
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    if np.any(c > n) or np.any(c < 0):
+        raise ValueError("need 0 <= c <= n for every problem")
+
+    out = np.full(n.shape, np.nan)
+    valid = n >= k
+    # All-but-k failures means at least one of any k draws passes
+    certain = valid & (n - c < k)
+    out[certain] = 1.0
+
+    rest = valid & ~certain
+    if rest.any():
+        top = int(n[rest].max())
+        # prefix[m] = sum_{i=k+1}^{m} log1p(-k / i), zero for m <= k
+        i = np.arange(k + 1, top + 1, dtype=np.float64)
+        prefix = np.zeros(top + 1)
+        prefix[k + 1:] = np.cumsum(np.log1p(-k / i))
+        log_fail = prefix[n[rest]] - prefix[n[rest] - c[rest]]
+        out[rest] = -np.expm1(log_fail)
+    return out
+
+
+def grouped_pass_at_k(n, c, groups, ks):
+    """Mean pass@k per group for each ``k`` in ``ks``.
+
+    ``groups`` labels every problem (e.g. by model or run); the result has
+    one row per group and one ``Pass@k`` column per ``k``.
+    """
+    codes, labels = pd.factorize(pd.Series(groups), sort=False)
+    result = {}
+    for k in ks:
+        scores = pass_at_k(n, c, k)
+        ok = ~np.isnan(scores)
+        totals = np.bincount(codes[ok], weights=scores[ok], minlength=len(labels))
+        counts = np.bincount(codes[ok], minlength=len(labels))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[f"Pass@{k}"] = 100.0 * totals / counts
+    return pd.DataFrame(result, index=pd.Index(labels, name="Model"))
+
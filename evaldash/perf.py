@@ -0,0 +1,227 @@
+"""Optional per-rerun performance instrumentation.
+
+Off by default. Set ``DASHBOARD_PERF=1`` to turn it on for every session,
+or open the dashboard with ``?perf=1`` to turn it on for one session. While
+it is on, each rerun records:
+
+- the time spent rendering the selected page, and importing it the first time;
+- every DataFrame build (``wide``, ``table_view``, ``wide_table``);
+- every figure lookup (built, or served from the figure cache);
+- every chart and table sent to the browser, with its size in bytes;
+- every cached loader call, and whether it was a cache hit.
+
+``panel`` shows the last rerun in a sidebar "Perf" expander and offers it as
+JSON (``report``) for monitoring. The recorder lives in a thread-local that
+``start`` sets at the top of every rerun (a session's script and its cache
+misses run on one thread). When instrumentation is off, each hook costs an
+attribute lookup. The hooks don't import Streamlit, so the store and the
+ingest CLI can use them without loading it.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PERF_ENV = "DASHBOARD_PERF"
+QUERY_PARAM = "perf"
+KINDS = ["page", "import", "load", "frame", "figure", "chart", "table"]
+
+_local = threading.local()
+
+
+class Recorder:
+    """The events of one rerun: ``{"kind", "name", "ms", ["hit"], ["bytes"], ["nested"]}`` in the order they ended.
+
+    An event inside another of the same kind (``wide`` called by
+    ``table_view``, a load on another load's miss) is marked ``nested`` and
+    left out of the per-kind totals, which would otherwise count it twice.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.events = []
+        # Events of the cached loads in progress, innermost last
+        self.loading = []
+        self.open = {}  # kind -> spans of that kind in progress
+        self._t0 = time.perf_counter()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self._t0) * 1000
+
+    def summary(self):
+        """Calls, total and max milliseconds, hits and bytes per ``(kind, name)``, slowest first."""
+        groups = {}
+        for event in self.events:
+            group = groups.setdefault((event["kind"], event["name"]), {
+                "kind": event["kind"], "name": event["name"], "calls": 0, "ms": 0.0, "max_ms": 0.0,
+            })
+            group["calls"] += 1
+            group["ms"] += event["ms"]
+            group["max_ms"] = max(group["max_ms"], event["ms"])
+            if "hit" in event:
+                group["hits"] = group.get("hits", 0) + event["hit"]
+            if "bytes" in event:
+                group["bytes"] = group.get("bytes", 0) + event["bytes"]
+        return sorted(groups.values(), key=lambda group: -group["ms"])
+
+    def cache_hit_rates(self):
+        """``{kind: (hits, lookups)}`` of the loader and figure caches."""
+        rates = {}
+        for event in self.events:
+            if "hit" in event:
+                hits, lookups = rates.get(event["kind"], (0, 0))
+                rates[event["kind"]] = (hits + event["hit"], lookups + 1)
+        return rates
+
+    def report(self):
+        """JSON-serializable summary of the rerun."""
+        pages = [e["name"] for e in self.events if e["kind"] == "page"]
+        return {
+            "page": pages[-1] if pages else None,
+            "started": self.started,
+            "rerun_ms": round(self.elapsed_ms(), 3),
+            "totals_ms": {
+                kind: round(sum(e["ms"] for e in self.events if e["kind"] == kind and not e.get("nested")), 3)
+                for kind in KINDS
+            },
+            "payload_bytes": sum(e.get("bytes", 0) for e in self.events),
+            "cache_hit_rates": {
+                kind: hits / lookups for kind, (hits, lookups) in self.cache_hit_rates().items()
+            },
+            "summary": [{**group, "ms": round(group["ms"], 3), "max_ms": round(group["max_ms"], 3)}
+                        for group in self.summary()],
+            "events": self.events,
+        }
+
+
+def start():
+    """Begin recording this rerun if instrumentation is on; call once at the top of the script."""
+    import streamlit as st
+
+    enabled = os.environ.get(PERF_ENV) == "1" or st.query_params.get(QUERY_PARAM) in ("1", "true")
+    _local.recorder = Recorder() if enabled else None
+
+
+def recorder():
+    """The current rerun's ``Recorder``, or None when instrumentation is off or outside a script run."""
+    return getattr(_local, "recorder", None)
+
+
+@contextmanager
+def span(kind, name):
+    """Time the block as one ``kind`` event; yields the event dict (None when off) to add fields to."""
+    rec = recorder()
+    if rec is None:
+        yield None
+        return
+    event = {"kind": kind, "name": name}
+    if rec.open.get(kind):
+        event["nested"] = True
+    rec.open[kind] = rec.open.get(kind, 0) + 1
+    t = time.perf_counter()
+    try:
+        yield event
+    finally:
+        event["ms"] = (time.perf_counter() - t) * 1000
+        rec.open[kind] -= 1
+        rec.events.append(event)
+
+
+def timed(kind):
+    """Decorator recording each call as a ``kind`` event named after the function and its caller."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if recorder() is None:
+                return fn(*args, **kwargs)
+            with span(kind, f"{fn.__name__} @ {_site(2)}"):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def cached(cache):
+    """Apply the Streamlit cache decorator ``cache`` and record each call as a ``load`` event with its hit flag."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def body(*args, **kwargs):
+            # Runs only on a miss, inside the call whose event is on top of the stack
+            rec = recorder()
+            if rec is not None and rec.loading:
+                rec.loading[-1]["hit"] = False
+            return fn(*args, **kwargs)
+
+        cached_fn = cache(body)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            rec = recorder()
+            if rec is None:
+                return cached_fn(*args, **kwargs)
+            with span("load", fn.__name__) as event:
+                event["hit"] = True
+                rec.loading.append(event)
+                try:
+                    return cached_fn(*args, **kwargs)
+                finally:
+                    rec.loading.pop()
+
+        wrapper.clear = cached_fn.clear
+        return wrapper
+    return decorate
+
+
+def show_table(data, **kwargs):
+    """``st.dataframe``, recorded as a ``table`` event with the Arrow bytes it sends."""
+    import streamlit as st
+
+    rec = recorder()
+    if rec is None:
+        st.dataframe(data, **kwargs)
+        return
+    with span("table", _site(3)) as event:
+        st.dataframe(data, **kwargs)
+        event["bytes"] = _arrow_bytes(data)
+
+
+def panel():
+    """Sidebar "Perf" expander for the current rerun; call once at the end of the script."""
+    import streamlit as st
+
+    rec = recorder()
+    if rec is None:
+        return
+    report = rec.report()
+    with st.sidebar.expander("⏱️ Perf", expanded=True):
+        st.metric("Rerun", f"{report['rerun_ms']:.0f} ms")
+        st.caption(" · ".join(f"{kind} {ms:.0f} ms" for kind, ms in report["totals_ms"].items() if ms))
+        st.caption(f"Payload {report['payload_bytes'] / 1024:.1f} KiB (charts and tables)")
+        for kind, (hits, lookups) in rec.cache_hit_rates().items():
+            st.caption(f"{kind} cache: {hits}/{lookups} hits ({hits / lookups:.0%})")
+        st.dataframe(
+            [{k: group.get(k) for k in ("kind", "name", "calls", "ms", "hits", "bytes")} for group in report["summary"]],
+            hide_index=True,
+            column_config={"ms": st.column_config.NumberColumn(format="%.1f")},
+        )
+        st.download_button(
+            "Export JSON", json.dumps(report, indent=1), file_name="perf.json", mime="application/json",
+            on_click="ignore",
+        )
+
+
+def _site(depth):
+    """``module:line`` of the caller ``depth`` frames up."""
+    frame = sys._getframe(depth)
+    return f"{frame.f_globals.get('__name__', '?').rsplit('.', 1)[-1]}:{frame.f_lineno}"
+
+
+def _arrow_bytes(data):
+    from streamlit import dataframe_util
+
+    try:
+        return len(dataframe_util.convert_anything_to_arrow_bytes(data))
+    except Exception:
+        return 0
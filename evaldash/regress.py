@@ -0,0 +1,168 @@
+"""Run-over-run regression detection on per-task outcomes.
+
+Every run's per-task outcomes (``evaldash.bitset``) are turned once into a
+``RunBits``: task ids in sorted order and one packed bit per task and
+outcome, e.g. RustEvo ``Success`` or ``Borrow Checker Failure`` per RQ, SWE
+``Resolved`` or the ARCHIT/HumanEval ``Solved`` (at least one passing
+sample). Runs ingested before outcome bits were stored are converted from
+their per-task tables. Diffing
+two runs is then a handful of bitwise operations and popcounts per outcome:
+``~a & b`` gained, ``a & ~b`` lost. Runs are cached individually, so
+comparing adjacent or selected pairs out of thousands of runs only builds
+the runs involved.
+
+Significance uses McNemar's test on the discordant tasks (exact binomial
+below 25 of them, chi-square with continuity correction above).
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+from evaldash.bitset import PASSED, OutcomeBits, overlap, popcount
+from evaldash.tasktable import wide_table
+
+# benchmark -> {per-task table: setting label}
+SPLITS = {
+    "rustevo": {"tasks_rq1": "RQ1", "tasks_rq3": "RQ3"},
+    "swe": {"tasks": ""},
+    "archit": {"samples": ""},
+    "humaneval": {"samples": ""},
+}
+# The outcome that counts as "passing" for newly passing / newly failing lists
+PASS_OUTCOME = {"rustevo": "Success", "swe": "Resolved", "archit": "Solved", "humaneval": "Solved"}
+ALPHA = 0.05
+EXACT_BELOW = 25
+
+
+class RunBits:
+    """Packed per-task outcomes of one run: ``{setting: (task ids, {outcome: bits})}``."""
+
+    def __init__(self, splits):
+        self.splits = splits
+
+    @classmethod
+    def from_outcomes(cls, benchmark, tables):
+        """Build from one run's ``{per-task table: OutcomeBits}``."""
+        splits = {}
+        for table, setting in SPLITS.get(benchmark, {}).items():
+            if table not in tables:
+                continue
+            outcomes = tables[table]
+            bits = {name: outcomes.any(name) for name in outcomes.outcomes if name != PASSED}
+            if PASSED in outcomes.outcomes:
+                bits["Solved"] = outcomes.any(PASSED)
+            splits[setting] = (outcomes.ids, bits)
+        return cls(splits)
+
+
+def outcome_bits(benchmark, cells):
+    """``{per-task table: OutcomeBits}`` from the long-format task cells of one run."""
+    tables = {}
+    for table in SPLITS.get(benchmark, {}):
+        wide = wide_table(cells.filter(pc.equal(cells["table"], table)))
+        if wide.num_rows == 0:
+            continue
+        ids = wide["Task"].to_pylist()
+        if table == "samples":
+            n, c = (np.nan_to_num(wide[name].to_numpy(zero_copy_only=False)).astype(np.int64) for name in ("n", "c"))
+            tables[table] = OutcomeBits.from_counts(ids, n, c)
+        else:
+            flags = {
+                name: _flags(wide[name])
+                for name, kind in zip(wide.column_names, wide.schema.types)
+                if str(kind) == "bool"
+            }
+            tables[table] = OutcomeBits.from_flags(ids, flags)
+    return tables
+
+
+def mcnemar(gained, lost):
+    """Two-sided McNemar p-value for ``gained`` vs ``lost`` discordant tasks."""
+    n = gained + lost
+    if n == 0:
+        return 1.0
+    if n < EXACT_BELOW:
+        tail = sum(math.comb(n, i) for i in range(min(gained, lost) + 1)) / 2 ** n
+        return min(1.0, 2 * tail)
+    chi2 = (abs(gained - lost) - 1) ** 2 / n
+    return math.erfc(math.sqrt(chi2 / 2))
+
+
+def align(a, b, setting):
+    """Bits of both runs restricted to the tasks they share, plus the shared task ids."""
+    ids_a, bits_a = a.splits[setting]
+    ids_b, bits_b = b.splits[setting]
+    if len(ids_a) == len(ids_b) and np.array_equal(ids_a, ids_b):
+        return bits_a, bits_b, ids_a
+    shared, at_a, at_b = np.intersect1d(ids_a, ids_b, assume_unique=True, return_indices=True)
+
+    def pick(bits, at, n):
+        return {name: np.packbits(np.unpackbits(packed, count=n)[at]) for name, packed in bits.items()}
+
+    return pick(bits_a, at_a, len(ids_a)), pick(bits_b, at_b, len(ids_b)), shared
+
+
+DIFF_COLUMNS = ["Setting", "Outcome", "Tasks", "Baseline", "Candidate", "Gained", "Lost", "McNemar p", "Significant"]
+
+
+def diff_runs(a, b, alpha=ALPHA, outcomes=None):
+    """One row per setting and outcome comparing baseline run ``a`` with candidate ``b``."""
+    return pd.DataFrame(_diff_rows(a, b, alpha, outcomes), columns=DIFF_COLUMNS)
+
+
+def adjacent_diffs(runs, bits, outcome, alpha=ALPHA):
+    """``outcome`` diffs of every consecutive pair in ``runs`` (with their ``RunBits``)."""
+    rows = [
+        {"From run": before, "To run": after, **row}
+        for before, after, a, b in zip(runs, runs[1:], bits, bits[1:])
+        for row in _diff_rows(a, b, alpha, [outcome])
+    ]
+    columns = ["From run", "To run"] + [c for c in DIFF_COLUMNS if c != "Outcome"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _diff_rows(a, b, alpha, outcomes):
+    for setting in [s for s in a.splits if s in b.splits]:
+        bits_a, bits_b, shared = align(a, b, setting)
+        for outcome in [o for o in bits_a if o in bits_b and (outcomes is None or o in outcomes)]:
+            x, y = bits_a[outcome], bits_b[outcome]
+            gained, lost = int(popcount(~x & y)), int(popcount(x & ~y))
+            p = mcnemar(gained, lost)
+            yield {
+                "Setting": setting,
+                "Outcome": outcome,
+                "Tasks": len(shared),
+                "Baseline": int(popcount(x)),
+                "Candidate": int(popcount(y)),
+                "Gained": gained,
+                "Lost": lost,
+                "McNemar p": p,
+                "Significant": p < alpha,
+            }
+
+
+def run_overlap(a, b, outcome):
+    """Tasks with ``outcome`` in both runs, only one of them or neither, per shared setting."""
+    rows = []
+    for setting in [s for s in a.splits if s in b.splits]:
+        bits_a, bits_b, shared = align(a, b, setting)
+        if outcome in bits_a and outcome in bits_b:
+            sizes = overlap(bits_a[outcome], bits_b[outcome], len(shared))
+            rows.append({"Setting": setting, "Tasks": len(shared), **sizes})
+    return pd.DataFrame(rows, columns=["Setting", "Tasks", "Both", "Only A", "Only B", "Neither"])
+
+
+def changed_tasks(a, b, setting, outcome):
+    """``(newly set, newly cleared)`` task ids of ``outcome`` from ``a`` to ``b``."""
+    bits_a, bits_b, shared = align(a, b, setting)
+    x, y = bits_a[outcome], bits_b[outcome]
+    n = len(shared)
+    gained = np.unpackbits(~x & y, count=n).astype(bool)
+    lost = np.unpackbits(x & ~y, count=n).astype(bool)
+    return shared[gained], shared[lost]
+
+
+def _flags(column):
+    return np.asarray(column.fill_null(False).to_numpy(zero_copy_only=False), dtype=bool)
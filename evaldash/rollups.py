@@ -0,0 +1,124 @@
+"""Incrementally maintained trend rollups.
+
+The trend charts show the headline metrics of ``evaldash.aggregates`` over
+time: per day, per week (starting Monday) and per training checkpoint. The
+store keeps one entry per ``(benchmark, model, metric, grain, bucket)``
+under ``rollups/``, one JSON file per benchmark and model. Each entry holds
+the partial sum and task count of every run folded into it. Writing a run
+rewrites only its model's file: the run's partials go into its buckets,
+after dropping whatever that run contributed before. A trend chart then
+reads finished series and never scans the run history.
+
+A bucket's value is the task-weighted mean of its runs, like the
+aggregates.
+"""
+import json
+import os
+import re
+from datetime import date, timedelta
+from urllib.parse import quote
+
+from evaldash.aggregates import METRICS, partials
+
+ROLLUPS = "rollups"
+GRAINS = ["day", "week", "checkpoint"]
+
+
+def run_date(run, created=None, day=None):
+    """The ISO date a run is rolled up under.
+
+    This is ``day`` when given. Otherwise it is the run id when that is an
+    ISO date, else the day the run was written.
+    """
+    for value in (day, run, created):
+        if value:
+            try:
+                return date.fromisoformat(str(value)[:10]).isoformat()
+            except ValueError:
+                continue
+    return date.today().isoformat()
+
+
+def buckets(day, checkpoint=None):
+    """``{grain: bucket}`` of a run dated ``day`` (ISO) at ``checkpoint``."""
+    start = date.fromisoformat(day)
+    monday = start - timedelta(days=start.weekday())
+    out = {"day": day, "week": monday.isoformat()}
+    if checkpoint is not None:
+        out["checkpoint"] = str(checkpoint)
+    return out
+
+
+def bucket_order(grain, bucket):
+    """Sort key: dates sort as text, checkpoints by their numbers (``step-900`` before ``step-1200``)."""
+    if grain != "checkpoint":
+        return [bucket]
+    return [(0, int(part)) if part.isdigit() else (1, part) for part in re.split(r"(\d+)", bucket)]
+
+
+class RollupTable:
+    """``(benchmark, model, metric, grain, bucket) -> {run: (sum, count)}`` persisted next to the manifest."""
+
+    def __init__(self, root):
+        self.root = os.path.join(root, ROLLUPS)
+
+    def exists(self):
+        return os.path.isdir(self.root)
+
+    def entries(self, benchmark=None):
+        if not self.exists():
+            return []
+        benchmarks = [quote(benchmark, safe="")] if benchmark is not None else sorted(os.listdir(self.root))
+        out = []
+        for name in benchmarks:
+            folder = os.path.join(self.root, name)
+            for file in sorted(os.listdir(folder)) if os.path.isdir(folder) else ():
+                out += self._read(os.path.join(folder, file))
+        return out
+
+    def update(self, benchmark, model, run, cells, day, checkpoint=None):
+        """Fold one run into its buckets, replacing its earlier contribution if it was written before."""
+        path = self._path(benchmark, model)
+        entries = {(e["metric"], e["grain"], e["bucket"]): e for e in self._read(path)}
+        for e in entries.values():
+            e["runs"].pop(run, None)
+        for metric, (s, n) in partials(benchmark, cells).items():
+            for grain, bucket in buckets(day, checkpoint).items():
+                e = entries.setdefault((metric, grain, bucket), {
+                    "benchmark": benchmark, "model": model, "metric": metric, "grain": grain, "bucket": bucket,
+                    "runs": {},
+                })
+                e["runs"][run] = [s, n]
+        kept = []
+        for e in entries.values():
+            if e["runs"]:
+                e["sum"] = sum(s for s, _ in e["runs"].values())
+                e["count"] = sum(n for _, n in e["runs"].values())
+                kept.append(e)
+        self._write(path, kept)
+
+    def series(self, metric, grain):
+        """``(model, bucket, value, runs)`` per bucket of ``metric`` at ``grain``, buckets in order."""
+        rows = [
+            (e["model"], e["bucket"], e["sum"] / e["count"], len(e["runs"]))
+            for e in self.entries(METRICS[metric][0]) if e["metric"] == metric and e["grain"] == grain
+        ]
+        return sorted(rows, key=lambda row: bucket_order(grain, row[1]))
+
+    def _path(self, benchmark, model):
+        return os.path.join(self.root, quote(benchmark, safe=""), quote(model, safe="") + ".json")
+
+    @staticmethod
+    def _read(path):
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return json.load(f)["entries"]
+
+    @staticmethod
+    def _write(path, entries):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(json.dumps({"entries": entries}))
+        os.replace(tmp, path)
@@ -0,0 +1,201 @@
+"""Baseline results that used to be hardcoded in dashboard.py.
+
+These are written to the results store on first start so a fresh checkout
+renders the same numbers as before; new runs are added on top of them.
+"""
+import pandas as pd
+
+from evaldash.metrics import parse_metric
+from evaldash.store import SCHEMA
+
+SEED_RUN = "baseline"
+
+ARCHIT_COLUMNS = ['Total Examples', 'Successful Predictions', 'Error Rate', 'Pass@1', 'Pass@3', 'Pass@8']
+ARCHIT = {
+    'kat-dev-hs-32b': [300, 300, '0.00%', '32.00%', '55.33%', '75.33%'],
+    'kat-dev-base-32b': [300, 300, '0.00%', '15.67%', '23.33%', '27.33%'],
+    'kat-dev-hs-72b': [100, 94, '6.00%', '42.55%', '61.70%', '74.47%'],
+    'kat-dev-base-72b': [100, 88, '12.00%', '13.64%', '17.05%', '22.73%'],
+    'Claude Sonnet 4.5': [100, 100, '0.00%', '54.00%', '62.00%', '68.00%'],
+}
+
+HUMANEVAL_COLUMNS = ['Pass@1', 'Pass@10']
+HUMANEVAL = {
+    'Kawai-pilot 32B FT': ['30.90%', '57.69%'],
+    'Kawai-pilot 32B Base': ['40.45%', '66.03%'],
+    'Kawai-pilot 72B FT': ['46.28%', '61.03%'],
+    'Kawai-pilot 72B Base': ['26.99%', '41.51%'],
+    'Qwen FT': ['16.99%', '21.79%'],
+    'Qwen Base': ['5.45%', '10.26%'],
+}
+
+SWE_METRICS = [
+    'Total Instances',
+    'Submitted Instances',
+    'Completed Instances',
+    'Resolved Instances',
+    'Unresolved Instances',
+    'Empty Patch Instances',
+    'Error Instances'
+]
+SWE = {
+    'Kwai Base': [500, 500, 20, 2, 18, 0, 480],
+    'Kwai Fine-tuned (LoRA)': [500, 500, 33, 4, 29, 0, 467],
+}
+
+RUSTEVO_METRICS = [
+    'Total Tasks',
+    'Success Count',
+    'Failed Count',
+    'Pass@1',
+    'Incorrect Signatures',
+    'Incorrect API',
+    'Borrow Checker Failures',
+    'Borrow Checker Failure Rate',
+    'API Usage True Count',
+    'API Usage Accuracy',
+    'API Coverage Distinct',
+    'API Coverage Count',
+    'Compilation Errors',
+    'Test Failures'
+]
+RUSTEVO = {
+    'kat-dev-hs-72b': {
+        'RQ1 (Full Docs)': [588, 187, 401, '31.80%', 0, 87, 363, '90.52%', 501, '85.20%', '90.0%', '405/450', 386, 15],
+        'RQ3 (Minimal Docs)': [588, 153, 435, '26.02%', 44, 40, 359, '82.53%', 504, '85.71%', '89.78%', '404/450', 374, 17],
+    },
+    'kat-dev-base-72b': {
+        'RQ1 (Full Docs)': [588, 194, 394, '32.99%', 0, 77, 357, '90.61%', 511, '86.90%', '90.44%', '407/450', 378, 16],
+        'RQ3 (Minimal Docs)': [588, 130, 458, '22.11%', 133, 27, 300, '65.50%', 428, '72.79%', '78.22%', '352/450', 315, 10],
+    },
+    'kat-dev-hs-32b': {
+        'RQ1 (Full Docs)': [588, 221, 367, '37.59%', 0, 40, 324, '88.28%', 548, '93.20%', '95.56%', '430/450', 352, 15],
+        'RQ3 (Minimal Docs)': [588, 178, 410, '30.27%', 1, 34, 376, '91.71%', 553, '94.05%', '96.44%', '434/450', 394, 15],
+    },
+    'kat-dev-base-32b': {
+        'RQ1 (Full Docs)': [588, 190, 398, '32.31%', 0, 34, 369, '92.71%', 554, '94.22%', '96.22%', '433/450', 385, 13],
+        'RQ3 (Minimal Docs)': [588, 169, 419, '28.74%', 0, 30, 390, '93.08%', 558, '94.90%', '96.44%', '434/450', 406, 13],
+    },
+}
+
+CHANGE_TYPES = ['Stabilized', 'Signature', 'Implicit', 'Deprecated']
+CHANGE_TYPE_COLUMNS = ['Total', 'Success', 'Success Rate', 'API Usage Accuracy']
+RUSTEVO_CHANGE_TYPES = {
+    ('kat-dev-hs-72b', 'RQ1'): {
+        'Total': [184, 185, 195, 24],
+        'Success': [62, 66, 59, 0],
+        'Success Rate': ['33.70%', '35.68%', '30.26%', '0.00%'],
+        'API Usage Accuracy': ['91.85%', '84.32%', '79.49%', '87.50%'],
+    },
+    ('kat-dev-hs-72b', 'RQ3'): {
+        'Total': [184, 185, 195, 24],
+        'Success': [37, 60, 56, 0],
+        'Success Rate': ['20.11%', '32.43%', '28.72%', '0.00%'],
+        'API Usage Accuracy': ['84.24%', '84.32%', '89.23%', '79.17%'],
+    },
+    ('kat-dev-base-72b', 'RQ1'): {
+        'Total': [184, 185, 195, 24],
+        'Success': [64, 66, 64, 0],
+        'Success Rate': ['34.78%', '35.68%', '32.82%', '0.00%'],
+        'API Usage Accuracy': ['94.57%', '85.41%', '82.05%', '79.17%'],
+    },
+    ('kat-dev-hs-32b', 'RQ1'): {
+        'Total': [184, 185, 195, 24],
+        'Success': [66, 69, 86, 0],
+        'Success Rate': ['35.87%', '37.30%', '44.10%', '0.00%'],
+        'API Usage Accuracy': ['91.85%', '96.22%', '91.28%', '95.83%'],
+    },
+}
+
+HASKELL_METRICS = [
+    'Total Challenges',
+    'First-Try Success (Pass@1)',
+    'Overall Success (Pass@2)',
+    'Improvement on Retry',
+    'Syntax Errors',
+    'Indentation Errors',
+    'Test Timeouts',
+    'Average Time per Test',
+    'Total Cost'
+]
+HASKELL = {
+    'GLM-Latest': ['112', '54.5% (61/112)', '63.4% (71/112)', '8.9%', '0%', '0%', '0', '1.6 minutes', '$0.00'],
+}
+
+HS_EVALS_METRICS = {
+    'understanding': ['Total Items Evaluated', 'Semantic Wellness', 'Technical Accuracy', 'Conceptual Understanding', 'Overall Average'],
+    'generation': ['Total Items Evaluated', 'Semantic Wellness', 'Contextual Relevance', 'Implementation Efficiency', 'CodeBLEU Score'],
+    'debugging': ['Total Items', 'Fix Relevance', 'Functional Correctness'],
+}
+HS_EVALS = {
+    'kat-dev-base-32b': {
+        'understanding': [40, 0.8045, 0.8130, 0.8143, 0.8106],
+        'generation': [42, 0.9268, 0.7129, 0.5548, 0.0015],
+        'debugging': [40, 0.7170, 0.6210],
+    },
+    'kat-dev-hs-32b': {
+        'understanding': [40, 0.8170, 0.8152, 0.8065, 0.8129],
+        'generation': [42, 0.9289, 0.6900, 0.5667, 0.0024],
+        'debugging': [40, 0.6990, 0.5490],
+    },
+    'kat-dev-base-72b': {
+        'understanding': [40, 0.7693, 0.7500, 0.7348, 0.7513],
+        'generation': [42, 0.9288, 0.6760, 0.4595, 0.0016],
+        'debugging': [40, 0.6220, 0.4920],
+    },
+    'kat-dev-hs-72b': {
+        'understanding': [40, 0.8057, 0.7883, 0.7630, 0.7856],
+        'generation': [42, 0.9282, 0.6964, 0.4976, 0.0017],
+        'debugging': [40, 0.6410, 0.5380],
+    },
+}
+
+
+def _rows(table, row, column, values):
+    # Formatted strings ('31.80%', '405/450') become a value, a unit and a denominator
+    return [(table, r, c, *parse_metric(v)) for r, c, v in zip(row, column, values)]
+
+
+def seed_frames():
+    """Yield ``(benchmark, model, cells)`` for every baseline run."""
+    for model, values in ARCHIT.items():
+        rows = _rows('leaderboard', [''] * len(values), ARCHIT_COLUMNS, values)
+        yield 'archit', model, rows
+
+    for model, values in HUMANEVAL.items():
+        rows = _rows('leaderboard', [''] * len(values), HUMANEVAL_COLUMNS, values)
+        yield 'humaneval', model, rows
+
+    for model, values in SWE.items():
+        rows = _rows('summary', SWE_METRICS, ['Count'] * len(values), values)
+        yield 'swe', model, rows
+
+    for model, settings in RUSTEVO.items():
+        rows = []
+        for setting, values in settings.items():
+            rows += _rows('summary', RUSTEVO_METRICS, [setting] * len(values), values)
+        for (change_model, rq), columns in RUSTEVO_CHANGE_TYPES.items():
+            if change_model != model:
+                continue
+            for column, values in columns.items():
+                rows += _rows(f'change_type_{rq.lower()}', CHANGE_TYPES, [column] * len(values), values)
+        yield 'rustevo', model, rows
+
+    for model, values in HASKELL.items():
+        rows = _rows('detailed', HASKELL_METRICS, ['Result'] * len(values), values)
+        yield 'haskell', model, rows
+
+    for model, tasks in HS_EVALS.items():
+        rows = []
+        for task, values in tasks.items():
+            rows += _rows(task, HS_EVALS_METRICS[task], ['Score'] * len(values), values)
+        yield 'hs_evals', model, rows
+
+
+def ensure_seeded(store):
+    """Populate an empty store with the baseline run."""
+    if store.manifest():
+        return
+    for benchmark, model, rows in seed_frames():
+        df = pd.DataFrame(rows, columns=SCHEMA.names)
+        store.write_run(df, benchmark, model, SEED_RUN)
@@ -0,0 +1,133 @@
+"""Process-wide, read-only results shared by every session.
+
+One ``SharedResults`` holds the latest run of every benchmark as an
+immutable Arrow table, built once per store version and handed to all
+sessions through ``st.cache_resource`` (see ``evaldash.loaders``). Rows are
+grouped by ``(table, model)`` with their offsets recorded, so selecting a
+page's table (for all or some models) is a zero-copy ``Table.slice``;
+only the remaining row/column filters materialize anything. Conversion to pandas keeps the
+Arrow-backed string columns and splits numeric blocks, so a page's
+DataFrame mostly references the shared buffers instead of a private copy.
+Memory therefore grows with the dataset, not with the number of viewers.
+
+The grouped tables can also come from a memory-mapped snapshot file
+instead of the Parquet store (see ``evaldash.snapshot``), or from several
+sources fetched concurrently (``from_sources``, see ``evaldash.sources``).
+Benchmarks whose source failed are missing and listed in ``errors``.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from evaldash.sources import fetch_all
+from evaldash.store import COLUMNS, PARTITION_SCHEMA, SCHEMA
+
+
+# Arrow-backed string columns wrap the shared buffers; pandas' default
+# string dtype would re-encode them into a private copy
+_ARROW_STRINGS = {pa.string(): pd.ArrowDtype(pa.string())}
+
+
+class SharedResults:
+    def __init__(self, tables=None, ranges=None, errors=None):
+        self._tables = dict(tables or {})  # benchmark -> Arrow table grouped by (model, table)
+        self._ranges = dict(ranges or {})  # benchmark -> {(model, table): (offset, length)}
+        self.errors = dict(errors or {})  # benchmark -> why its source could not be loaded
+
+    @classmethod
+    def from_store(cls, store):
+        """Read and group the latest runs of every benchmark from the Parquet store."""
+        shared = cls()
+        for benchmark in store.benchmarks():
+            table = store.read_table(benchmark)
+            if table is not None:
+                shared._tables[benchmark], shared._ranges[benchmark] = group_cells(table)
+        return shared
+
+    @classmethod
+    def from_sources(cls, sources, pool=None):
+        """Fetch ``{benchmark: source}`` concurrently and group what arrived in time."""
+        tables, errors = fetch_all(sources, pool)
+        shared = cls(errors=errors)
+        for benchmark, table in tables.items():
+            shared._tables[benchmark], shared._ranges[benchmark] = group_cells(table)
+        return shared
+
+    def updated(self, other):
+        """A new instance with the benchmarks of ``other`` (loaded or failed) replacing these."""
+        replaced = set(other._tables) | set(other.errors)
+        keep = [benchmark for benchmark in self._tables if benchmark not in replaced]
+        return SharedResults(
+            {**{b: self._tables[b] for b in keep}, **other._tables},
+            {**{b: self._ranges[b] for b in keep}, **other._ranges},
+            {**{b: e for b, e in self.errors.items() if b not in replaced}, **other.errors},
+        )
+
+    def benchmarks(self):
+        return list(self._tables)
+
+    def ranges(self, benchmark):
+        """``{(model, table): (offset, length)}`` of the rows in ``table(benchmark)``."""
+        return dict(self._ranges.get(benchmark, {}))
+
+    def table(self, benchmark):
+        """The whole latest-run Arrow table of ``benchmark`` (empty when unknown)."""
+        return self._tables.get(benchmark, _empty())
+
+    def models(self, benchmark):
+        return list(dict.fromkeys(model for model, _ in self._ranges.get(benchmark, {})))
+
+    def table_names(self, benchmark, models=None):
+        return list(dict.fromkeys(
+            name for model, name in self._ranges.get(benchmark, {}) if models is None or model in models
+        ))
+
+    def select(self, benchmark, columns=None, models=None, where=()):
+        """Arrow cells for ``benchmark``; ``where`` is ``((column, values), ...)``."""
+        where = dict(where)
+        tables = where.pop("table", None)
+        ranges = self._ranges.get(benchmark, {})
+        source = self.table(benchmark)
+        spans = []
+        for (model, name), (offset, length) in ranges.items():
+            if (models is None or model in models) and (tables is None or name in tables):
+                if spans and spans[-1][0] + spans[-1][1] == offset:
+                    spans[-1][1] += length
+                else:
+                    spans.append([offset, length])
+        pieces = [source.slice(offset, length) for offset, length in spans]
+        result = pa.concat_tables(pieces) if pieces else _empty()
+        for key, values in where.items():
+            result = result.filter(pc.is_in(result[key], value_set=pa.array(list(values), result.schema.field(key).type)))
+        return result.select(list(columns) if columns is not None else COLUMNS)
+
+    def cells(self, benchmark, columns=None, models=None, where=()):
+        """``select`` converted to pandas without copying the string columns."""
+        return self.select(benchmark, columns, models, where).to_pandas(split_blocks=True, types_mapper=_ARROW_STRINGS.get)
+
+    def nbytes(self):
+        return sum(table.nbytes for table in self._tables.values())
+
+
+def group_cells(table):
+    """``table`` grouped by ``(table, model)`` and the ``(offset, length)`` of each group."""
+    # Stable grouping by first-seen table, then first-seen model, so a
+    # page's table is one contiguous block with models in their usual
+    # order and rows in the order each run was written in
+    model = pc.index_in(table["model"], value_set=pc.unique(table["model"])).to_numpy()
+    name = pc.index_in(table["table"], value_set=pc.unique(table["table"])).to_numpy()
+    order = np.lexsort((model, name))
+    table = table.take(pa.array(order)).combine_chunks()
+
+    model, name = model[order], name[order]
+    starts = np.flatnonzero(np.r_[True, (model[1:] != model[:-1]) | (name[1:] != name[:-1])])
+    ends = np.r_[starts[1:], len(order)]
+    models = table["model"].take(pa.array(starts)).to_pylist()
+    names = table["table"].take(pa.array(starts)).to_pylist()
+    ranges = {(m, n): (int(start), int(end - start)) for m, n, start, end in zip(models, names, starts, ends)}
+    return table, ranges
+
+
+def _empty():
+    return pa.unify_schemas([SCHEMA, PARTITION_SCHEMA]).empty_table().select(COLUMNS)
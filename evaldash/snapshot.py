@@ -0,0 +1,104 @@
+"""Memory-mapped Arrow IPC snapshot of the latest results.
+
+A build step (``python -m evaldash.snapshot``) writes the latest run of
+every benchmark, already grouped the way ``SharedResults`` serves it, into
+one uncompressed Arrow IPC file next to the manifest. On a cold start the
+dashboard memory-maps that file instead of scanning and regrouping the
+Parquet partitions: the columns are used in place, so opening it costs an
+mmap and a schema read, and pages fault in only the bytes they touch.
+
+The file records a digest of the manifest it was built from. Once a new run
+is written the snapshot no longer matches and is ignored (the Parquet path
+is used) until it is rebuilt.
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+
+import pyarrow as pa
+
+from evaldash.seed import ensure_seeded
+from evaldash.shared import SharedResults
+from evaldash.store import COLUMNS, ResultsStore
+
+SNAPSHOT = "snapshot.arrow"
+
+_DIGEST_KEY = b"evaldash.manifest"
+_RANGES_KEY = b"evaldash.ranges"
+
+
+def snapshot_path(store):
+    """``DASHBOARD_SNAPSHOT`` if set, else ``snapshot.arrow`` in the store root."""
+    return Path(os.environ.get("DASHBOARD_SNAPSHOT", store.root / SNAPSHOT))
+
+
+def write_snapshot(store, path=None):
+    """Write the latest runs of ``store`` to one Arrow IPC file; returns its path."""
+    path = Path(path) if path is not None else snapshot_path(store)
+    shared = SharedResults.from_store(store)
+    tables, ranges, offset = [], {}, 0
+    for benchmark in shared.benchmarks():
+        table = shared.table(benchmark)
+        tables.append(table)
+        ranges[benchmark] = [
+            [model, name, offset + start, length]
+            for (model, name), (start, length) in shared.ranges(benchmark).items()
+        ]
+        offset += table.num_rows
+    combined = pa.concat_tables(tables).combine_chunks() if tables else shared.table(None)
+    combined = combined.replace_schema_metadata({
+        _DIGEST_KEY: store.manifest_digest().encode(),
+        _RANGES_KEY: json.dumps(ranges).encode(),
+    })
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, combined.schema) as writer:
+        writer.write_table(combined)
+    # Readers that already mapped the old file keep their view of it
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(store, path=None):
+    """``SharedResults`` backed by the memory-mapped snapshot, or None when missing or stale."""
+    path = Path(path) if path is not None else snapshot_path(store)
+    try:
+        source = pa.memory_map(str(path))
+    except FileNotFoundError:
+        return None
+    reader = pa.ipc.open_file(source)
+    metadata = reader.schema.metadata or {}
+    if metadata.get(_DIGEST_KEY, b"").decode() != store.manifest_digest():
+        return None
+    if reader.schema.names != COLUMNS:
+        # Written before the cell schema last changed
+        return None
+    # Zero-copy: the record batches point into the mapping, which they keep alive
+    combined = reader.read_all().replace_schema_metadata(None)
+
+    tables, ranges = {}, {}
+    for benchmark, groups in json.loads(metadata[_RANGES_KEY]).items():
+        if not groups:
+            continue
+        start = min(offset for _, _, offset, _ in groups)
+        tables[benchmark] = combined.slice(start, sum(length for _, _, _, length in groups))
+        ranges[benchmark] = {(model, name): (offset - start, length) for model, name, offset, length in groups}
+    return SharedResults(tables, ranges)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the latest results to a memory-mappable Arrow snapshot.")
+    parser.add_argument("--root", help="results store directory")
+    parser.add_argument("--output", help=f"snapshot file (default: $DASHBOARD_SNAPSHOT or <root>/{SNAPSHOT})")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.root) if args.root else ResultsStore()
+    ensure_seeded(store)
+    path = write_snapshot(store, args.output)
+    print(f"wrote {path} ({path.stat().st_size / 2**20:.1f} MiB) for {len(store.benchmarks())} benchmarks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Concurrent loading of the latest results from several sources.
+
+Each benchmark's latest runs come from one source. By default that is the
+local Parquet store. A benchmark listed in ``DASHBOARD_SOURCES`` (inline
+JSON, or the path of a JSON file) comes from a result server instead::
+
+    DASHBOARD_SOURCES='{"swe": "http://localhost:8800/swe",
+                        "rustevo": {"url": "http://evals:8800/rustevo", "timeout": 30}}'
+
+A server answers ``GET <url>`` with the benchmark's latest-run cells as an
+Arrow IPC stream, in the store's long format (see ``evaldash.store``).
+
+``fetch_all`` starts every source at once on a thread pool. It waits for
+each one only until that source's own deadline. Loading therefore takes as
+long as the slowest source that answers in time, not the sum of all of
+them. A source that fails or times out is reported with an error and left
+out, so the dashboard can render the other benchmarks.
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+import pyarrow as pa
+
+from evaldash.store import COLUMNS, PARTITION_SCHEMA, SCHEMA, typed_cells
+
+SOURCES_ENV = "DASHBOARD_SOURCES"
+TIMEOUT = float(os.environ.get("DASHBOARD_SOURCE_TIMEOUT", 10))
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+_CELL_SCHEMA = pa.unify_schemas([SCHEMA, PARTITION_SCHEMA])
+
+
+class StoreSource:
+    """The latest runs of ``benchmark`` read from the local Parquet store."""
+
+    # Local reads keep their old behaviour and are always waited for
+    timeout = None
+
+    def __init__(self, store, benchmark):
+        self.store = store
+        self.benchmark = benchmark
+
+    def fetch(self):
+        return self.store.read_table(self.benchmark)
+
+
+class HttpSource:
+    """The latest runs of a benchmark, served by a result server at ``url`` as an Arrow IPC stream."""
+
+    def __init__(self, url, timeout=TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def fetch(self):
+        # Imported here so stores without result servers don't pay for http.client and ssl
+        import urllib.request
+
+        request = urllib.request.Request(self.url, headers={"Accept": ARROW_STREAM})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            table = pa.ipc.open_stream(response.read()).read_all()
+        # Servers still sending formatted numbers in ``display`` get typed here
+        return typed_cells(table).select(COLUMNS).cast(pa.schema([_CELL_SCHEMA.field(name) for name in COLUMNS]))
+
+
+def remote_sources(spec=None):
+    """``{benchmark: HttpSource}`` configured by ``DASHBOARD_SOURCES`` (or ``spec``)."""
+    spec = os.environ.get(SOURCES_ENV, "") if spec is None else spec
+    spec = spec.strip()
+    if not spec:
+        return {}
+    if not spec.startswith("{"):
+        with open(spec) as f:
+            spec = f.read()
+    sources = {}
+    for benchmark, target in json.loads(spec).items():
+        target = target if isinstance(target, dict) else {"url": target}
+        sources[benchmark] = HttpSource(target["url"], float(target.get("timeout", TIMEOUT)))
+    return sources
+
+
+def configured_sources(store):
+    """``{benchmark: source}``: the result servers, and the local store for every other benchmark."""
+    sources = {benchmark: StoreSource(store, benchmark) for benchmark in store.benchmarks()}
+    sources.update(remote_sources())
+    return sources
+
+
+def fetch_all(sources, pool=None):
+    """Fetch ``{name: source}`` concurrently; returns ``({name: table}, {name: error})``.
+
+    Every source gets until its own ``timeout``, counted from when the batch
+    started (None waits for it). A source that is still running then is
+    abandoned and reported as timed out. Sources that return None (nothing
+    stored) are in neither dict.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = ThreadPoolExecutor(max(1, len(sources)), thread_name_prefix="evaldash-source")
+    try:
+        start = time.monotonic()
+        futures = {name: pool.submit(source.fetch) for name, source in sources.items()}
+        tables, errors = {}, {}
+        for name, future in futures.items():
+            timeout = sources[name].timeout
+            remaining = None if timeout is None else max(0.0, start + timeout - time.monotonic())
+            try:
+                table = future.result(remaining)
+            except FutureTimeout:
+                future.cancel()
+                errors[name] = f"timed out after {timeout:g}s"
+                continue
+            except Exception as exc:
+                errors[name] = f"{type(exc).__name__}: {exc}"
+                continue
+            if table is not None:
+                tables[name] = table
+        return tables, errors
+    finally:
+        if own_pool:
+            # Don't wait for abandoned fetches
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,417 @@
+"""Static export of the dashboard for read-only audiences.
+
+``python -m evaldash.static --output site`` renders every page of the
+sidebar, with all tabs, figures and tables, and writes a bundle that any
+static file server can host without Streamlit:
+
+- ``index.html`` (the Overview) and one ``<page>.html`` per other page;
+- ``assets/plotly.min.js``, so the pages need no network access;
+- ``data/<page>/table-<n>.parquet`` with the full data of every table and
+  ``data/<page>/figure-<n>.json`` with the Plotly spec of every chart;
+- ``site.json`` listing the pages and their files, and the manifest digest
+  of the results they were built from.
+
+Pages are rendered by the dashboard script itself, run headless through
+Streamlit's ``AppTest``, one page per task in a process pool. Workers set
+``DASHBOARD_STATIC=1`` so lazy tabs render every tab and paged tables send
+every row; other widgets keep their default values. Tables longer than
+``MAX_ROWS`` show their first rows and link to their Parquet file.
+"""
+import argparse
+import html
+import json
+import numbers
+import os
+import re
+import textwrap
+from datetime import datetime, timezone
+from pathlib import Path
+
+DASHBOARD = Path(__file__).resolve().parent.parent / "dashboard.py"
+MAX_ROWS = 200
+TIMEOUT = 600
+
+# Turned off in workers: the perf panel and the ingest thread aren't part of a page
+_WORKER_ENV_OFF = ["DASHBOARD_PERF", "DASHBOARD_INGEST_WORKER"]
+_WIDGETS = {
+    "checkbox", "color_picker", "date_input", "multiselect", "number_input", "radio", "select_slider",
+    "selectbox", "slider", "text_area", "text_input", "time_input", "toggle",
+}
+_ALERTS = {"error", "info", "success", "warning"}
+
+
+def page_file(name, slug):
+    return "index.html" if slug == "overview" else f"{slug}.html"
+
+
+def build(output, jobs=None):
+    """Render every page into ``output``; returns the ``site.json`` contents."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    from plotly.offline import get_plotlyjs
+
+    from evaldash.seed import ensure_seeded
+    from evaldash.store import ResultsStore
+    from evaldash.views import PAGES
+
+    output = Path(output)
+    store = ResultsStore()
+    ensure_seeded(store)
+    (output / "assets").mkdir(parents=True, exist_ok=True)
+    (output / "assets" / "plotly.min.js").write_text(get_plotlyjs())
+
+    # Spawned, not forked: the parent may hold threads and imported Streamlit state
+    with ProcessPoolExecutor(
+        max_workers=jobs or min(len(PAGES), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as pool:
+        futures = {name: pool.submit(render_page, name, slug, str(output)) for name, slug in PAGES.items()}
+        pages = {name: future.result() for name, future in futures.items()}
+
+    nav = [(name, page_file(name, slug)) for name, slug in PAGES.items()]
+    for name, page in pages.items():
+        (output / page["file"]).write_text(_document(name, page.pop("body"), nav), encoding="utf-8")
+    site = {
+        "built": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "manifest": store.manifest_digest(),
+        "pages": list(pages.values()),
+    }
+    (output / "site.json").write_text(json.dumps(site, indent=1))
+    return site
+
+
+def _init_worker():
+    from evaldash.tabs import STATIC_ENV
+
+    os.environ[STATIC_ENV] = "1"
+    for name in _WORKER_ENV_OFF:
+        os.environ.pop(name, None)
+
+
+def render_page(name, slug, output):
+    """Run the dashboard on page ``name`` and write its data files; returns its ``site.json`` entry and body."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(DASHBOARD), default_timeout=TIMEOUT)
+    at.run()
+    if at.sidebar.radio[0].value != name:
+        at.sidebar.radio[0].set_value(name).run()
+    if at.exception:
+        raise RuntimeError(f"{name}: {at.exception[0].message}")
+    writer = _PageWriter(Path(output), slug)
+    body = writer.html(at.main)
+    return {
+        "name": name,
+        "file": page_file(name, slug),
+        "tables": writer.tables,
+        "figures": writer.figures,
+        "body": body,
+    }
+
+
+class _PageWriter:
+    """Turns one page's element tree into HTML, writing its tables and figures as data files."""
+
+    def __init__(self, output, slug):
+        self.output = output
+        self.data_dir = Path("data") / slug
+        self.tables = []
+        self.figures = []
+
+    def html(self, node):
+        kind = node.type
+        if kind in ("title", "header", "subheader"):
+            tag = {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+            return f"<{tag}>{_inline(node.proto.body)}</{tag}>"
+        if kind == "markdown":
+            return _markdown(node.proto.body)
+        if kind == "caption":
+            return f'<p class="caption">{_inline(node.proto.body)}</p>'
+        if kind == "divider":
+            return "<hr>"
+        if kind in _ALERTS:
+            return f'<div class="alert {kind}">{_markdown(node.proto.body)}</div>'
+        if kind == "metric":
+            return self._metric(node.proto)
+        if kind == "dataframe":
+            return self._table(node.proto)
+        if kind == "plotly_chart":
+            return self._figure(node.proto.spec)
+        if kind in _WIDGETS:
+            return f'<p class="widget"><span>{html.escape(node.label)}</span> {html.escape(_widget_value(node))}</p>'
+        if kind == "tab_container":
+            return self._tabs(node)
+
+        inner = "".join(self.html(child) for child in getattr(node, "children", {}).values())
+        if kind == "column":
+            return f'<div class="column" style="flex: {node.weight or 1}">{inner}</div>'
+        if kind == "expander":
+            return f"<details><summary>{_inline(node.label)}</summary>{inner}</details>"
+        children = list(getattr(node, "children", {}).values())
+        if children and all(child.type == "column" for child in children):
+            return f'<div class="columns">{inner}</div>'
+        return inner
+
+    def _tabs(self, node):
+        tabs = list(node.children.values())
+        labels = "".join(
+            f'<button class="{"active" if i == 0 else ""}">{_inline(tab.label)}</button>' for i, tab in enumerate(tabs)
+        )
+        panels = "".join(
+            f'<div class="panel{" active" if i == 0 else ""}">'
+            + "".join(self.html(child) for child in tab.children.values())
+            + "</div>"
+            for i, tab in enumerate(tabs)
+        )
+        return f'<div class="tabs"><div class="labels">{labels}</div>{panels}</div>'
+
+    def _metric(self, proto):
+        delta = f'<div class="delta">{html.escape(proto.delta)}</div>' if proto.delta else ""
+        return (
+            f'<div class="metric"><div class="label">{_inline(proto.label)}</div>'
+            f'<div class="value">{html.escape(proto.body)}</div>{delta}</div>'
+        )
+
+    def _table(self, proto):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.ipc.open_stream(proto.arrow_data.data).read_all()
+        path = self.data_dir / f"table-{len(self.tables) + 1}.parquet"
+        (self.output / path).parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, self.output / path)
+        self.tables.append({"file": path.as_posix(), "rows": table.num_rows})
+
+        config = json.loads(proto.columns or "{}")
+        formats = {name: column.get("type_config", {}).get("format") for name, column in config.items()}
+        frame = table.slice(0, MAX_ROWS).to_pandas()
+        shown = frame
+        if proto.arrow_data.styler.display_values:
+            # A Styler's formatted cells (see evaldash.tables)
+            shown = pa.ipc.open_stream(proto.arrow_data.styler.display_values).read_all().slice(0, MAX_ROWS).to_pandas()
+        # Like st.dataframe, except that an unnamed row number isn't shown
+        index = None
+        if not config.get("_index", {}).get("hidden") and not (frame.index.name is None and _is_range(frame.index)):
+            index = frame.index
+        names = ([index.name or ""] if index is not None else []) + list(frame.columns)
+        head = "".join(f"<th>{html.escape(str(name))}</th>" for name in names)
+        rows = []
+        for position in range(len(frame)):
+            cells = [] if index is None else [f"<th>{html.escape(str(index[position]))}</th>"]
+            for name in frame.columns:
+                value = frame[name].iloc[position]
+                text = shown[name].iloc[position] if shown is not frame else _cell(value, formats.get(name))
+                cells.append(f'<td class="{_cell_class(value)}">{html.escape(text)}</td>')
+            rows.append(f"<tr>{''.join(cells)}</tr>")
+        note = ""
+        if table.num_rows > MAX_ROWS:
+            note = (
+                f'<p class="caption">First {MAX_ROWS:,} of {table.num_rows:,} rows · '
+                f'<a href="{path.as_posix()}">all rows (Parquet)</a></p>'
+            )
+        return f'<div class="table"><table><thead><tr>{head}</tr></thead><tbody>{"".join(rows)}</tbody></table></div>{note}'
+
+    def _figure(self, spec):
+        path = self.data_dir / f"figure-{len(self.figures) + 1}.json"
+        (self.output / path).parent.mkdir(parents=True, exist_ok=True)
+        (self.output / path).write_text(spec)
+        self.figures.append({"file": path.as_posix()})
+        # Inline as well, so pages opened from disk (file://) can draw it without fetching
+        inline = spec.replace("</", "<\\/")
+        return f'<div class="chart"></div><script type="application/json" class="spec">{inline}</script>'
+
+
+def _is_range(index):
+    import pandas as pd
+
+    return isinstance(index, pd.RangeIndex)
+
+
+def _widget_value(node):
+    value = node.value
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def _cell(value, fmt):
+    if value is None or value != value:
+        return ""
+    if _is_flag(value):
+        return "✓" if value else "✗"
+    if isinstance(value, numbers.Real):
+        if fmt:
+            return fmt % value
+        if float(value).is_integer():
+            return str(int(value))
+        # Like st.dataframe: up to four decimals
+        return f"{value:.4f}".rstrip("0").rstrip(".")
+    return str(value)
+
+
+def _cell_class(value):
+    return "number" if isinstance(value, numbers.Real) and not _is_flag(value) else ""
+
+
+def _is_flag(value):
+    return isinstance(value, bool) or type(value).__name__ == "bool_"
+
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_RULE = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+_BULLET = re.compile(r"^[-*+]\s+(.*)$")
+_NUMBERED = re.compile(r"^\d+[.)]\s+(.*)$")
+
+
+def _markdown(text):
+    """HTML for the Markdown the pages use: headings, rules, lists, paragraphs and inline styles."""
+    out, paragraph, items, list_tag = [], [], [], None
+
+    def flush():
+        nonlocal list_tag
+        if paragraph:
+            out.append(f"<p>{_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+        if items:
+            out.append(f"<{list_tag}>" + "".join(f"<li>{_inline(item)}</li>" for item in items) + f"</{list_tag}>")
+            items.clear()
+            list_tag = None
+
+    for line in textwrap.dedent(text).strip().splitlines():
+        stripped = line.strip()
+        heading, bullet, numbered = _HEADING.match(stripped), _BULLET.match(stripped), _NUMBERED.match(stripped)
+        if not stripped:
+            flush()
+        elif _RULE.match(stripped):
+            flush()
+            out.append("<hr>")
+        elif heading:
+            flush()
+            level = len(heading[1])
+            out.append(f"<h{level}>{_inline(heading[2])}</h{level}>")
+        elif bullet or numbered:
+            tag = "ul" if bullet else "ol"
+            if paragraph or list_tag != tag:
+                flush()
+            list_tag = tag
+            items.append((bullet or numbered)[1])
+        elif items and line[:1].isspace():
+            items[-1] += " " + stripped
+        else:
+            if items:
+                flush()
+            paragraph.append(stripped)
+    flush()
+    return "".join(out)
+
+
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", r"<em>\1</em>", text)
+    return re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', text)
+
+
+def _document(name, body, nav):
+    links = "".join(
+        f'<a class="{"active" if title == name else ""}" href="{href}">{html.escape(title)}</a>' for title, href in nav
+    )
+    return _TEMPLATE.format(title=html.escape(name), nav=links, body=body)
+
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} · Coding Model Evaluation Dashboard</title>
+<style>
+body {{ margin: 0; display: flex; font-family: "Source Sans Pro", system-ui, sans-serif; color: #31333f; }}
+nav {{ width: 240px; flex: none; min-height: 100vh; padding: 1.5rem 1rem; background: #f0f2f6; box-sizing: border-box; }}
+nav h2 {{ font-size: 1.2rem; }}
+nav a {{ display: block; padding: .3rem .5rem; border-radius: .4rem; color: inherit; text-decoration: none; }}
+nav a.active {{ background: #ffffff; font-weight: 600; }}
+main {{ flex: 1; min-width: 0; padding: 2rem 3rem; }}
+.columns {{ display: flex; gap: 1rem; }}
+.column {{ min-width: 0; }}
+.metric {{ margin: .5rem 0 1rem; }}
+.metric .label {{ font-size: .9rem; }}
+.metric .value {{ font-size: 2rem; }}
+.metric .delta {{ color: #09ab3b; }}
+.alert {{ padding: .75rem 1rem; border-radius: .5rem; margin: .75rem 0; }}
+.alert p {{ margin: 0; }}
+.info {{ background: #e8f1fb; }} .success {{ background: #e6f4ea; }}
+.warning {{ background: #fffbe6; }} .error {{ background: #fdecea; }}
+.table {{ overflow: auto; max-height: 40rem; margin: .5rem 0; }}
+table {{ border-collapse: collapse; font-size: .9rem; }}
+th, td {{ border: 1px solid #e6e9ef; padding: .25rem .6rem; text-align: left; white-space: nowrap; }}
+thead th {{ background: #f8f9fb; position: sticky; top: 0; }}
+td.number {{ text-align: right; font-variant-numeric: tabular-nums; }}
+.caption, .widget span {{ color: #808495; font-size: .9rem; }}
+.tabs .labels {{ border-bottom: 1px solid #e6e9ef; margin-bottom: 1rem; }}
+.tabs .labels button {{ background: none; border: none; padding: .5rem 1rem; cursor: pointer; font: inherit; }}
+.tabs .labels button.active {{ border-bottom: 2px solid #ff4b4b; color: #ff4b4b; }}
+.tabs .panel {{ display: none; }} .tabs .panel.active {{ display: block; }}
+</style>
+<script src="assets/plotly.min.js"></script>
+</head>
+<body>
+<nav><h2>Navigation</h2>{nav}</nav>
+<main>
+{body}
+</main>
+<script>
+function draw(root) {{
+  root.querySelectorAll(".chart:not(.drawn)").forEach(function (el) {{
+    if (!el.offsetParent) return;
+    var spec = JSON.parse(el.nextElementSibling.textContent);
+    Plotly.newPlot(el, spec.data, spec.layout, {{responsive: true, displaylogo: false}});
+    el.classList.add("drawn");
+  }});
+}}
+document.querySelectorAll(".tabs").forEach(function (tabs) {{
+  var buttons = tabs.querySelectorAll(":scope > .labels > button");
+  var panels = tabs.querySelectorAll(":scope > .panel");
+  buttons.forEach(function (button, i) {{
+    button.addEventListener("click", function () {{
+      buttons.forEach(function (b, j) {{ b.classList.toggle("active", i === j); }});
+      panels.forEach(function (p, j) {{ p.classList.toggle("active", i === j); }});
+      draw(panels[i]);
+    }});
+  }});
+}});
+document.querySelectorAll("details").forEach(function (d) {{
+  d.addEventListener("toggle", function () {{ draw(d); }});
+}});
+draw(document);
+</script>
+</body>
+</html>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every dashboard page into a static HTML bundle.")
+    parser.add_argument("--output", default="site", help="output directory (default: site)")
+    parser.add_argument("--root", help="results store directory")
+    parser.add_argument("--jobs", type=int, help="pages rendered in parallel (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    if args.root:
+        # Read by the store module, which the spawned workers import fresh
+        os.environ["DASHBOARD_RESULTS_DIR"] = args.root
+    site = build(args.output, args.jobs)
+    tables = sum(len(page["tables"]) for page in site["pages"])
+    figures = sum(len(page["figures"]) for page in site["pages"])
+    print(f"wrote {len(site['pages'])} pages, {tables} tables and {figures} figures to {args.output}")
+
+
+if __name__ == "__main__":
+    # Through the package, so workers are sent ``evaldash.static.render_page``:
+    # running the dashboard script replaces their ``__main__``
+    from evaldash.static import main
+
+    main()
@@ -0,0 +1,483 @@
+"""Parquet results store.
+
+Results live in one Parquet dataset laid out as
+``<root>/benchmark=<b>/model=<m>/run=<r>/*.parquet`` in long format: one row
+per table cell. A small JSON manifest at the root lists every partition so
+readers can resolve the partitions a page needs without walking the whole
+tree, which keeps the cost of a rerun flat as the run history grows.
+
+A numeric cell is a float ``value`` with a ``unit`` and, for ratios, a
+``denominator`` (see ``evaldash.metrics``); ``display`` only holds the text of
+non-numeric cells. Files written before units existed kept formatted numbers
+('31.80%', '405/450') in ``display``; ``typed_cells`` converts them on read.
+
+Per-task pass/fail outcomes are not cells: a run keeps them packed next to
+its Parquet file, one ``<table>.bits.npz`` per per-task table (see
+``evaldash.bitset``).
+
+Each write of a run goes to a fresh ``v-<files>`` directory inside its
+partition, named by the ``files`` field of its manifest entry, so a
+rewritten run never changes files that readers of the previous manifest
+may still be reading. Runs written before that keep their files directly
+in the partition directory.
+"""
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import quote
+
+try:
+    import fcntl
+except ImportError:
+    # No lock file on Windows: run one writer per store there
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from evaldash.aggregates import AggregateTable
+from evaldash.bitset import SUFFIX, OutcomeBits
+from evaldash.metrics import format_metric, number_format, parse_metric, unit_label
+from evaldash.perf import timed
+from evaldash.rollups import RollupTable, run_date
+
+DEFAULT_ROOT = Path(
+    os.environ.get("DASHBOARD_RESULTS_DIR", Path(__file__).resolve().parent.parent / "results")
+)
+MANIFEST = "manifest.json"
+PUBLISH_LOCK = ".publish.lock"
+
+PARTITION_SCHEMA = pa.schema([
+    ("benchmark", pa.string()),
+    ("model", pa.string()),
+    ("run", pa.string()),
+])
+PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+# Columns stored inside each partition file
+SCHEMA = pa.schema([
+    ("table", pa.string()),
+    ("row", pa.string()),
+    ("column", pa.string()),
+    ("value", pa.float64()),
+    ("unit", pa.string()),
+    ("denominator", pa.float64()),
+    ("display", pa.string()),
+])
+COLUMNS = PARTITION_SCHEMA.names + SCHEMA.names
+# Read together so cells of older files can be typed (see ``typed_cells``)
+TYPED = ["value", "unit", "denominator", "display"]
+
+
+def is_task_table(name):
+    """Per-task tables hold one row per task, not a shown cell.
+
+    These are pass@k ``samples``, HS EVALS ``<task>_scores`` and the RustEvo and
+    SWE ``tasks*`` flag tables.
+    """
+    return name == "samples" or name.endswith("_scores") or name.startswith("tasks")
+
+
+def task_table_filter():
+    """``is_task_table`` as a dataset filter expression on the ``table`` column."""
+    table = ds.field("table")
+    return (table == "samples") | pc.ends_with(table, "_scores") | pc.starts_with(table, "tasks")
+
+
+class ResultsStore:
+    def __init__(self, root=DEFAULT_ROOT, runs=None):
+        self.root = Path(root)
+        # A manifest that is not published yet (see ``staged``)
+        self._runs = runs
+
+    # Manifest
+
+    def manifest(self):
+        if self._runs is not None:
+            return self._runs
+        path = self.root / MANIFEST
+        if not path.exists():
+            return []
+        with open(path) as f:
+            return json.load(f)["runs"]
+
+    def manifest_digest(self):
+        """Content hash of the manifest; identifies the set of runs a derived file was built from."""
+        if self._runs is not None:
+            return hashlib.sha1(_manifest_text(self._runs).encode()).hexdigest()
+        path = self.root / MANIFEST
+        if not path.exists():
+            return ""
+        return hashlib.sha1(path.read_bytes()).hexdigest()
+
+    def staged(self, entries):
+        """A read-only view of this store as it will be once ``entries`` are published."""
+        return ResultsStore(self.root, self._merged(entries))
+
+    def publish(self, entries):
+        """Make staged runs visible to readers with one atomic manifest replace.
+
+        The aggregates and rollups take in the runs just before the
+        manifest, whose mtime tells readers something changed. Writers in
+        other threads and processes wait on a lock file, so neither the
+        manifest nor the derived tables lose an update.
+        """
+        with self._publish_lock():
+            previous = {(r["benchmark"], r["model"], r["run"]): r for r in self.manifest()}
+            aggregates, rollups = self.aggregate_table(), self.rollup_table()
+            for e in entries:
+                cells = self._read_entry(e)
+                aggregates.update(e["benchmark"], e["model"], e["run"], cells)
+                rollups.update(e["benchmark"], e["model"], e["run"], cells, e["date"], e.get("checkpoint"))
+            self._write_manifest(self._merged(entries))
+            for e in entries:
+                self._prune(e, previous.get((e["benchmark"], e["model"], e["run"])))
+
+    @contextmanager
+    def _publish_lock(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / PUBLISH_LOCK, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _prune(self, entry, previous):
+        """Delete a partition's files older than the ones readers of the previous manifest may use."""
+        part_dir = self._partition_dir(entry["benchmark"], entry["model"], entry["run"])
+        keep = {entry.get("files")} | ({previous.get("files")} if previous is not None else set())
+        for path in part_dir.glob("v-*"):
+            if path.name[2:] not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+        if None not in keep:
+            # Files of a run written before versioned directories
+            for path in [*part_dir.glob("*.parquet"), *part_dir.glob("*" + SUFFIX)]:
+                path.unlink(missing_ok=True)
+
+    def _merged(self, entries):
+        replaced = {(e["benchmark"], e["model"], e["run"]) for e in entries}
+        return [r for r in self.manifest() if (r["benchmark"], r["model"], r["run"]) not in replaced] + list(entries)
+
+    def _write_manifest(self, runs):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / (MANIFEST + ".tmp")
+        with open(tmp, "w") as f:
+            f.write(_manifest_text(runs))
+        os.replace(tmp, self.root / MANIFEST)
+
+    def benchmarks(self):
+        return list(dict.fromkeys(r["benchmark"] for r in self.manifest()))
+
+    def models(self, benchmark):
+        return list(dict.fromkeys(r["model"] for r in self.manifest() if r["benchmark"] == benchmark))
+
+    def runs(self, benchmark, model):
+        return [r["run"] for r in self.manifest() if r["benchmark"] == benchmark and r["model"] == model]
+
+    def latest_runs(self, benchmark):
+        # Manifest entries are appended in write order, so the last one wins
+        return {r["model"]: r["run"] for r in self.manifest() if r["benchmark"] == benchmark}
+
+    # Writing
+
+    def _partition_dir(self, benchmark, model, run):
+        return (
+            self.root
+            / f"benchmark={quote(benchmark, safe='')}"
+            / f"model={quote(model, safe='')}"
+            / f"run={quote(run, safe='')}"
+        )
+
+    def _files_dir(self, entry):
+        """Directory holding the files of a manifest entry."""
+        part_dir = self._partition_dir(entry["benchmark"], entry["model"], entry["run"])
+        return part_dir / f"v-{entry['files']}" if "files" in entry else part_dir
+
+    def _entries(self, parts):
+        """Manifest entries of ``(benchmark, model, run)`` partitions, in order."""
+        entries = {(r["benchmark"], r["model"], r["run"]): r for r in self.manifest()}
+        return [entries[part] for part in parts if part in entries]
+
+    def _read_entry(self, entry):
+        """The shown cells of a manifest entry; per-task tables are left on disk."""
+        files = sorted(str(p) for p in self._files_dir(entry).glob("*.parquet"))
+        return _dataset(files, self.root).to_table(columns=SCHEMA.names, filter=~task_table_filter()).to_pandas()
+
+    def write_run(self, df, benchmark, model, run, bits=None, day=None, checkpoint=None):
+        """Write one run's cells, replacing any earlier copy of the same partition.
+
+        ``bits`` maps a per-task table to its ``OutcomeBits``. ``day`` (ISO
+        date, see ``run_date``) and the training ``checkpoint`` place the run
+        on the trend charts.
+        """
+        self.publish([self.stage_run(df, benchmark, model, run, bits, day, checkpoint)])
+
+    def stage_run(self, df, benchmark, model, run, bits=None, day=None, checkpoint=None):
+        """Write one run's files to a new directory without listing it; returns its entry for ``publish``.
+
+        Readers and the derived tables (aggregates, rollups) see nothing of
+        the run until it is published.
+        """
+        with self.open_run(benchmark, model, run, day, checkpoint) as staged:
+            staged.write_cells(df)
+            for name, outcomes in (bits or {}).items():
+                staged.write_bits(name, outcomes)
+        return staged.entry
+
+    def open_run(self, benchmark, model, run, day=None, checkpoint=None):
+        """A ``StagedRun`` that writes one run's files piece by piece, like ``stage_run``."""
+        created = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        entry = {
+            "benchmark": benchmark, "model": model, "run": run, "created": created,
+            "date": run_date(run, created, day), "files": uuid.uuid4().hex[:12],
+        }
+        if checkpoint is not None:
+            entry["checkpoint"] = str(checkpoint)
+        return StagedRun(entry, self._files_dir(entry))
+
+    # Aggregates
+
+    def aggregate_table(self):
+        """Materialized headline metrics, rebuilt once from the manifest if missing."""
+        aggregates = AggregateTable(self.root)
+        if not aggregates.exists() and self.manifest():
+            for r in self.manifest():
+                cells = self.read(r["benchmark"], models=r["model"], runs=r["run"], columns=SCHEMA.names)
+                aggregates.update(r["benchmark"], r["model"], r["run"], cells)
+        return aggregates
+
+    def rollup_table(self):
+        """Trend rollups, rebuilt once from the manifest if missing."""
+        rollups = RollupTable(self.root)
+        if not rollups.exists() and self.manifest():
+            for r in self.manifest():
+                cells = self.read(r["benchmark"], models=r["model"], runs=r["run"], columns=SCHEMA.names)
+                day = run_date(r["run"], r.get("created"), r.get("date"))
+                rollups.update(r["benchmark"], r["model"], r["run"], cells, day, r.get("checkpoint"))
+        return rollups
+
+    # Reading
+
+    def partitions(self, benchmark, models=None, runs=None):
+        """Resolve (benchmark, model, run) partitions; ``runs=None`` means latest per model."""
+        if runs is None:
+            selected = self.latest_runs(benchmark).items()
+        else:
+            runs = {runs} if isinstance(runs, str) else set(runs)
+            selected = [
+                (r["model"], r["run"]) for r in self.manifest()
+                if r["benchmark"] == benchmark and r["run"] in runs
+            ]
+        if models is not None:
+            models = {models} if isinstance(models, str) else set(models)
+            selected = [(m, r) for m, r in selected if m in models]
+        return [(benchmark, m, r) for m, r in selected]
+
+    def read(self, benchmark, models=None, runs=None, columns=None, filter=None):
+        """Read cells for a benchmark, projecting ``columns`` and pushing ``filter`` down."""
+        columns = list(columns) if columns is not None else COLUMNS
+        table = self.read_table(benchmark, models, runs, columns, filter)
+        if table is None:
+            return pd.DataFrame(columns=columns)
+        return table.to_pandas()
+
+    def read_bits(self, benchmark, model, run):
+        """``{per-task table: OutcomeBits}`` stored with one run (empty for runs without any)."""
+        entries = self._entries([(benchmark, model, run)])
+        if not entries:
+            return {}
+        files_dir = self._files_dir(entries[0])
+        return {path.name[: -len(SUFFIX)]: OutcomeBits.load(path) for path in sorted(files_dir.glob("*" + SUFFIX))}
+
+    def read_table(self, benchmark, models=None, runs=None, columns=None, filter=None):
+        """Like ``read`` but returns the Arrow table (None when nothing matches)."""
+        # One manifest read for both, so the files match the runs resolved
+        pinned = self if self._runs is not None else ResultsStore(self.root, self.manifest())
+        files = []
+        for entry in pinned._entries(pinned.partitions(benchmark, models, runs)):
+            files.extend(sorted(str(p) for p in pinned._files_dir(entry).glob("*.parquet")))
+        if not files:
+            return None
+        dataset = _dataset(files, self.root)
+        columns = list(columns) if columns is not None else COLUMNS
+        if not set(TYPED) & set(columns):
+            return dataset.to_table(columns=columns, filter=filter)
+        read = columns + [c for c in TYPED if c not in columns]
+        return typed_cells(dataset.to_table(columns=read, filter=filter)).select(columns)
+
+
+class StagedRun:
+    """The files of one run being staged, written as its cells come in.
+
+    Every ``write_cells`` appends a row group to the run's Parquet file, so
+    a run with millions of per-task cells never has to be held in memory at
+    once. Use it as a context manager: the file is closed when the block
+    ends, and the run's directory is deleted if the block raises. ``entry``
+    then goes to ``ResultsStore.publish``.
+    """
+
+    def __init__(self, entry, files_dir):
+        self.entry = entry
+        self.files_dir = files_dir
+        self.rows = 0
+        files_dir.mkdir(parents=True)
+        self._writer = pq.ParquetWriter(files_dir / "part-0.parquet", SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        self._writer.close()
+        if kind is not None:
+            shutil.rmtree(self.files_dir, ignore_errors=True)
+
+    def write_cells(self, df):
+        # Frames without units (older callers) get them from their display strings
+        table = pa.Table.from_pandas(df[[c for c in SCHEMA.names if c in df]], preserve_index=False)
+        self._writer.write_table(typed_cells(table).select(SCHEMA.names).cast(SCHEMA))
+        self.rows += len(df)
+
+    def write_bits(self, name, outcomes):
+        outcomes.save(self.files_dir / (name + SUFFIX))
+
+
+def _dataset(files, root):
+    return ds.dataset(
+        files,
+        schema=pa.unify_schemas([SCHEMA, PARTITION_SCHEMA]),
+        format="parquet",
+        partitioning=PARTITIONING,
+        partition_base_dir=str(root),
+    )
+
+
+def _manifest_text(runs):
+    return json.dumps({"runs": runs}, indent=1)
+
+
+def typed_cells(table):
+    """Give cells written before units existed their ``unit`` and ``denominator``.
+
+    Those cells have a null unit and kept a formatted number in ``display``
+    with its leading number as ``value``; the string is parsed into value,
+    unit and denominator and ``display`` is cleared. Text cells (no value)
+    keep their display. Tables of typed cells are returned unchanged.
+    """
+    for name in ("unit", "denominator"):
+        if name not in table.column_names:
+            field = SCHEMA.field(name)
+            table = table.append_column(field, pa.nulls(table.num_rows, field.type))
+    legacy = table["unit"].is_null().to_numpy(zero_copy_only=False)
+    if not legacy.any():
+        return table
+    display = pc.fill_null(table["display"], "")
+    texts = pc.unique(display).to_pylist()
+    parsed = [parse_metric(text) for text in texts]
+    codes = pc.index_in(display, value_set=pa.array(texts, pa.string())).to_numpy()
+    value = pc.fill_null(table["value"], np.nan).to_numpy()
+    numeric = np.array([bool(text) and not rest for text, (*_, rest) in zip(texts, parsed)])[codes]
+    numeric &= legacy & ~np.isnan(value)
+    typed = {
+        "value": np.array([p[0] for p in parsed])[codes],
+        "unit": np.array([p[1] for p in parsed], dtype=object)[codes],
+        "denominator": np.array([p[2] for p in parsed])[codes],
+        "display": np.full(len(codes), "", dtype=object),
+    }
+    for name, values in typed.items():
+        kept = pc.fill_null(table[name], "") if name == "unit" else table[name]
+        merged = np.where(numeric, values, kept.to_numpy(zero_copy_only=False))
+        field = SCHEMA.field(name)
+        table = table.set_column(table.column_names.index(name), field, pa.array(merged, field.type, from_pandas=True))
+    return table
+
+
+@timed("frame")
+def wide(df, index, columns, values=None):
+    """Pivot long-format cells back into a display table, keeping first-seen order.
+
+    Without ``values`` the cells are typed metrics and the table is numeric,
+    each cell the number it stands for (``metric_value``). When every column
+    has a single unit, ``attrs["units"]`` maps each column to its ``(unit,
+    denominator)`` so the renderer can format it (see ``tables.show_table``);
+    when the unit changes down a column but not along a row,
+    ``attrs["row_units"]`` lists the ``(unit, denominator)`` of each row
+    instead. Tables holding
+    text cells, or whose units vary both ways, come back as formatted
+    strings.
+    """
+    if values is None:
+        return _metric_table(df, index, columns)
+    table = _pivot(df, index, columns, df[values])
+    if "unit" in df:
+        # Plain counts come back from the store as float64; show them as integers again
+        formatted = set(df.loc[(df["unit"].fillna("") != "") | df["denominator"].notna(), columns])
+        for name in table.columns:
+            col = table[name]
+            if name not in formatted and col.notna().all() and (col % 1 == 0).all():
+                table[name] = col.astype("int64")
+    return table
+
+
+def _pivot(df, index, columns, cell):
+    out = pd.DataFrame({index: df[index], columns: df[columns], "cell": cell})
+    table = out.pivot(index=index, columns=columns, values="cell")
+    table = table.reindex(index=pd.unique(df[index]), columns=pd.unique(df[columns]))
+    table.columns.name = None
+    return table
+
+
+def _metric_table(df, index, columns):
+    unit = df["unit"].fillna("").to_numpy(dtype=object)
+    denominator = df["denominator"].to_numpy(dtype=np.float64)
+    value = df["value"].to_numpy(dtype=np.float64)
+    text = df["display"].fillna("").to_numpy(dtype=object) if "display" in df else np.full(len(df), "", dtype=object)
+    labels = pd.Series([unit_label(u, d) for u, d in zip(unit, denominator)], index=df.index)
+
+    if not (text != "").any():
+        ratio = (unit == "%") & ~np.isnan(denominator)
+        shown = np.where(ratio, 100.0 * value / np.where(denominator == 0, np.nan, denominator), value)
+        table = _pivot(df, index, columns, pd.Series(shown, index=df.index))
+        by_column = labels.groupby(df[columns].to_numpy(), sort=False).nunique()
+        by_row = labels.groupby(df[index].to_numpy(), sort=False).nunique()
+        if (by_column <= 1).all():
+            first = ~df[columns].duplicated().to_numpy()
+            units = {c: (u, d) for c, u, d in zip(df[columns][first], unit[first], denominator[first])}
+            for name, (u, d) in units.items():
+                col = table[name]
+                if number_format(u, d) is None and col.notna().all() and (col % 1 == 0).all():
+                    table[name] = col.astype("int64")
+            table.attrs["units"] = units
+            return table
+        if (by_row <= 1).all():
+            first = ~df[index].duplicated().to_numpy()
+            # By position, so the units survive renaming and resetting the index
+            units = dict(zip(df[index][first], zip(unit[first], denominator[first])))
+            table.attrs["row_units"] = [units[r] for r in table.index]
+            return table
+
+    cell = pd.Series(
+        [t if t else format_metric(v, u, d) for v, u, d, t in zip(value, unit, denominator, text)],
+        index=df.index,
+        dtype=object,
+    )
+    return _pivot(df, index, columns, cell)
+
+
+@timed("frame")
+def table_view(cells, index, columns, index_name, **match):
+    """Filter long-format cells and pivot them into the table shown on a page."""
+    for key, value in match.items():
+        cells = cells[cells[key] == value]
+    return wide(cells, index, columns).rename_axis(index_name).reset_index()
@@ -0,0 +1,57 @@
+"""Drawing tables of typed metrics.
+
+``store.wide`` returns metric tables as numbers and keeps the units they
+were stored with in ``attrs``: ``"units"`` per column, or ``"row_units"``
+for each row in order (see ``evaldash.metrics``). ``show_table`` formats
+them when the table is drawn:
+
+- when every column has one printf format (``number_format``), or holds
+  integer counts, the numbers go to the browser as they are, with a
+  ``NumberColumn`` format per column;
+- otherwise every cell is formatted with ``format_shown`` through a pandas
+  Styler, so counts stay integers and ratios read ``54.46% (61/112)``
+  while the data underneath stays numeric.
+
+Other tables are drawn as given.
+"""
+import functools
+
+import pandas as pd
+import streamlit as st
+
+from evaldash import perf
+from evaldash.metrics import format_shown, number_format
+
+
+def show_table(data, **kwargs):
+    """``st.dataframe`` with the units in ``data.attrs`` applied; recorded by ``perf.show_table``."""
+    attrs = getattr(data, "attrs", {})
+    if attrs.get("units"):
+        data, kwargs = _by_column(data, attrs["units"], kwargs)
+    elif attrs.get("row_units") and len(attrs["row_units"]) == len(data):
+        # A table sliced after ``wide`` no longer lines up with its row units and is drawn as is
+        data = _by_row(data, attrs["row_units"])
+    perf.show_table(data, **kwargs)
+
+
+def _by_column(table, units, kwargs):
+    formats = {name: number_format(*unit) for name, unit in units.items()}
+    if all(formats[name] or pd.api.types.is_integer_dtype(table[name]) for name in units):
+        kwargs["column_config"] = {
+            **{name: st.column_config.NumberColumn(format=fmt) for name, fmt in formats.items() if fmt},
+            **kwargs.get("column_config", {}),
+        }
+        return table, kwargs
+    return table.style.format({name: _formatter(*unit) for name, unit in units.items()}), kwargs
+
+
+def _by_row(table, row_units):
+    numbers = table.select_dtypes("number").columns
+    styler = table.style
+    for position, unit in enumerate(row_units):
+        styler = styler.format(_formatter(*unit), subset=pd.IndexSlice[table.index[[position]], numbers])
+    return styler
+
+
+def _formatter(unit, denominator):
+    return functools.partial(format_shown, unit=unit, denominator=denominator)
@@ -0,0 +1,33 @@
+"""Tabs that only run the selected tab's body.
+
+Plain ``st.tabs`` executes and ships every tab on every rerun. With state
+tracking enabled (``on_change="rerun"``) each tab reports ``.open`` and
+pages skip building hidden tabs; switching tabs reruns the script and the
+data behind the newly opened tab comes from the loader cache. Static builds
+(``evaldash.static``) have no reruns, so they get plain tabs.
+"""
+import os
+
+import streamlit as st
+
+# Set while ``evaldash.static`` renders pages for a static build
+STATIC_ENV = "DASHBOARD_STATIC"
+
+
+def static_build():
+    return os.environ.get(STATIC_ENV) == "1"
+
+
+def lazy_tabs(labels, key):
+    if static_build():
+        return st.tabs(labels)
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        # Streamlit without tab state tracking: every tab renders as before
+        return st.tabs(labels)
+
+
+def is_open(tab):
+    # ``open`` is None when the tabs do not track state
+    return getattr(tab, "open", None) is not False
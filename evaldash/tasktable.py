@@ -0,0 +1,111 @@
+"""Wide per-task tables and server-side windows over them.
+
+Per-task tables (RustEvo and SWE task flags, pass@k samples, HS EVALS item
+scores) are stored in long format like every other table, one cell per row.
+``wide_table`` pivots one of them into an Arrow table with a row per
+``(model, task)`` in a single pass of NumPy scatters. ``TaskView`` is a
+filtered and sorted view of that table, held as an index array. Only the
+requested window is converted to pandas, so a page sends the rows on screen
+and nothing else, however many tasks there are.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from evaldash.perf import timed
+
+KEYS = ["Model", "Task"]
+
+
+@timed("frame")
+def wide_table(cells):
+    """Pivot long cells (model, row, column, value, display) to one row per (model, task).
+
+    Columns that only carry text (e.g. a change type) are strings, 0/1
+    columns are booleans and the rest are floats; a task without a cell in
+    a column gets a null.
+    """
+    n = cells.num_rows
+    if n == 0:
+        return pa.table({key: pa.array([], pa.string()) for key in KEYS})
+    model, _ = _encode(cells["model"])
+    row, _ = _encode(cells["row"])
+    key, uniques = pd.factorize(model.astype(np.int64) * (int(row.max()) + 1) + row, sort=False)
+    # Codes are handed out in first-seen order, so a key is new where it exceeds every earlier one
+    first = np.flatnonzero(np.r_[True, key[1:] > np.maximum.accumulate(key)[:-1]])
+
+    out = {"Model": cells["model"].take(first), "Task": cells["row"].take(first)}
+    column, names = _encode(cells["column"])
+    values = cells["value"].to_numpy()
+    for code, name in enumerate(names.to_pylist()):
+        at = np.flatnonzero(column == code)
+        dense = np.full(len(uniques), np.nan)
+        dense[key[at]] = values[at]
+        if np.isnan(values[at]).all():
+            positions = np.full(len(uniques), -1)
+            positions[key[at]] = at
+            out[name] = cells["display"].take(pa.array(positions, mask=positions < 0))
+        elif np.isin(values[at], (0.0, 1.0)).all():
+            out[name] = pa.array(dense == 1.0, mask=np.isnan(dense))
+        else:
+            out[name] = pa.array(dense, from_pandas=True)
+    return pa.table(out)
+
+
+def row_order(table, query="", sort=None, descending=False, rows=None):
+    """Indices of the rows matching ``query`` in ``sort`` order; None means every row as stored.
+
+    ``query`` is a case-insensitive substring of any text column. Nulls sort
+    last. ``rows`` (indices into ``table``) restricts the result to those rows.
+    """
+    indices = rows
+    if query:
+        matches = None
+        for name, kind in zip(table.column_names, table.schema.types):
+            if pa.types.is_string(kind):
+                column = table[name] if indices is None else table[name].take(indices)
+                hit = pc.match_substring(column, query, ignore_case=True)
+                matches = hit if matches is None else pc.or_kleene(matches, hit)
+        if matches is None:
+            indices = pa.array([], pa.uint64())
+        else:
+            matches = pc.fill_null(matches, False)
+            indices = pc.indices_nonzero(matches) if indices is None else indices.filter(matches)
+    if sort is not None:
+        column = table[sort] if indices is None else table[sort].take(indices)
+        order = pc.array_sort_indices(
+            column, order="descending" if descending else "ascending", null_placement="at_end"
+        )
+        indices = order if indices is None else indices.take(order)
+    return indices
+
+
+class TaskView:
+    """A filtered and sorted view of a wide task table, read one window at a time."""
+
+    def __init__(self, table, order=None):
+        self.table = table
+        self.order = order
+
+    def __len__(self):
+        return self.table.num_rows if self.order is None else len(self.order)
+
+    @property
+    def columns(self):
+        return self.table.column_names
+
+    @timed("frame")
+    def window(self, offset, limit):
+        """Rows ``offset`` to ``offset + limit`` of the view as a DataFrame."""
+        if self.order is None:
+            rows = self.table.slice(offset, limit)
+        else:
+            rows = self.table.take(self.order.slice(offset, limit))
+        return rows.to_pandas()
+
+
+def _encode(column):
+    """First-seen integer codes of ``column`` and the values they stand for."""
+    encoded = column.combine_chunks().dictionary_encode()
+    return encoded.indices.to_numpy(zero_copy_only=False), encoded.dictionary
@@ -0,0 +1,46 @@
+"""Page registry.
+
+Each sidebar entry maps to a module under ``evaldash.views`` exposing
+``render()``. Modules are imported on first selection, so a page only pays
+for the libraries it actually uses (the Overview page needs no Plotly or
+Arrow at all).
+"""
+import importlib
+
+import streamlit as st
+
+from evaldash.perf import span
+
+PAGES = {
+    "Overview": "overview",
+    "Model Comparison Graphs": "comparison",
+    "ARCHIT EVAL SCRIPT": "archit",
+    "HumanEval (Rust)": "humaneval",
+    "SWE Benchmark": "swe",
+    "RustEvo Benchmark": "rustevo",
+    "Aider-Polyglot": "aider",
+    "Haskell LLM": "haskell",
+    "HS EVALS": "hs_evals",
+    "Regressions": "regressions",
+    "Trends": "trends",
+}
+
+
+def load_page(name):
+    with span("import", name):
+        return importlib.import_module(f"{__name__}.{PAGES[name]}")
+
+
+def render(name):
+    with span("page", name):
+        load_page(name).render()
+
+
+def unavailable(*benchmarks):
+    """Warn about each of ``benchmarks`` whose results source failed; returns those benchmarks."""
+    from evaldash.loaders import source_errors
+
+    errors = source_errors(benchmarks)
+    for benchmark, error in errors.items():
+        st.warning(f"⚠️ {benchmark} results are unavailable right now ({error}). Retrying shortly.")
+    return list(errors)
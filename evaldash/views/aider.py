@@ -0,0 +1,37 @@
+"""Aider-Polyglot benchmark page."""
+import streamlit as st
+
+
+def render():
+    st.header("🌐 Aider-Polyglot Benchmark - Multi-language Code Editing")
+    
+    st.markdown("""
+    **Polyglot Benchmark** measures a model's ability to understand and edit complex source code across 6 programming languages.
+    - Total: 225 exercises across Rust (30), C++ (26), Go (39), Java (47), JavaScript (49), Python (34)
+    - Each exercise has 15-25 unit test cases
+    - Evaluates Pass@1, Pass@2, and overall complexity handling
+    """)
+    
+    st.subheader("Overall Performance Comparison")
+    
+    # Note: The docx mentions scores but doesn't provide specific numbers in tables
+    # Creating a comparison based on the information available
+    st.info("📊 **Benchmark Focus**: Designed to stress-test models on complex code editing tasks across multiple languages")
+    
+    st.markdown("""
+    ### Models Evaluated:
+    - kat-dev-hs-32b
+    - kat-dev-base-32b
+    - kat-dev-hs-72b
+    - kat-dev-base-72b
+    
+    ### Key Metrics:
+    - **Pass@1**: Percentage of tests passing on first attempt
+    - **Pass@2**: Percentage of tests passing within 2 attempts (with error feedback)
+    
+    #### How Pass@2 Works:
+    1. **Attempt 1**: Model receives instructions + empty stub file → generates implementation
+    2. If tests fail, **Attempt 2**: Model receives previous code + error message → generates fix
+    """)
+    
+    st.warning("⚠️ **Complexity Note**: Due to exercise complexity, models face challenges with these stress tests. Successful completion indicates strong capability to handle complex tasks.")
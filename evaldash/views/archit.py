@@ -0,0 +1,31 @@
+"""ARCHIT EVAL SCRIPT leaderboard page."""
+import streamlit as st
+
+from evaldash.loaders import load_cells
+from evaldash.tables import show_table
+from evaldash.store import TYPED, table_view
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("🎯 ARCHIT EVAL SCRIPT Leaderboard")
+    if unavailable('archit'):
+        return
+    
+    archit_cells = load_cells('archit', columns=['model', 'column', *TYPED], table='leaderboard')
+    
+    st.subheader("32B Models (300 Examples)")
+    df_32b = table_view(archit_cells[archit_cells['model'].isin(['kat-dev-hs-32b', 'kat-dev-base-32b'])],
+                        'model', 'column', 'Model')
+    show_table(df_32b, use_container_width=True)
+    
+    st.subheader("72B Models (100 Examples)")
+    df_72b = table_view(archit_cells[archit_cells['model'].isin(['kat-dev-hs-72b', 'kat-dev-base-72b'])],
+                        'model', 'column', 'Model')
+    show_table(df_72b, use_container_width=True)
+    
+    st.subheader("Claude Sonnet 4.5 (100 Examples)")
+    df_claude = table_view(archit_cells, 'model', 'column', 'Model', model='Claude Sonnet 4.5')
+    show_table(df_claude, use_container_width=True)
+    
+    st.info("📌 **Key Insight**: Fine-tuned models (kat-dev-hs) significantly outperform base models, with Claude Sonnet 4.5 leading in Pass@1 accuracy.")
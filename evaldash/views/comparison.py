@@ -0,0 +1,296 @@
+"""Model comparison graphs page."""
+import streamlit as st
+
+from evaldash.figcache import show_figure
+from evaldash.figures import (
+    colored_bar_figure,
+    grouped_bar_figure,
+    heatmap_figure,
+    labeled_scatter_figure,
+    line_figure,
+    radar_figure,
+)
+from evaldash.loaders import (
+    load_aggregates,
+    load_cells,
+    load_cube,
+    load_models,
+    load_pass_at_k,
+    load_rustevo_intervals,
+    pass_at_k_options,
+)
+from evaldash.tables import show_table
+from evaldash.store import wide
+from evaldash.tabs import is_open, lazy_tabs
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("📊 Model Comparison Graphs")
+    
+    st.markdown("Interactive visualizations comparing model performance across different benchmarks and metrics")
+    
+    # All sources are fetched at once; charts of a benchmark whose source failed are skipped, the rest render
+    missing = unavailable('archit', 'rustevo', 'humaneval', 'swe')
+    
+    # Numeric chart inputs are sliced straight out of the shared results cube
+    cube = load_cube()
+    
+    def rustevo_metric(metric, rq1_name, rq3_name):
+        table = cube.frame(
+            'rustevo',
+            [('summary', metric, 'RQ1 (Full Docs)'), ('summary', metric, 'RQ3 (Minimal Docs)')],
+            names=[rq1_name, rq3_name]
+        )
+        return table.reset_index()
+    
+    # Create tabs for different graph categories
+    graph_tab1, graph_tab2, graph_tab3, graph_tab4 = lazy_tabs([
+        "ARCHIT EVAL Performance", 
+        "RustEvo Benchmark", 
+        "HumanEval Comparison",
+        "Overall Metrics"
+    ], key="comparison_graphs")
+    
+    with graph_tab1:
+        if is_open(graph_tab1) and 'archit' not in missing:
+            st.subheader("ARCHIT EVAL SCRIPT - Pass@k Comparison")
+            
+            # Pass@k from per-problem samples where available (stored values otherwise)
+            k = st.select_slider("k", options=pass_at_k_options('archit'), value=1, key="archit_k")
+            archit_data = load_pass_at_k('archit', sorted({1, 3, 8, k})).reset_index()
+            
+            # Pass@k comparison bar chart
+            show_figure(
+                grouped_bar_figure,
+                archit_data,
+                'Model',
+                [(metric, metric, None) for metric in ['Pass@1', 'Pass@3', 'Pass@8']],
+                text_decimals=2,
+                title='ARCHIT EVAL SCRIPT - Pass@k Performance Comparison',
+                xaxis_title='Model',
+                yaxis_title='Pass Rate (%)',
+                height=500,
+                hovermode='x unified'
+            )
+            
+            # Pass@k comparison for the selected k
+            show_figure(
+                colored_bar_figure,
+                archit_data[['Model', f'Pass@{k}']],
+                'Model',
+                f'Pass@{k}',
+                title=f'ARCHIT EVAL SCRIPT - Pass@{k} Comparison',
+                color_scale='Viridis',
+                showlegend=False
+            )
+            
+            # Error rate comparison
+            error_data = cube.frame('archit', [('leaderboard', '', 'Error Rate')], names=['Error Rate']).reset_index()
+            show_figure(
+                colored_bar_figure,
+                error_data,
+                'Model',
+                'Error Rate',
+                title='Error Rate Comparison',
+                color_scale='Reds'
+            )
+    
+    with graph_tab2:
+        if is_open(graph_tab2) and 'rustevo' not in missing:
+            st.subheader("RustEvo Benchmark - Model Performance")
+            
+            # 95% bootstrap intervals per model, and for each fine-tuned model against its base
+            rustevo_ci = load_rustevo_intervals(
+                ['Pass@1', 'API Usage Accuracy'],
+                pairs=[('kat-dev-hs-32b', 'kat-dev-base-32b'), ('kat-dev-hs-72b', 'kat-dev-base-72b')]
+            )
+            
+            def rustevo_errors(data, metric, rq1_name, rq3_name):
+                bounds = rustevo_ci.xs((metric, ''), level=('Metric', 'Baseline'))
+                errors = {}
+                for setting, name in [('RQ1 (Full Docs)', rq1_name), ('RQ3 (Minimal Docs)', rq3_name)]:
+                    setting_bounds = bounds.xs(setting, level='Setting')
+                    data[f'{name} low'] = data['Model'].map(setting_bounds['low'])
+                    data[f'{name} high'] = data['Model'].map(setting_bounds['high'])
+                    errors[name] = (f'{name} low', f'{name} high')
+                return errors
+            
+            # RustEvo Pass@1 comparison
+            rustevo_data = rustevo_metric('Pass@1', 'RQ1 (Full Docs)', 'RQ3 (Minimal Docs)')
+            pass_errors = rustevo_errors(rustevo_data, 'Pass@1', 'RQ1 (Full Docs)', 'RQ3 (Minimal Docs)')
+            show_figure(
+                grouped_bar_figure,
+                rustevo_data,
+                'Model',
+                [
+                    ('RQ1 (Full Docs)', 'RQ1 (Full Documentation)', 'lightblue'),
+                    ('RQ3 (Minimal Docs)', 'RQ3 (Minimal Documentation)', 'lightcoral')
+                ],
+                text_decimals=2,
+                errors=pass_errors,
+                title='RustEvo - Pass@1 Comparison (RQ1 vs RQ3)',
+                xaxis_title='Model',
+                yaxis_title='Pass@1 (%)',
+                height=500
+            )
+            
+            # API Usage Accuracy
+            api_accuracy_data = rustevo_metric('API Usage Accuracy', 'RQ1 API Accuracy', 'RQ3 API Accuracy')
+            api_errors = rustevo_errors(api_accuracy_data, 'API Usage Accuracy', 'RQ1 API Accuracy', 'RQ3 API Accuracy')
+            show_figure(
+                grouped_bar_figure,
+                api_accuracy_data,
+                'Model',
+                [
+                    ('RQ1 API Accuracy', 'RQ1 API Accuracy', 'mediumseagreen'),
+                    ('RQ3 API Accuracy', 'RQ3 API Accuracy', 'orange')
+                ],
+                text_decimals=2,
+                errors=api_errors,
+                title='RustEvo - API Usage Accuracy Comparison',
+                xaxis_title='Model',
+                yaxis_title='API Usage Accuracy (%)',
+                height=500
+            )
+            
+            # Fine-tuned minus base in percentage points, with the interval of the difference
+            st.markdown("**Fine-tuned vs Base - Difference with 95% Bootstrap CI (percentage points)**")
+            diffs = rustevo_ci[rustevo_ci.index.get_level_values('Baseline') != ''].reset_index()
+            diffs['Comparison'] = diffs['Model'] + ' vs ' + diffs['Baseline']
+            diffs['Column'] = diffs['Setting'].str.split(' ').str[0] + ' ' + diffs['Metric']
+            diffs['Cell'] = [
+                f'{estimate:+.2f} [{low:+.2f}, {high:+.2f}]'
+                for estimate, low, high in zip(diffs['estimate'], diffs['low'], diffs['high'])
+            ]
+            diff_table = wide(diffs, 'Comparison', 'Column', values='Cell').reset_index()
+            show_table(diff_table, use_container_width=True)
+            
+            # Success Count Comparison
+            success_data = rustevo_metric('Success Count', 'RQ1 Success', 'RQ3 Success')
+            show_figure(
+                line_figure,
+                success_data,
+                'Model',
+                [('RQ1 Success', 'RQ1 Success Count'), ('RQ3 Success', 'RQ3 Success Count')],
+                title='RustEvo - Success Count Comparison (out of 588 tasks)',
+                xaxis_title='Model',
+                yaxis_title='Number of Successful Tasks',
+                height=500
+            )
+    
+    with graph_tab3:
+        if is_open(graph_tab3) and 'humaneval' not in missing:
+            st.subheader("HumanEval (Rust) - Model Comparison")
+            
+            humaneval_models = ['Kawai-pilot 32B FT', 'Kawai-pilot 32B Base', 'Qwen FT', 'Qwen Base']
+            k_options = pass_at_k_options('humaneval', humaneval_models)
+            k = st.select_slider("k", options=k_options, value=min(10, k_options[-1]), key="humaneval_k")
+            pass_k = f'Pass@{k}'
+            humaneval_table = load_pass_at_k('humaneval', sorted({1, k}), humaneval_models)
+            too_few = list(humaneval_table.index[humaneval_table[pass_k].isna()])
+            if too_few:
+                st.info(
+                    f"📌 {pass_k} is not available for {', '.join(too_few)}: their latest runs neither store it "
+                    f"nor have {k} samples per problem. Only their Pass@1 is shown."
+                )
+            
+            def humaneval_pair(ft_model, base_model):
+                pair = humaneval_table.loc[[ft_model, base_model], ['Pass@1', pass_k]]
+                return pair.set_axis(['Fine-tuned', 'Base']).rename_axis('Model Type').reset_index()
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Kawai-pilot comparison
+                kawai_data = humaneval_pair('Kawai-pilot 32B FT', 'Kawai-pilot 32B Base')
+                show_figure(
+                    grouped_bar_figure,
+                    kawai_data,
+                    'Model Type',
+                    [('Pass@1', 'Pass@1', 'royalblue'), (pass_k, pass_k, 'lightsteelblue')],
+                    title='Kawai-pilot 32B - HumanEval Performance',
+                    yaxis_title='Pass Rate (%)',
+                    height=400
+                )
+            
+            with col2:
+                # Qwen comparison
+                qwen_data = humaneval_pair('Qwen FT', 'Qwen Base')
+                show_figure(
+                    grouped_bar_figure,
+                    qwen_data,
+                    'Model Type',
+                    [('Pass@1', 'Pass@1', 'forestgreen'), (pass_k, pass_k, 'lightgreen')],
+                    title='Qwen - HumanEval Performance',
+                    yaxis_title='Pass Rate (%)',
+                    height=400
+                )
+            
+            # Combined comparison
+            combined_humaneval = humaneval_table[['Pass@1', pass_k]].rename(index={
+                'Kawai-pilot 32B FT': 'Kawai-pilot FT',
+                'Kawai-pilot 32B Base': 'Kawai-pilot Base'
+            }).rename_axis('Model').reset_index().dropna(subset=[pass_k])
+            show_figure(
+                labeled_scatter_figure,
+                combined_humaneval,
+                'Pass@1',
+                pass_k,
+                'Model',
+                title=f'HumanEval - Pass@1 vs {pass_k} Comparison'
+            )
+        
+        # SWE Benchmark comparison
+        if is_open(graph_tab3) and 'swe' not in missing:
+            st.subheader("SWE Benchmark - Base vs Fine-tuned")
+            
+            swe_cells = load_cells(
+                'swe',
+                columns=['model', 'row', 'value', 'unit', 'denominator'],
+                table='summary',
+                row=['Completed Instances', 'Resolved Instances', 'Error Instances']
+            )
+            swe_data = wide(swe_cells, 'row', 'model', values='value').rename_axis('Metric').reset_index()
+            show_figure(
+                grouped_bar_figure,
+                swe_data,
+                'Metric',
+                [
+                    ('Kwai Base', 'Kwai Base', 'indianred'),
+                    ('Kwai Fine-tuned (LoRA)', 'Kwai Fine-tuned (LoRA)', 'seagreen')
+                ],
+                title='SWE Benchmark - Base vs Fine-tuned Comparison',
+                yaxis_title='Count (out of 500 instances)',
+                height=500
+            )
+    
+    with graph_tab4:
+        if is_open(graph_tab4):
+            st.subheader("Overall Model Performance Comparison")
+            
+            # Cross-benchmark view: ARCHIT models with their materialized headline metrics
+            heatmap_data = load_aggregates(
+                ['ARCHIT Pass@1', 'ARCHIT Pass@8', 'RustEvo RQ1', 'API Accuracy'],
+                models=load_models('archit')
+            ).reset_index()
+            
+            # Create radar chart for overall comparison
+            show_figure(
+                radar_figure,
+                heatmap_data,
+                'Model',
+                ['kat-dev-hs-32b', 'kat-dev-base-32b', 'kat-dev-hs-72b', 'kat-dev-base-72b'],
+                [
+                    ('ARCHIT Pass@1', 'ARCHIT Pass@1'),
+                    ('RustEvo RQ1', 'RustEvo RQ1'),
+                    ('API Accuracy', 'API Accuracy'),
+                    ('Success Rate', 'RustEvo RQ1')
+                ],
+                title='Multi-Dimensional Model Performance Comparison'
+            )
+            
+            # Heatmap for model performance across benchmarks
+            show_figure(heatmap_figure, heatmap_data, 'Model', title='Performance Heatmap Across Benchmarks')
+            
+            st.info("💡 **Insights**: The graphs show that fine-tuned models (kat-dev-hs) generally outperform base models, with kat-dev-hs-32b showing particularly strong performance in RustEvo RQ1 and API accuracy metrics.")
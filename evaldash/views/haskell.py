@@ -0,0 +1,48 @@
+"""Haskell LLM benchmark page."""
+import streamlit as st
+
+from evaldash.loaders import load_cells
+from evaldash.tables import show_table
+from evaldash.store import TYPED, table_view
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("🎓 Haskell LLM Benchmark - Functional Programming")
+    if unavailable('haskell'):
+        return
+    
+    st.markdown("""
+    **Haskell LLM Benchmark** evaluates functional programming mastery with 112 demanding challenges.
+    This is one of the most complex benchmarking suites for Haskell language.
+    """)
+    
+    st.subheader("GLM-Latest Performance")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Pass@1 (First-Try)", "54.5%", help="61/112 problems solved immediately")
+        st.metric("Pass@2 (Overall)", "63.4%", help="71/112 problems solved after one retry")
+    
+    with col2:
+        st.metric("Well-Formed Responses", "100%", help="Zero malformed outputs")
+        st.metric("Syntax Errors", "0%", help="All code is clean and compilable")
+    
+    with col3:
+        st.metric("Average Time per Test", "1.6 min", help="Fast and efficient")
+        st.metric("Total Cost", "$0.00", help="Exceptional value")
+    
+    st.subheader("Detailed Metrics")
+    haskell_cells = load_cells('haskell', models='GLM-Latest', columns=['row', 'column', *TYPED])
+    df_haskell = table_view(haskell_cells, 'row', 'column', 'Metric')
+    show_table(df_haskell, use_container_width=True)
+    
+    st.success("🏆 **GLM-Latest Achievements**:")
+    st.markdown("""
+    - ✅ High accuracy with solid 54.5% first-try success rate
+    - ✅ Robust reliability with 8.9% improvement on retry
+    - ✅ 100% zero syntax and indentation errors
+    - ✅ Exceptional stability, speed, and cost-effectiveness
+    - ✅ Demonstrates deep understanding of Haskell paradigms
+    """)
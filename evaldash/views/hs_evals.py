@@ -0,0 +1,235 @@
+"""HS EVALS page."""
+import streamlit as st
+
+from evaldash.figcache import show_figure
+from evaldash.figures import grouped_bar_figure
+from evaldash.loaders import load_aggregates, load_cells, load_hs_evals_intervals, load_models
+from evaldash.tables import show_table
+from evaldash.store import TYPED, table_view
+from evaldash.tabs import is_open, lazy_tabs
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("🔍 HS EVALS - Hyperswitch-Specific Evaluation")
+    if unavailable('hs_evals'):
+        return
+    
+    st.markdown("""
+    **HS EVALS** is a specialized benchmark designed to evaluate models on Hyperswitch-specific tasks.
+    It measures performance across three key areas: code understanding, code generation, and code debugging.
+    """)
+    
+    hs_cells = load_cells('hs_evals', columns=['model', 'table', 'row', 'column', *TYPED])
+    
+    def hs_table(model, task):
+        return table_view(hs_cells, 'row', 'column', 'Metric', model=model, table=task)
+    
+    # Model selection tabs
+    model_tab1, model_tab2 = lazy_tabs(["32B Models", "72B Models"], key="hs_evals_models")
+    
+    with model_tab1:
+        if is_open(model_tab1):
+            st.subheader("kat-dev 32B Models Performance")
+            
+            # Task-specific tabs for 32B
+            task_tab1, task_tab2, task_tab3 = lazy_tabs(["Code Understanding", "Code Generation", "Code Debugging"], key="hs_evals_tasks_32b")
+            
+            with task_tab1:
+                if is_open(task_tab1):
+                    st.subheader("Code Understanding Task")
+                    st.markdown("**Evaluation Metrics**: Semantic wellness, Technical accuracy, Conceptual understanding")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("#### kat-dev-base-32b")
+                        df_base_understanding = hs_table('kat-dev-base-32b', 'understanding')
+                        show_table(df_base_understanding, use_container_width=True)
+                    
+                    with col2:
+                        st.markdown("#### kat-dev-hs-32b")
+                        df_ft_understanding = hs_table('kat-dev-hs-32b', 'understanding')
+                        show_table(df_ft_understanding, use_container_width=True)
+                    
+                    st.info("""
+                    **Key Insights**:
+                    - ✅ Fine-tuned model learned specific Hyperswitch concepts (e.g., Revenue Recovery)
+                    - ⚠️ Training was incomplete - still fails at some key concepts like External Providers
+                    - 📊 Base model excels at general programming concepts but lacks Hyperswitch-specific knowledge
+                    """)
+            
+            with task_tab2:
+                if is_open(task_tab2):
+                    st.subheader("Code Generation Task")
+                    st.markdown("**Evaluation Metrics**: Semantic wellness, Contextual relevance, Implementation efficiency, CodeBLEU score")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("#### kat-dev-base-32b")
+                        df_base_generation = hs_table('kat-dev-base-32b', 'generation')
+                        show_table(df_base_generation, use_container_width=True)
+                    
+                    with col2:
+                        st.markdown("#### kat-dev-hs-32b")
+                        df_ft_generation = hs_table('kat-dev-hs-32b', 'generation')
+                        show_table(df_ft_generation, use_container_width=True)
+                    
+                    st.success("""
+                    **Fine-Tuned Model Strengths**:
+                    - ✅ Correctly writes code for complex Hyperswitch-specific tasks
+                    - ✅ Successfully uses special build tools (tonic_build, openapi-generator)
+                    - ✅ Good at pattern recognition and application
+                    """)
+                    
+                    st.warning("""
+                    **Note on Contextual Relevance**:
+                    - Base model scored higher (0.7129) because it stuck to simple prompts
+                    - Fine-tuned model scored lower (0.6900) due to being "overly enthusiastic" - providing complete solutions instead of just completing single lines
+                    - This is actually a strength in real-world scenarios, providing more complete and useful code
+                    """)
+            
+            with task_tab3:
+                if is_open(task_tab3):
+                    st.subheader("Code Debugging Task")
+                    st.markdown("**Evaluation Metrics**: Fix relevance, Functional correctness")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("#### kat-dev-base-32b")
+                        df_base_debugging = hs_table('kat-dev-base-32b', 'debugging')
+                        show_table(df_base_debugging, use_container_width=True)
+                    
+                    with col2:
+                        st.markdown("#### kat-dev-hs-32b")
+                        df_ft_debugging = hs_table('kat-dev-hs-32b', 'debugging')
+                        show_table(df_ft_debugging, use_container_width=True)
+                    
+                    st.error("""
+                    **Fine-Tuned Model Issues**:
+                    - ❌ Hallucination: Invented code that wasn't there (e.g., 6 fictional error types)
+                    - ❌ Wrong bug identification: Did opposite of what was needed
+                    - ❌ Over-complexity: Made simple problems harder than necessary
+                    """)
+                    
+                    st.success("""
+                    **Base Model Strengths**:
+                    - ✅ 50% functional correctness success rate
+                    - ✅ Better at understanding tricky bugs
+                    - ✅ Stuck to the script without inventing new code
+                    """)
+    
+    with model_tab2:
+        if is_open(model_tab2):
+            st.subheader("kat-dev 72B Models Performance")
+            
+            # Task-specific tabs for 72B
+            task_tab1, task_tab2, task_tab3 = lazy_tabs(["Code Understanding", "Code Generation", "Code Debugging"], key="hs_evals_tasks_72b")
+            
+            with task_tab1:
+                if is_open(task_tab1):
+                    st.subheader("Code Understanding Task")
+                    st.markdown("**Evaluation Metrics**: Semantic wellness, Technical accuracy, Conceptual understanding")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("#### kat-dev-base-72b")
+                        df_base_understanding_72 = hs_table('kat-dev-base-72b', 'understanding')
+                        show_table(df_base_understanding_72, use_container_width=True)
+                    
+                    with col2:
+                        st.markdown("#### kat-dev-hs-72b")
+                        df_ft_understanding_72 = hs_table('kat-dev-hs-72b', 'understanding')
+                        show_table(df_ft_understanding_72, use_container_width=True)
+                    
+                    st.success("**Improvement**: Fine-tuned model shows stronger comprehension and accuracy (0.75 → 0.79), better grasping the meaning and logic of code.")
+            
+            with task_tab2:
+                if is_open(task_tab2):
+                    st.subheader("Code Generation Task")
+                    st.markdown("**Evaluation Metrics**: Semantic wellness, Contextual relevance, Implementation efficiency, CodeBLEU score")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("#### kat-dev-base-72b")
+                        df_base_generation_72 = hs_table('kat-dev-base-72b', 'generation')
+                        show_table(df_base_generation_72, use_container_width=True)
+                    
+                    with col2:
+                        st.markdown("#### kat-dev-hs-72b")
+                        df_ft_generation_72 = hs_table('kat-dev-hs-72b', 'generation')
+                        show_table(df_ft_generation_72, use_container_width=True)
+                    
+                    st.success("**Improvements**: Better relevance and efficiency indicate more context-aware and cleaner code generation.")
+            
+            with task_tab3:
+                if is_open(task_tab3):
+                    st.subheader("Code Debugging Task")
+                    st.markdown("**Evaluation Metrics**: Fix relevance, Functional correctness")
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.markdown("#### kat-dev-base-72b")
+                        df_base_debugging_72 = hs_table('kat-dev-base-72b', 'debugging')
+                        show_table(df_base_debugging_72, use_container_width=True)
+                    
+                    with col2:
+                        st.markdown("#### kat-dev-hs-72b")
+                        df_ft_debugging_72 = hs_table('kat-dev-hs-72b', 'debugging')
+                        show_table(df_ft_debugging_72, use_container_width=True)
+                    
+                    st.success("**Improvements**: Both fix relevance and correctness improved, showing better capability at identifying and fixing real bugs.")
+    
+    # Overall comparison visualization
+    st.markdown("---")
+    st.subheader("📊 Overall Performance Comparison")
+    
+    metrics = ['Code Understanding', 'Code Generation (Efficiency)', 'Code Debugging (Correctness)']
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
+    
+    # Comparison chart for all models, from the materialized headline metrics
+    comparison_data = load_aggregates(metrics, models=load_models('hs_evals')).reset_index()
+    
+    # 95% bootstrap intervals for models with ingested per-item scores
+    headlines = [
+        ('understanding', 'Overall Average'),
+        ('generation', 'Implementation Efficiency'),
+        ('debugging', 'Functional Correctness')
+    ]
+    hs_ci = load_hs_evals_intervals(headlines)
+    errors = {}
+    for metric, (task, headline) in zip(metrics, headlines):
+        bounds = hs_ci[
+            (hs_ci.index.get_level_values('Metric') == headline)
+            & (hs_ci.index.get_level_values('Setting') == task)
+        ].droplevel(['Metric', 'Setting', 'Baseline'])
+        comparison_data[f'{metric} low'] = comparison_data['Model'].map(bounds['low'])
+        comparison_data[f'{metric} high'] = comparison_data['Model'].map(bounds['high'])
+        errors[metric] = (f'{metric} low', f'{metric} high')
+    
+    show_figure(
+        grouped_bar_figure,
+        comparison_data,
+        'Model',
+        [(metric, metric, color) for metric, color in zip(metrics, colors)],
+        text_decimals=4,
+        errors=errors,
+        title='HS EVALS - Overall Performance Across Tasks',
+        xaxis_title='Model',
+        yaxis_title='Score',
+        height=500,
+        hovermode='x unified'
+    )
+    
+    st.info("""
+    **Summary**:
+    - 32B models generally outperform 72B models on Hyperswitch-specific tasks
+    - Fine-tuned models show improvements in code understanding and generation
+    - Base models perform better on debugging tasks, likely due to better generalization
+    - Trade-off between specialized knowledge (fine-tuned) vs. general reasoning (base)
+    """)
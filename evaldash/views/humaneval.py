@@ -0,0 +1,40 @@
+"""HumanEval (Rust) results page."""
+import streamlit as st
+
+from evaldash.loaders import load_cells
+from evaldash.tables import show_table
+from evaldash.store import TYPED, wide
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("🦀 HumanEval (Rust) - Functional Correctness")
+    if unavailable('humaneval'):
+        return
+    
+    st.markdown("""
+    **HumanEval** is a foundational benchmark measuring functional correctness of code generated by LLMs.
+    It contains 164 manually written programming problems testing reasoning, algorithmic understanding, and code generation.
+    """)
+    
+    humaneval_cells = load_cells('humaneval', columns=['model', 'column', *TYPED], table='leaderboard')
+    
+    def humaneval_table(ft_model, base_model):
+        pair = wide(humaneval_cells, 'model', 'column').loc[[ft_model, base_model]]
+        return pair.set_axis(['Fine-tuned Model', 'Base Model']).rename_axis('Model Type').reset_index()
+    
+    st.subheader("Kawai-pilot 32B")
+    df_kawai_32b = humaneval_table('Kawai-pilot 32B FT', 'Kawai-pilot 32B Base')
+    show_table(df_kawai_32b, use_container_width=True)
+    
+    st.subheader("Kawai-pilot 72B")
+    df_kawai_72b = humaneval_table('Kawai-pilot 72B FT', 'Kawai-pilot 72B Base')
+    show_table(df_kawai_72b, use_container_width=True)
+    
+    st.subheader("Qwen")
+    df_qwen = humaneval_table('Qwen FT', 'Qwen Base')
+    show_table(df_qwen, use_container_width=True)
+    
+    st.warning("⚠️ **Note**: Kawai-pilot 32B fine-tuned model performed lower than base. Most failures were due to syntax, formatting/structure, or logic errors.")
+    st.success("✅ **Kawai-pilot 72B**: Fine-tuned model shows significant improvement over base model with 46.28% Pass@1.")
+    st.success("✅ **Qwen Improvement**: Fine-tuned Qwen showed significant improvement over base model.")
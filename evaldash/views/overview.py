@@ -0,0 +1,57 @@
+"""Benchmark overview page."""
+import streamlit as st
+import pandas as pd
+
+from evaldash.tables import show_table
+
+
+def render():
+    st.header("📊 Benchmark Overview")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Total Benchmarks", "7")
+        st.metric("Models Evaluated", "10+")
+    
+    with col2:
+        st.metric("Total Test Cases", "2000+")
+        st.metric("Languages Tested", "6")
+    
+    with col3:
+        st.metric("Datasets", "5")
+        st.metric("Evaluation Modes", "Multiple")
+    
+    st.markdown("---")
+    st.subheader("Available Benchmarks")
+    
+    benchmarks_info = pd.DataFrame({
+        'Benchmark': [
+            'ARCHIT EVAL SCRIPT',
+            'HumanEval (Rust)',
+            'SWE Benchmark',
+            'RustEvo Benchmark',
+            'Aider-Polyglot',
+            'Haskell LLM',
+            'HS EVALS'
+        ],
+        'Focus': [
+            'General code generation',
+            'Functional correctness (Rust)',
+            'Real-world bug fixing',
+            'API evolution adaptation',
+            'Multi-language code editing',
+            'Functional programming (Haskell)',
+            'Hyperswitch-specific evaluation'
+        ],
+        'Models Tested': [
+            '5',
+            '4',
+            '2',
+            '4',
+            '4',
+            '1',
+            '4'
+        ]
+    })
+    show_table(benchmarks_info, use_container_width=True)
@@ -0,0 +1,83 @@
+"""Regressions page."""
+import streamlit as st
+
+from evaldash.loaders import load_models, load_run_bits, load_runs
+from evaldash.tables import show_table
+from evaldash.regress import ALPHA, PASS_OUTCOME, SPLITS, adjacent_diffs, changed_tasks, diff_runs, run_overlap
+
+BENCHMARK_NAMES = {
+    'rustevo': 'RustEvo',
+    'swe': 'SWE Benchmark',
+    'archit': 'ARCHIT EVAL',
+    'humaneval': 'HumanEval (Rust)',
+}
+
+
+def run_picker(label, benchmark, models, key, default_model=0, default_run=-1):
+    st.markdown(f"**{label}**")
+    model = st.selectbox("Model", models, index=default_model, key=f"{key}_model")
+    runs = load_runs(benchmark, model)
+    run = st.selectbox("Run", runs, index=default_run % len(runs), key=f"{key}_run")
+    return model, run
+
+
+def render():
+    st.header("📉 Regressions - Run-over-Run Diffs")
+
+    st.markdown("""
+    Compares the per-task outcomes of two runs on the same benchmark: tasks that newly pass, newly fail,
+    and outcome categories that flipped. Significance uses McNemar's test on the tasks that changed.
+    Pick two different models to see which tasks each solves that the other does not.
+    """)
+
+    benchmarks = {BENCHMARK_NAMES[b]: b for b in SPLITS if load_models(b)}
+    benchmark = benchmarks[st.selectbox("Benchmark", list(benchmarks), key="regressions_benchmark")]
+    models = load_models(benchmark)
+
+    # Default to the latest run against the one before it
+    col1, col2 = st.columns(2)
+    with col1:
+        base_model, base_run = run_picker("Baseline", benchmark, models, "regressions_base", default_run=-2)
+    with col2:
+        cand_model, cand_run = run_picker("Candidate", benchmark, models, "regressions_cand")
+
+    base = load_run_bits(benchmark, base_model, base_run)
+    cand = load_run_bits(benchmark, cand_model, cand_run)
+    diff = diff_runs(base, cand)
+    if diff.empty:
+        st.info("📌 These runs have no per-task results in common. Ingest per-task logs (see the README) to compare runs.")
+        return
+
+    st.subheader(f"{base_model} @ {base_run} → {cand_model} @ {cand_run}")
+    if (diff['Setting'] == '').all():
+        diff = diff.drop(columns='Setting')
+    show_table(diff.style.format({'McNemar p': '{:.4f}'}), use_container_width=True, hide_index=True)
+    st.caption(f"Gained = tasks where the outcome went from false to true; Lost = true to false. Significant at p < {ALPHA}.")
+
+    outcome = PASS_OUTCOME[benchmark]
+    st.markdown(f"**Overlap of {outcome} tasks**")
+    overlap = run_overlap(base, cand, outcome).rename(columns={'Only A': 'Only baseline', 'Only B': 'Only candidate'})
+    if (overlap['Setting'] == '').all():
+        overlap = overlap.drop(columns='Setting')
+    show_table(overlap, use_container_width=True, hide_index=True)
+
+    for setting in [s for s in base.splits if s in cand.splits]:
+        newly_passing, newly_failing = changed_tasks(base, cand, setting, outcome)
+        suffix = f" ({setting})" if setting else ""
+        with st.expander(f"Newly failing{suffix}: {len(newly_failing)} tasks"):
+            show_table({'Task': newly_failing}, use_container_width=True, hide_index=True)
+        with st.expander(f"Newly passing{suffix}: {len(newly_passing)} tasks"):
+            show_table({'Task': newly_passing}, use_container_width=True, hide_index=True)
+
+    st.subheader(f"Adjacent Runs - {cand_model}")
+    runs = load_runs(benchmark, cand_model)
+    if len(runs) < 2:
+        st.caption("Only one run so far.")
+        return
+    if len(runs) > 2:
+        last = st.slider("Last N runs", min_value=2, max_value=len(runs), value=min(len(runs), 20), key="regressions_last")
+        runs = runs[-last:]
+    history = adjacent_diffs(runs, [load_run_bits(benchmark, cand_model, run) for run in runs], outcome)
+    if (history['Setting'] == '').all():
+        history = history.drop(columns='Setting')
+    show_table(history.style.format({'McNemar p': '{:.4f}'}), use_container_width=True, hide_index=True)
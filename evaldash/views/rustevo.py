@@ -0,0 +1,59 @@
+"""RustEvo Benchmark page."""
+import streamlit as st
+
+from evaldash.explorer import task_explorer
+from evaldash.loaders import load_cells, load_models, load_table_names, load_task_index
+from evaldash.pager import paged_table
+from evaldash.tables import show_table
+from evaldash.store import TYPED, is_task_table, table_view
+from evaldash.tabs import is_open, lazy_tabs
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("🦀 RustEvo Benchmark - API Evolution Adaptation")
+    if unavailable('rustevo'):
+        return
+    
+    st.markdown("""
+    **RustEvo** evaluates LLMs on Rust code generation under evolving API conditions with 588 curated evolution tasks.
+    - **RQ1**: Full Documentation Evaluation (complete API context)
+    - **RQ3**: Minimal Documentation Evaluation (sparse API context)
+    """)
+    
+    rustevo_cells = load_cells(
+        'rustevo',
+        columns=['model', 'table', 'row', 'column', *TYPED],
+        table=[t for t in load_table_names('rustevo') if not is_task_table(t)]
+    )
+    rustevo_models = load_models('rustevo')
+    
+    for tab, model in zip(lazy_tabs(rustevo_models, key="rustevo_models"), rustevo_models):
+        with tab:
+            if is_open(tab):
+                model_cells = rustevo_cells[rustevo_cells['model'] == model]
+                
+                st.subheader(f"{model} Performance")
+                df_summary = table_view(model_cells, 'row', 'column', 'Metric', table='summary')
+                show_table(df_summary, use_container_width=True)
+                
+                for rq in ['RQ1', 'RQ3']:
+                    change_table = f'change_type_{rq.lower()}'
+                    if not (model_cells['table'] == change_table).any():
+                        continue
+                    st.subheader(f"Performance by API Change Type ({rq})")
+                    df_change = table_view(model_cells, 'row', 'column', 'Change Type', table=change_table)
+                    show_table(df_change, use_container_width=True)
+                
+                for rq in ['RQ1', 'RQ3']:
+                    task_table = f'tasks_{rq.lower()}'
+                    if task_table not in load_table_names('rustevo', models=[model]):
+                        continue
+                    st.subheader(f"Per-task Results ({rq})")
+                    paged_table('rustevo', task_table, key=f"rustevo_{model}_{task_table}", models=[model])
+    
+    if load_task_index('rustevo') is not None:
+        st.subheader("🔎 Task Explorer")
+        task_explorer('rustevo', key="rustevo_explorer")
+    
+    st.success("🏆 **Best Performer**: kat-dev-hs-32b achieved highest Pass@1 (37.59%) in RQ1 and excellent API coverage (95.56%)")
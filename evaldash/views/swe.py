@@ -0,0 +1,28 @@
+"""SWE Benchmark page."""
+import streamlit as st
+
+from evaldash.explorer import task_explorer
+from evaldash.loaders import load_cells, load_task_index
+from evaldash.tables import show_table
+from evaldash.store import TYPED, table_view
+from evaldash.views import unavailable
+
+
+def render():
+    st.header("🔧 SWE Benchmark - Real-world Bug Fixing")
+    if unavailable('swe'):
+        return
+    
+    st.markdown("""
+    The SWE Benchmark evaluates models on real-world software engineering tasks, specifically bug fixing and issue resolution.
+    """)
+    
+    swe_cells = load_cells('swe', columns=['model', 'row', *TYPED], table='summary')
+    df_swe = table_view(swe_cells, 'row', 'model', 'Metric')
+    show_table(df_swe, use_container_width=True)
+    
+    if load_task_index('swe') is not None:
+        st.subheader("🔎 Per-instance Results")
+        task_explorer('swe', key="swe_explorer")
+    
+    st.info("📌 **Key Insight**: Fine-tuned (LoRA) model performs slightly better than base model with more completed runs and fixed issues. Results are dominated by system-level errors rather than coding ability limitations.")
@@ -0,0 +1,55 @@
+"""Trends page."""
+import streamlit as st
+
+from evaldash.aggregates import METRICS
+from evaldash.figcache import show_figure
+from evaldash.figures import line_figure
+from evaldash.loaders import load_models, load_trend
+from evaldash.tables import show_table
+
+GRAINS = {'Day': 'day', 'Week': 'week', 'Checkpoint': 'checkpoint'}
+AXIS_TITLES = {'day': 'Date', 'week': 'Week of', 'checkpoint': 'Checkpoint'}
+
+
+def render():
+    st.header("📈 Trends - Metrics over Time")
+
+    st.markdown("""
+    Headline metrics per model across evaluation dates and training checkpoints. Every run folds into its
+    day, week and checkpoint when it is ingested (`--date`, `--checkpoint`); a bucket with several runs shows
+    their task-weighted mean.
+    """)
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        metrics = st.multiselect(
+            "Metrics", list(METRICS), default=['ARCHIT Pass@1', 'RustEvo RQ1', 'RustEvo RQ3'], key="trends_metrics"
+        )
+    with col2:
+        grain = GRAINS[st.radio("Roll up by", list(GRAINS), horizontal=True, key="trends_grain")]
+
+    for metric in metrics:
+        benchmark = METRICS[metric][0]
+        trend = load_trend(metric, grain, models=load_models(benchmark))
+        st.subheader(metric)
+        if trend.empty:
+            if grain == 'checkpoint':
+                st.info("📌 No runs with a checkpoint yet. Ingest runs with `--checkpoint` to chart them here.")
+            else:
+                st.info("📌 No runs carry this metric yet.")
+            continue
+        models = st.multiselect(
+            "Models", list(trend.columns), default=list(trend.columns), key=f"trends_{metric}_models"
+        )
+        show_figure(
+            line_figure,
+            trend.reset_index(),
+            'Bucket',
+            [(model, model) for model in models],
+            title=f'{metric} by {grain}',
+            xaxis_title=AXIS_TITLES[grain],
+            yaxis_title=metric,
+            height=450
+        )
+        with st.expander("Values"):
+            show_table(trend[models], use_container_width=True)
@@ -0,0 +1,182 @@
+"""Background ingestion of run logs dropped into an inbox directory.
+
+New results no longer need a code change or a redeploy. Copy a run's JSONL
+logs into ``<inbox>/<benchmark>/<model>/<run>/``, then create an empty
+``READY`` file there last. ``READY`` may instead hold JSON with ``date`` and
+``checkpoint`` for the trend charts. Model and run directory names may be
+URL-quoted (``Kwai%20Fine-tuned%20(LoRA)``).
+
+The worker polls the inbox and ingests every ready run off the request path.
+It publishes the batch in two steps:
+
+- It writes the run files, then a snapshot (``evaldash.snapshot``) built for
+  the manifest that will list them.
+- It then replaces the manifest atomically.
+
+A session therefore sees either the old results or the new ones, and the
+new ones already come with a matching snapshot to memory-map, so no
+session waits on Parquet or on the ingest. Sessions that are still rendering
+keep their mapping of the old snapshot.
+
+Ingested run directories move to ``<inbox>/_done/``. A run that fails to
+parse moves to ``<inbox>/_failed/`` with an ``error.txt``, and the rest of
+the batch is still published. Run one worker per store, either in the app
+process (``DASHBOARD_INGEST_WORKER=1``, started by ``ensure_worker``) or
+next to it::
+
+    python -m evaldash.worker [--interval 10] [--once]
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import threading
+import traceback
+from pathlib import Path
+from urllib.parse import unquote
+
+import streamlit as st
+
+READY = "READY"
+DONE = "_done"
+FAILED = "_failed"
+INTERVAL = float(os.environ.get("DASHBOARD_INGEST_INTERVAL", 10))
+LOG_SUFFIXES = (".jsonl", ".jsonl.gz")
+
+log = logging.getLogger(__name__)
+
+
+def inbox_path(store):
+    """``DASHBOARD_INBOX`` if set, else ``inbox`` in the store root."""
+    return Path(os.environ.get("DASHBOARD_INBOX", store.root / "inbox"))
+
+
+def ready_runs(inbox):
+    """``(directory, benchmark, model, run)`` of every run marked ready, oldest first."""
+    found = []
+    for marker in Path(inbox).glob(f"*/*/*/{READY}"):
+        run_dir = marker.parent
+        benchmark = run_dir.parent.parent.name
+        if benchmark.startswith("_"):
+            continue
+        found.append((marker.stat().st_mtime, run_dir, benchmark, unquote(run_dir.parent.name),
+                      unquote(run_dir.name)))
+    return [entry[1:] for entry in sorted(found, key=lambda entry: entry[0])]
+
+
+def run_metadata(run_dir):
+    """The ``date`` and ``checkpoint`` JSON in a run's ``READY`` marker (``{}`` when it is empty)."""
+    text = (run_dir / READY).read_text().strip()
+    meta = json.loads(text) if text else {}
+    if not isinstance(meta, dict):
+        raise ValueError(f"{READY} must be empty or a JSON object, got {text!r}")
+    return meta
+
+
+def ingest_pending(store, inbox=None):
+    """Ingest every ready run in the inbox and publish them together; returns the published entries."""
+    from evaldash.ingest import AGGREGATORS, aggregate
+    from evaldash.snapshot import write_snapshot
+
+    inbox = Path(inbox) if inbox is not None else inbox_path(store)
+    entries, processed = [], []
+    for run_dir, benchmark, model, run in ready_runs(inbox):
+        try:
+            meta = run_metadata(run_dir)
+            if benchmark not in AGGREGATORS:
+                raise ValueError(f"unknown benchmark {benchmark!r}; expected one of {sorted(AGGREGATORS)}")
+            paths = sorted(p for p in run_dir.iterdir() if p.name.endswith(LOG_SUFFIXES))
+            if not paths:
+                raise ValueError(f"no {' or '.join(LOG_SUFFIXES)} files in {run_dir}")
+            with store.open_run(benchmark, model, run, meta.get("date"), meta.get("checkpoint")) as staged:
+                aggregate(benchmark, paths, staged)
+            entries.append(staged.entry)
+            processed.append((run_dir, DONE))
+        except Exception:
+            log.exception("failed to ingest %s", run_dir)
+            (run_dir / "error.txt").write_text(traceback.format_exc())
+            processed.append((run_dir, FAILED))
+
+    if entries:
+        # Snapshot first: once the manifest lists the runs, readers find it ready to map
+        write_snapshot(store.staged(entries))
+        store.publish(entries)
+    for run_dir, outcome in processed:
+        _move(run_dir, inbox / outcome / run_dir.relative_to(inbox))
+        # Drop the model and benchmark directories the move left empty
+        for parent in (run_dir.parent, run_dir.parent.parent):
+            if not any(parent.iterdir()):
+                parent.rmdir()
+    return entries
+
+
+class IngestWorker(threading.Thread):
+    """Daemon thread that runs ``ingest_pending`` every ``interval`` seconds."""
+
+    def __init__(self, store, inbox=None, interval=INTERVAL):
+        super().__init__(name="evaldash-ingest", daemon=True)
+        self.store = store
+        self.inbox = inbox
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                for entry in ingest_pending(self.store, self.inbox):
+                    log.info("published %s/%s/%s", entry["benchmark"], entry["model"], entry["run"])
+            except Exception:
+                log.exception("ingest pass failed")
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self._stopped.set()
+
+
+@st.cache_resource
+def ensure_worker():
+    """Start the in-process worker once per server when ``DASHBOARD_INGEST_WORKER=1``."""
+    if os.environ.get("DASHBOARD_INGEST_WORKER") != "1":
+        return None
+    from evaldash.loaders import get_store
+
+    worker = IngestWorker(get_store())
+    worker.start()
+    return worker
+
+
+def _move(source, target):
+    if target.exists():
+        shutil.rmtree(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, target)
+
+
+def main(argv=None):
+    from evaldash.seed import ensure_seeded
+    from evaldash.store import ResultsStore
+
+    parser = argparse.ArgumentParser(description="Watch an inbox directory and ingest new runs into the store.")
+    parser.add_argument("--root", help="results store directory")
+    parser.add_argument("--inbox", help="inbox directory (default: $DASHBOARD_INBOX or <root>/inbox)")
+    parser.add_argument("--interval", type=float, default=INTERVAL, help="seconds between scans")
+    parser.add_argument("--once", action="store_true", help="ingest what is ready and exit")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    store = ResultsStore(args.root) if args.root else ResultsStore()
+    ensure_seeded(store)
+    if args.once:
+        entries = ingest_pending(store, args.inbox)
+        print(f"published {len(entries)} runs to {store.root}")
+        return
+    try:
+        # The same loop as the in-app thread, in the foreground
+        IngestWorker(store, args.inbox, args.interval).run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from evaldash.ingest import HsEvalsAggregator, SampleAggregator, aggregate
+from evaldash.store import ResultsStore
+
+
+def write_log(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+def test_empty_sample_log_raises_naming_the_file(tmp_path):
+    log = write_log(tmp_path / "empty.jsonl", [])
+    with pytest.raises(ValueError, match="empty.jsonl"):
+        with ResultsStore(tmp_path / "results").open_run("archit", "m", "r") as staged:
+            aggregate("archit", [log], staged)
+    # The staged files of the failed run are gone
+    assert not list((tmp_path / "results").rglob("*.parquet"))
+
+
+def test_sample_aggregator_without_tasks_has_no_cells():
+    assert SampleAggregator([1, 3, 8], predictions=True).cells() == []
+
+
+def test_hs_evals_item_missing_a_metric():
+    aggregator = HsEvalsAggregator()
+    aggregator.add({"task_id": "a", "task": "debugging", "scores": {"Fix Relevance": 0.5, "Functional Correctness": 1}})
+    aggregator.add({"task_id": "b", "task": "debugging", "scores": {"Fix Relevance": 0.7}})
+    aggregator.add({"task_id": "c", "task": "understanding", "scores": {
+        "Semantic Wellness": 0.6, "Technical Accuracy": 0.9, "Conceptual Understanding": 0.3,
+    }})
+    aggregator.add({"task_id": "d", "task": "understanding", "scores": {"Semantic Wellness": 0.2}})
+
+    cells = {(table, row, column): value for table, row, column, value, *_ in aggregator.cells()}
+    assert cells["debugging", "Total Items", "Score"] == 2
+    assert cells["debugging", "Fix Relevance", "Score"] == pytest.approx(0.6)
+    assert cells["debugging", "Functional Correctness", "Score"] == 1
+    assert ("debugging_scores", "b", "Functional Correctness") not in cells
+    assert cells["understanding", "Semantic Wellness", "Score"] == pytest.approx(0.4)
+    assert cells["understanding", "Overall Average", "Score"] == pytest.approx(0.6)
+    assert ("understanding_scores", "d", "Overall Average") not in cells